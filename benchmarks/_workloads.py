@@ -0,0 +1,92 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Synthetic, offline workloads shared by the benchmarks."""
+
+import functools
+
+import dimod
+import dwave_networkx as dnx
+import numpy as np
+
+import dwave.embedding
+
+__all__ = ['target_graph', 'clique_embedding', 'clique_bqm', 'spin_glass_bqm',
+           'sparse_embedding', 'target_sampleset']
+
+# moderately sized lattices so that the full suite runs in minutes
+SHAPES = {'chimera': (16,), 'pegasus': (6,), 'zephyr': (4,)}
+
+CLIQUE_SIZE = 40
+
+
+@functools.cache
+def target_graph(topology):
+    """Defect-free QPU graph of the given topology."""
+    generator = getattr(dnx, f'{topology}_graph')
+    return generator(*SHAPES[topology])
+
+
+@functools.cache
+def clique_embedding(topology, k=CLIQUE_SIZE):
+    """Clique embedding of ``k`` variables; chains have several qubits."""
+    G = target_graph(topology)
+    if topology == 'chimera':
+        return dwave.embedding.chimera.find_clique_embedding(
+            k, *SHAPES[topology], target_edges=G.edges)
+    module = getattr(dwave.embedding, topology)
+    return module.find_clique_embedding(k, target_graph=G)
+
+
+@functools.cache
+def sparse_embedding(topology):
+    """Identity embedding of the whole target graph; chains are single qubits."""
+    return {v: (v,) for v in target_graph(topology)}
+
+
+def clique_bqm(k=CLIQUE_SIZE, seed=0):
+    """Fully-connected spin glass with uniformly random biases."""
+    rng = np.random.default_rng(seed)
+    linear = rng.uniform(-1, 1, size=k)
+    row, col = np.triu_indices(k, 1)
+    quadratic = rng.uniform(-1, 1, size=row.size)
+    return dimod.BQM.from_numpy_vectors(linear, (row, col, quadratic), 0, 'SPIN')
+
+
+def spin_glass_bqm(topology, seed=0):
+    """Sparse +/-1 spin glass on the full target graph."""
+    rng = np.random.default_rng(seed)
+    G = target_graph(topology)
+    edges = np.asarray(G.edges)
+    J = rng.choice([-1., 1.], size=len(edges))
+    bqm = dimod.BQM('SPIN')
+    bqm.add_linear_from((v, 0.) for v in G)
+    bqm.add_quadratic_from(zip(edges[:, 0].tolist(), edges[:, 1].tolist(), J))
+    return bqm
+
+
+def target_sampleset(embedding, num_reads, seed=0, break_fraction=.05):
+    """Random spin samples of the target qubits of ``embedding``.
+
+    Every chain is intact apart from roughly ``break_fraction`` of the qubits,
+    which are flipped at random to create chain breaks.
+    """
+    rng = np.random.default_rng(seed)
+    samples, labels = dwave.embedding.embed_samples(
+        (rng.choice(np.array([-1, 1], dtype=np.int8), size=(num_reads, len(embedding))),
+         list(embedding)),
+        embedding)
+    flips = rng.random(samples.shape) < break_fraction
+    samples[flips] *= -1
+    return dimod.SampleSet.from_samples((samples, labels), 'SPIN', energy=0)
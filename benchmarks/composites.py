@@ -0,0 +1,69 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmarks for sampling through embedding composites on a mock QPU."""
+
+import warnings
+
+import dimod
+
+from dwave.system import EmbeddingComposite, FixedEmbeddingComposite
+from dwave.system.testing import MockDWaveSampler
+
+from ._workloads import SHAPES, clique_embedding, clique_bqm
+
+TOPOLOGIES = ['chimera', 'pegasus', 'zephyr']
+NUM_READS = [1, 100, 1000]
+
+
+class EmbeddingRoundTrip:
+    """Full embed-sample-unembed round trips of a clique problem.
+
+    The child is a :class:`~dwave.system.testing.MockDWaveSampler` substituted
+    with :class:`~dimod.RandomSampler`, so timings are dominated by the
+    composites rather than the placeholder solver.
+    """
+    params = (TOPOLOGIES, NUM_READS)
+    param_names = ['topology', 'num_reads']
+
+    def setup(self, topology, num_reads):
+        # RandomSampler ignores initial_state; asv runs each benchmark in its
+        # own process so the filter does not leak
+        warnings.simplefilter('ignore', dimod.exceptions.SamplerUnknownArgWarning)
+
+        self.child = MockDWaveSampler(topology_type=topology,
+                                      topology_shape=list(SHAPES[topology]),
+                                      substitute_sampler=dimod.RandomSampler(),
+                                      parameter_warnings=False)
+        self.embedding = embedding = clique_embedding(topology)
+        self.bqm = clique_bqm()
+
+        # a fixed embedding, so that minorminer's heuristic search is excluded
+        self.embedding_composite = EmbeddingComposite(
+            self.child, find_embedding=lambda S, T, **kwargs: embedding)
+        self.fixed_embedding_composite = FixedEmbeddingComposite(self.child, embedding)
+
+    def time_embedding_composite(self, topology, num_reads):
+        self.embedding_composite.sample(self.bqm, num_reads=num_reads).resolve()
+
+    def time_fixed_embedding_composite(self, topology, num_reads):
+        self.fixed_embedding_composite.sample(self.bqm, num_reads=num_reads).resolve()
+
+    def time_fixed_embedding_composite_initial_state(self, topology, num_reads):
+        initial_state = dict.fromkeys(self.bqm.variables, 1)
+        self.fixed_embedding_composite.sample(
+            self.bqm, num_reads=num_reads, initial_state=initial_state).resolve()
+
+    def time_construct_fixed_embedding_composite(self, topology, num_reads):
+        FixedEmbeddingComposite(self.child, self.embedding).edgelist
@@ -0,0 +1,67 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmarks for compressing serialized problems before they are uploaded."""
+
+import gzip
+import io
+from time import perf_counter
+
+import dimod
+import numpy as np
+
+from dwave.system.utilities import compress_file
+
+# single-threaded gzip, and compress_file with one and with several workers
+METHODS = ['gzip', 'blocks-1', 'blocks-4']
+
+
+class CompressSerializedBQM:
+    """A sparse +/-1 spin glass serialized as by LeapHybridSampler, about 25 MB."""
+    params = METHODS
+    param_names = ['method']
+    timeout = 120
+
+    def setup_cache(self):
+        rng = np.random.default_rng(0)
+        num_variables, num_interactions = 100_000, 1_000_000
+        row, col = rng.integers(num_variables, size=(2, num_interactions))
+        keep = row != col
+        quadratic = rng.choice([-1., 1.], size=keep.sum())
+        bqm = dimod.BQM.from_numpy_vectors(
+            np.zeros(num_variables), (row[keep], col[keep], quadratic), 0, 'SPIN')
+        with bqm.to_file(version=2) as f:
+            return f.read()
+
+    def _compress(self, data, method):
+        if method == 'gzip':
+            return gzip.compress(data, compresslevel=6, mtime=0)
+        max_workers = int(method.split('-')[1])
+        with compress_file(io.BytesIO(data), max_workers=max_workers) as f:
+            return f.read()
+
+    def time_compress(self, data, method):
+        self._compress(data, method)
+
+    def track_throughput(self, data, method):
+        t0 = perf_counter()
+        self._compress(data, method)
+        return len(data) / (perf_counter() - t0) / 2**20
+
+    track_throughput.unit = 'MiB/s'
+
+    def track_ratio(self, data, method):
+        return len(data) / len(self._compress(data, method))
+
+    track_ratio.unit = 'ratio'
@@ -0,0 +1,61 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmarks for constructing embeddings and embedding binary quadratic models."""
+
+import dwave.embedding
+
+from ._workloads import (target_graph, clique_embedding, sparse_embedding,
+                         clique_bqm, spin_glass_bqm)
+
+TOPOLOGIES = ['chimera', 'pegasus', 'zephyr']
+
+
+class EmbeddedStructure:
+    """Clique problems with chains, and sparse spin glasses embedded one-to-one."""
+    params = (TOPOLOGIES, ['clique', 'sparse'])
+    param_names = ['topology', 'problem']
+
+    def setup(self, topology, problem):
+        G = target_graph(topology)
+        self.target_edges = list(G.edges)
+        self.target_adjacency = {v: set(G[v]) for v in G}
+
+        if problem == 'clique':
+            self.embedding = clique_embedding(topology)
+            self.bqm = clique_bqm()
+        else:
+            self.embedding = sparse_embedding(topology)
+            self.bqm = spin_glass_bqm(topology)
+
+        self.embedded_structure = dwave.embedding.EmbeddedStructure(
+            self.target_edges, self.embedding)
+
+    def time_construct(self, topology, problem):
+        dwave.embedding.EmbeddedStructure(self.target_edges, self.embedding)
+
+    def time_embed_bqm(self, topology, problem):
+        self.embedded_structure.embed_bqm(self.bqm)
+
+    def time_embed_bqm_fixed_chain_strength(self, topology, problem):
+        self.embedded_structure.embed_bqm(self.bqm, chain_strength=2.)
+
+    def time_embed_bqm_function(self, topology, problem):
+        dwave.embedding.embed_bqm(self.bqm, self.embedding, self.target_adjacency)
+
+    def time_target_to_source(self, topology, problem):
+        dwave.embedding.target_to_source(self.target_adjacency, self.embedding)
+
+    def time_embed_samples(self, topology, problem):
+        dwave.embedding.embed_samples(self.bqm.linear, self.embedded_structure)
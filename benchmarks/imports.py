@@ -0,0 +1,31 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmarks for the time to import the package, each in a fresh interpreter."""
+
+
+class Import:
+    """Cold imports of the package and of commonly used samplers and composites."""
+
+    def timeraw_dwave_system(self):
+        return "import dwave.system"
+
+    def timeraw_fixed_embedding_composite(self):
+        return "from dwave.system import FixedEmbeddingComposite"
+
+    def timeraw_dwave_sampler(self):
+        return "from dwave.system import DWaveSampler"
+
+    def timeraw_temperatures(self):
+        return "from dwave.system.temperatures import maximum_pseudolikelihood"
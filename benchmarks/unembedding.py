@@ -0,0 +1,71 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmarks for unembedding samples and resolving chain breaks."""
+
+import dwave.embedding
+
+from ._workloads import clique_embedding, clique_bqm, target_sampleset
+
+TOPOLOGIES = ['chimera', 'pegasus', 'zephyr']
+NUM_READS = [1, 100, 1000]
+CHAIN_BREAK_METHODS = ['discard', 'majority_vote', 'weighted_random', 'MinimizeEnergy']
+
+
+class ChainBreakMethods:
+    """Clique problems with about 5% of the qubits flipped away from their chain."""
+    params = (TOPOLOGIES, NUM_READS, CHAIN_BREAK_METHODS)
+    param_names = ['topology', 'num_reads', 'chain_break_method']
+
+    def setup(self, topology, num_reads, chain_break_method):
+        self.bqm = clique_bqm()
+        self.embedding = clique_embedding(topology)
+        self.sampleset = target_sampleset(self.embedding, num_reads)
+
+        # chain break methods are called the same way unembed_sampleset calls them
+        self.chains = [self.embedding[v] for v in self.bqm.variables]
+
+        if chain_break_method == 'MinimizeEnergy':
+            self.method = dwave.embedding.MinimizeEnergy(self.bqm, self.embedding)
+        else:
+            self.method = getattr(dwave.embedding, chain_break_method)
+
+    def time_chain_break_method(self, topology, num_reads, chain_break_method):
+        self.method(self.sampleset, self.chains)
+
+    def time_unembed_sampleset(self, topology, num_reads, chain_break_method):
+        dwave.embedding.unembed_sampleset(self.sampleset, self.embedding, self.bqm,
+                                          chain_break_method=self.method)
+
+
+class ChainBreakDiagnostics:
+    params = (TOPOLOGIES, NUM_READS)
+    param_names = ['topology', 'num_reads']
+
+    def setup(self, topology, num_reads):
+        self.embedding = clique_embedding(topology)
+        self.sampleset = target_sampleset(self.embedding, num_reads)
+        self.accumulator = dwave.embedding.ChainBreakAccumulator(self.embedding)
+
+        labels = {v: idx for idx, v in enumerate(self.sampleset.variables)}
+        self.chains = [[labels[q] for q in chain] for chain in self.embedding.values()]
+
+    def time_broken_chains(self, topology, num_reads):
+        dwave.embedding.broken_chains(self.sampleset.record.sample, self.chains)
+
+    def time_chain_break_frequency(self, topology, num_reads):
+        dwave.embedding.chain_break_frequency(self.sampleset, self.embedding)
+
+    def time_chain_break_accumulator_update(self, topology, num_reads):
+        self.accumulator.update(self.sampleset)
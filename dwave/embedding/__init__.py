@@ -24,7 +24,7 @@ from dwave.embedding.diagnostic import diagnose_embedding, is_valid_embedding, v
 from dwave.embedding.chain_breaks import broken_chains
 from dwave.embedding.chain_breaks import discard, majority_vote, weighted_random, MinimizeEnergy
 
-from dwave.embedding.transforms import embed_bqm, embed_ising, embed_qubo, unembed_sampleset, EmbeddedStructure
+from dwave.embedding.transforms import embed_bqm, embed_ising, embed_qubo, embed_samples, unembed_sampleset, EmbeddedStructure
 
-from dwave.embedding.utils import target_to_source, chain_to_quadratic, chain_break_frequency
+from dwave.embedding.utils import target_to_source, chain_to_quadratic, chain_break_frequency, ChainBreakAccumulator
 from dwave.embedding.utils import adjacency_to_edges, edgelist_to_adjacency
\ No newline at end of file
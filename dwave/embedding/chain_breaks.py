@@ -74,21 +74,20 @@ def broken_chains(samples, chains):
 
     broken = np.zeros((num_samples, num_chains), dtype=bool, order='F')
 
-    for cidx, chain in enumerate(chains):
-        if isinstance(chain, set):
-            chain = list(chain)
-        chain = np.asarray(chain)
-
-        if chain.ndim > 1:
-            raise ValueError("chains should be 1D array-like objects")
-
-        # chains of length 1, or 0 cannot be broken
-        if len(chain) <= 1:
-            continue
-
-        all_ = (samples[:, chain] == 1).all(axis=1)
-        any_ = (samples[:, chain] == 1).any(axis=1)
-        broken[:, cidx] = np.bitwise_xor(all_, any_)
+    chains = [np.asarray(chain) for chain in chains]
+    if any(chain.ndim > 1 for chain in chains):
+        raise ValueError("chains should be 1D array-like objects")
+
+    lengths = np.fromiter(map(len, chains), dtype=np.intp, count=num_chains)
+
+    # chains of length 1, or 0 cannot be broken. The others are handled in
+    # groups of equal length, so that each group is a single array operation.
+    # A chain is broken if some but not all of its variables are 1.
+    for length in np.unique(lengths[lengths > 1]).tolist():
+        cidxs = np.flatnonzero(lengths == length)
+        ones = samples[:, np.stack([chains[cidx] for cidx in cidxs])] == 1
+        counts = ones.sum(axis=2, dtype=np.intp)
+        broken[:, cidxs] = (counts > 0) & (counts < length)
 
     return broken
 
@@ -31,6 +31,7 @@ from dwave.embedding.chain_strength import uniform_torque_compensation
 __all__ = ['embed_bqm',
            'embed_ising',
            'embed_qubo',
+           'embed_samples',
            'unembed_sampleset',
            'EmbeddedStructure',
            ]
@@ -128,6 +129,11 @@ class EmbeddedStructure(dict):
         # we can cache the max chain length since we're immutable
         return len(max(self.values(), default=[], key=len))
 
+    @cached_property
+    def _chain_index(self):
+        # we can cache the chain index since we're immutable
+        return _chain_index(self)
+
     def chain_edges(self, u):
         """Iterate over edges contained in the chain for variable ``u``.
 
@@ -522,6 +528,85 @@ def embed_qubo(source_Q, embedding, target_adjacency, chain_strength=None):
     return target_Q
 
 
+def _chain_index(embedding):
+    """Flatten an embedding into arrays indexed by target variable.
+
+    Returns a 3-tuple: the source variables, the length of each chain (aligned
+    with the source variables) and the concatenated chains as a list of target
+    variables.
+    """
+    sources = list(embedding)
+    chains = [tuple(embedding[v]) for v in sources]
+    lengths = np.fromiter(map(len, chains), dtype=np.intp, count=len(chains))
+    targets = list(itertools.chain.from_iterable(chains))
+    return sources, lengths, targets
+
+
+def embed_samples(samples_like, embedding):
+    """Spread samples of a source model over the chains of an embedding.
+
+    Each target variable in a :term:`chain` is assigned the value of the
+    source variable the chain represents. This is typically used to translate
+    a source ``initial_state`` into an initial state for the target model.
+
+    Args:
+        samples_like (samples_like):
+            One or more samples of the source model. ``samples_like`` is an
+            extension of NumPy's |array-like|_. See :func:`dimod.as_samples`.
+            Arrays without labels are indexed by the source variables, so
+            should be used only with integer-labelled source models.
+
+        embedding (dict/:class:`~dwave.embedding.EmbeddedStructure`):
+            Mapping from :term:`source graph` to :term:`target graph` as a dict
+            of form ``{s: {t, ...}, ...}``, where ``s`` is a source-model
+            variable and ``t`` is a target-model variable. The chain index of
+            an :class:`~dwave.embedding.EmbeddedStructure` is computed once
+            and reused across calls.
+
+    Returns:
+        tuple: A 2-tuple containing:
+
+            :class:`numpy.ndarray`: Target samples as a
+            :math:`nS \\times nT` array, where :math:`nS` is the number of
+            samples and :math:`nT` is the number of target variables in the
+            embedding.
+
+            list: Target variables, in the order of the columns of the
+            target samples.
+
+    Raises:
+        ValueError: If a source variable in ``embedding`` has no value in
+            ``samples_like``.
+
+    Examples:
+        This example spreads a single source sample over an embedding with
+        variable ``c`` represented by a chain of target nodes 2 and 3.
+
+        >>> from dwave.embedding import embed_samples
+        ...
+        >>> embedding = {'a': [0], 'b': [1], 'c': [2, 3]}
+        >>> samples, labels = embed_samples({'a': -1, 'b': 1, 'c': 1}, embedding)
+        >>> dict(zip(labels, samples[0].tolist()))
+        {0: -1, 1: 1, 2: 1, 3: 1}
+
+    """
+    samples, labels = dimod.as_samples(samples_like)
+
+    if isinstance(embedding, EmbeddedStructure):
+        sources, lengths, targets = embedding._chain_index
+    else:
+        sources, lengths, targets = _chain_index(embedding)
+
+    label_to_idx = {v: idx for idx, v in enumerate(labels)}
+    try:
+        columns = np.fromiter((label_to_idx[v] for v in sources),
+                              dtype=np.intp, count=len(sources))
+    except KeyError as err:
+        raise ValueError(f"no value given for source variable {err.args[0]!r}") from None
+
+    return samples[:, np.repeat(columns, lengths)], targets
+
+
 def _relabel_sampleset(target_sampleset: dimod.SampleSet,
                        embedding: EmbeddedStructure,
                        source_bqm: dimod.BQM,
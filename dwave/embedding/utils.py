@@ -12,6 +12,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import itertools
+
 import dimod
 import numpy as np
 
@@ -21,6 +23,7 @@ from dwave.embedding.chain_breaks import broken_chains
 __all__ = ['target_to_source',
            'chain_to_quadratic',
            'chain_break_frequency',
+           'ChainBreakAccumulator',
            'edgelist_to_adjacency',
            'adjacency_to_edges']
 
@@ -65,38 +68,114 @@ def target_to_source(target_adjacency, embedding):
         {'a': {'b'}, 'b': {'a'}}
 
     """
+    sources = list(embedding)
+    pairs = _chain_pairs(target_adjacency, (embedding[v] for v in sources))
+
+    # group the neighbors of each source node, in both directions
+    heads = np.concatenate((pairs[:, 0], pairs[:, 1]))
+    tails = np.concatenate((pairs[:, 1], pairs[:, 0]))[np.argsort(heads, kind='stable')]
+    offsets = np.zeros(len(sources) + 1, dtype=np.intp)
+    np.cumsum(np.bincount(heads, minlength=len(sources)), out=offsets[1:])
+
+    neighbors = [sources[j] for j in tails.tolist()]
+
     # the nodes in the source adjacency are just the keys of the embedding
-    source_adjacency = {v: set() for v in embedding}
+    return {v: set(neighbors[start:stop])
+            for v, start, stop in zip(sources, offsets[:-1].tolist(), offsets[1:].tolist())}
 
-    # we need the mapping from each node in the target to its source node
-    reverse_embedding = {}
-    for v, chain in embedding.items():
-        for u in chain:
-            if u in reverse_embedding:
-                raise ValueError("target node {} assigned to more than one source node".format(u))
-            reverse_embedding[u] = v
 
-    # v is node in target, n node in source
-    for v, n in reverse_embedding.items():
-        neighbors = target_adjacency[v]
+# largest ratio of the largest integer label to the number of labels for which
+# labels are used as indices into a dense array
+_DENSE_LABEL_RATIO = 8
 
-        # u is node in target
-        for u in neighbors:
 
-            # some nodes might not be assigned to chains
-            if u not in reverse_embedding:
-                continue
+def _as_index_array(labels):
+    """Return a list of labels as an array if they are all non-negative
+    integers, else None."""
+    if not labels:
+        return np.empty(0, dtype=np.intp)
+    try:
+        array = np.asarray(labels)
+    except ValueError:
+        # inhomogeneous labels, e.g. tuples of different lengths
+        return None
+    if array.ndim != 1 or array.dtype.kind not in 'iu' or array.min() < 0:
+        return None
+    return array
+
 
-            # m is node in source
-            m = reverse_embedding[u]
+def _chain_pairs(target_adjacency, chains):
+    """Find the pairs of chains connected by target edges.
 
-            if m == n:
-                continue
+    Args:
+        target_adjacency (dict/:class:`networkx.Graph`):
+            Target adjacency as a dict of form ``{v: Nv, ...}``; or a
+            :std:doc:`NetworkX <networkx:index>` graph.
 
-            source_adjacency[n].add(m)
-            source_adjacency[m].add(n)
+        chains (list):
+            Chains as iterables of target nodes.
 
-    return source_adjacency
+    Returns:
+        :class:`numpy.ndarray`: A :math:`nE \\times 2` array of unique pairs
+        of indices into ``chains``, with the smaller index first.
+
+    Raises:
+        ValueError: If any target node is assigned more than one chain.
+
+    """
+    chains = [list(chain) for chain in chains]
+    lengths = np.fromiter(map(len, chains), dtype=np.intp, count=len(chains))
+    targets = list(itertools.chain.from_iterable(chains))
+
+    # the chain index of each target node, in the order of ``targets``
+    owner = np.repeat(np.arange(len(chains), dtype=np.intp), lengths)
+
+    # only the neighborhoods of the chains are relevant
+    neighborhoods = [target_adjacency[u] for u in targets]
+    degrees = np.fromiter(map(len, neighborhoods), dtype=np.intp, count=len(targets))
+    neighbors = list(itertools.chain.from_iterable(neighborhoods))
+
+    target_array = _as_index_array(targets)
+    neighbor_array = _as_index_array(neighbors)
+
+    size = None
+    if target_array is not None and neighbor_array is not None:
+        size = max(target_array.max(initial=-1), neighbor_array.max(initial=-1)) + 1
+
+    if size is not None and size <= _DENSE_LABEL_RATIO * (len(targets) + len(neighbors)) + 1:
+        # integer-labelled target graphs (e.g. QPU working graphs) can use the
+        # labels as indices into a reverse-label vector, unless the labels are
+        # too sparse for one
+        counts = np.bincount(target_array, minlength=size)
+        if counts.max(initial=0) > 1:
+            u = counts.argmax()
+            raise ValueError("target node {} assigned to more than one source node".format(u))
+
+        reverse = np.full(size, -1, dtype=np.intp)
+        reverse[target_array] = owner
+        tails = reverse[neighbor_array]
+    else:
+        reverse_embedding = {}
+        for idx, u in zip(owner.tolist(), targets):
+            if u in reverse_embedding:
+                raise ValueError("target node {} assigned to more than one source node".format(u))
+            reverse_embedding[u] = idx
+
+        # some nodes might not be assigned to chains
+        tails = np.fromiter((reverse_embedding.get(u, -1) for u in neighbors),
+                            dtype=np.intp, count=len(neighbors))
+
+    heads = np.repeat(owner, degrees)
+
+    # keep the edges between two different chains, and deduplicate the pairs
+    # by encoding each as a single integer
+    mask = (tails >= 0) & (tails != heads)
+    heads = heads[mask]
+    tails = tails[mask]
+    num_chains = len(chains)
+    keys = np.unique(np.minimum(heads, tails) * num_chains + np.maximum(heads, tails))
+
+    return np.stack(np.divmod(keys, max(num_chains, 1)), axis=1)
 
 
 def chain_to_quadratic(chain, target_adjacency, chain_strength):
@@ -192,27 +271,109 @@ def chain_break_frequency(samples_like, embedding):
 
 
     """
-    if isinstance(samples_like, dimod.SampleSet):
-        labels = samples_like.variables
-        samples = samples_like.record.sample
-        num_occurrences = samples_like.record.num_occurrences
-    else:
-        samples, labels = dimod.as_samples(samples_like)
-        num_occurrences = np.ones(samples.shape[0])
+    accumulator = ChainBreakAccumulator(embedding)
+    accumulator.update(samples_like)
+    return accumulator.frequency()
 
-    if not all(v == idx for idx, v in enumerate(labels)):
-        labels_to_idx = {v: idx for idx, v in enumerate(labels)}
-        embedding = {v: {labels_to_idx[u] for u in chain} for v, chain in embedding.items()}
 
-    if not embedding:
-        return {}
+class ChainBreakAccumulator:
+    """Accumulate the frequency of chain breaks across many sample sets.
 
-    variables, chains = zip(*embedding.items())
+    Only weighted per-chain counts of :term:`broken chains <broken chain>` are
+    kept, so samples can be discarded after each update. This is useful for
+    monitoring chain break rates over many calls to a sampler.
 
-    broken = broken_chains(samples, chains)
+    Args:
+        embedding (dict):
+            Mapping from :term:`source graph` to :term:`target graph` as a dict
+            of form ``{s: {t, ...}, ...}``, where ``s`` is a source-model
+            variable and ``t`` is a target-model variable.
+
+    Examples:
+        This example accumulates chain breaks of a single source node,
+        :math:`a`, embedded as a chain of two target nodes :math:`(0, 1)`, over
+        two batches of synthetic samples.
+
+        >>> import numpy as np
+        >>> from dwave.embedding import ChainBreakAccumulator
+        ...
+        >>> accumulator = ChainBreakAccumulator({'a': {0, 1}})
+        >>> accumulator.update(np.array([[-1, +1], [+1, +1]]))
+        >>> accumulator.update(np.array([[-1, -1], [+1, +1]]))
+        >>> print(accumulator.num_samples, accumulator.frequency()['a'])
+        4.0 0.25
+
+    """
+    def __init__(self, embedding):
+        self.variables = list(embedding)
+        self._chains = [list(embedding[v]) for v in self.variables]
+
+        self.broken = np.zeros(len(self.variables), dtype=float)
+        self.num_samples = 0.0
+
+        # the column indices of the chains for the most recently seen labels
+        self._labels = None
+        self._columns = None
+
+    variables = None  # overwritten by init
+    """list: Source variables, in the order of :attr:`broken`."""
+
+    broken = None  # overwritten by init
+    """:class:`numpy.ndarray`: Weighted number of broken chains per source
+    variable."""
+
+    num_samples = None  # overwritten by init
+    """float: Total weight (number of occurrences) of the accumulated samples."""
+
+    def _chain_columns(self, labels):
+        labels = list(labels)
+        if labels != self._labels:
+            if all(v == idx for idx, v in enumerate(labels)):
+                columns = self._chains
+            else:
+                labels_to_idx = {v: idx for idx, v in enumerate(labels)}
+                columns = [[labels_to_idx[u] for u in chain] for chain in self._chains]
+            self._labels = labels
+            self._columns = columns
+        return self._columns
+
+    def update(self, samples_like):
+        """Add the chain breaks of the given samples.
 
-    return {v: float(np.average(broken[:, cidx], weights=num_occurrences))
-            for cidx, v in enumerate(variables)}
+        Args:
+            samples_like (samples_like/:obj:`dimod.SampleSet`):
+                A collection of raw samples. ``samples_like`` is an extension
+                of NumPy's |array-like|_. See :func:`dimod.as_samples`. The
+                samples of a :class:`~dimod.SampleSet` are weighted by their
+                ``num_occurrences``.
+
+        """
+        if isinstance(samples_like, dimod.SampleSet):
+            labels = samples_like.variables
+            samples = samples_like.record.sample
+            num_occurrences = samples_like.record.num_occurrences
+        else:
+            samples, labels = dimod.as_samples(samples_like)
+            num_occurrences = np.ones(samples.shape[0])
+
+        broken = broken_chains(samples, self._chain_columns(labels))
+
+        self.broken += num_occurrences @ broken
+        self.num_samples += float(num_occurrences.sum())
+
+    def frequency(self):
+        """Frequency of chain breaks in the accumulated samples.
+
+        Returns:
+            dict: Frequency of chain breaks as a dict in the form
+            ``{s: f, ...}``, where ``s`` is a variable in the source graph and
+            float ``f`` the fraction of broken chains. Frequencies are 0
+            if no samples were accumulated.
+
+        """
+        if not self.num_samples:
+            return dict.fromkeys(self.variables, 0.0)
+        return dict(zip(self.variables, (self.broken / self.num_samples).tolist()))
 
 
 def edgelist_to_adjacency(edgelist):
@@ -14,15 +14,23 @@
 
 import dwave.system.flux_bias_offsets
 
-from dwave.system.samplers import *
-import dwave.system.samplers
-
-from dwave.system.temperatures import *
-import dwave.system.temperatures
-
-from dwave.system.composites import *
-import dwave.system.composites
-
+# samplers, composites and temperature utilities, with their heavier
+# dependencies (for example, the cloud client and SciPy), are imported on
+# first use
+from dwave.system import composites, samplers, utilities
 from dwave.system.utilities import *
+from dwave.system.utilities import _lazy_attributes
 
 from dwave.system.package_info import __version__
+
+__getattr__, __dir__, __all__ = _lazy_attributes(__name__, {
+    'samplers': samplers.__all__,
+    'composites': composites.__all__,
+    'temperatures': ['background_susceptibility_bqm', 'background_susceptibility_ising',
+                     'effective_field', 'fast_effective_temperature',
+                     'fast_effective_temperature_map', 'fluxbias_to_h',
+                     'freezeout_effective_temperature', 'h_to_fluxbias',
+                     'Ip_in_units_of_B', 'maximum_pseudolikelihood',
+                     'maximum_pseudolikelihood_temperature', 'TemperatureAccumulator'],
+    })
+__all__ += utilities.__all__
@@ -12,10 +12,19 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from dwave.system.composites.cutoffcomposite import *
-from dwave.system.composites.embedding import *
-from dwave.system.composites.linear_ancilla import *
-from dwave.system.composites.tiling import *
-from dwave.system.composites.virtual_graph import *
-from dwave.system.composites.reversecomposite import *
-from dwave.system.composites.parallel_embeddings import *
+from dwave.system.utilities import _lazy_attributes
+
+# composites are imported on first use
+__getattr__, __dir__, __all__ = _lazy_attributes(__name__, {
+    'cutoffcomposite': ['CutOffComposite', 'PolyCutOffComposite'],
+    'embedding': ['AutoEmbeddingComposite', 'EmbeddingComposite',
+                  'FixedEmbeddingComposite', 'LazyEmbeddingComposite',
+                  'LazyFixedEmbeddingComposite'],
+    'linear_ancilla': ['LinearAncillaComposite'],
+    'tiling': ['TilingComposite'],
+    'virtual_graph': ['VirtualGraphComposite'],
+    'reversecomposite': ['ReverseAdvanceComposite', 'ReverseBatchStatesComposite'],
+    'parallel_embeddings': ['ParallelEmbeddingComposite'],
+    'recording': ['Recording', 'RecordingComposite'],
+    'scheduling': ['SchedulingComposite'],
+    })
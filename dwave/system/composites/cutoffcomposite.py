@@ -20,10 +20,14 @@ Isolated variables are then also removed.
 """
 import operator
 
+from time import perf_counter
+
 import numpy as np
 
 import dimod
 
+from dwave.system.instrumentation import StageTimer
+
 __all__ = 'CutOffComposite', 'PolyCutOffComposite'
 
 
@@ -137,6 +141,9 @@ class CutOffComposite(dimod.ComposedSampler):
         cutoff_vartype = self._cutoff_vartype
         comp = self._comparison
 
+        timer = StageTimer(self)
+        t0 = perf_counter()
+
         if cutoff_vartype is dimod.SPIN:
             original = bqm.spin
         else:
@@ -162,9 +169,13 @@ class CutOffComposite(dimod.ComposedSampler):
             v = isolated.pop()
             new.linear[v] = original.linear[v]
 
+        timer.record('preprocessing', perf_counter() - t0)
+
         # get the samples from the child sampler and put them into the original vartype
         sampleset = child.sample(new, **parameters).change_vartype(bqm.vartype, inplace=True)
 
+        t0 = perf_counter()
+
         # we now need to add the isolated back in, in a way that minimizes
         # the energy. There are lots of ways to do this but for now we'll just
         # do one
@@ -177,7 +188,12 @@ class CutOffComposite(dimod.ComposedSampler):
         vectors = sampleset.data_vectors
         vectors.pop('energy')  # we're going to recalculate the energy anyway
 
-        return dimod.SampleSet.from_samples_bqm((samples, variables), bqm, **vectors)
+        answer = dimod.SampleSet.from_samples_bqm((samples, variables), bqm, **vectors)
+        timer.record('postprocessing', perf_counter() - t0)
+
+        # keep the stages timed by the child
+        answer.info.update(timing_client=sampleset.info.get('timing_client', {}))
+        return timer.update(answer)
 
 
 def _restore_isolated(sampleset, bqm, isolated):
@@ -318,6 +334,9 @@ class PolyCutOffComposite(dimod.ComposedPolySampler):
         cutoff_vartype = self._cutoff_vartype
         comp = self._comparison
 
+        timer = StageTimer(self)
+        t0 = perf_counter()
+
         if cutoff_vartype is dimod.SPIN:
             original = poly.to_spin(copy=False)
         else:
@@ -345,9 +364,13 @@ class PolyCutOffComposite(dimod.ComposedPolySampler):
             isolated.remove(v)
             new[(v,)] = original.get((v,), 0)
 
+        timer.record('preprocessing', perf_counter() - t0)
+
         # get the samples from the child sampler and put them into the original vartype
         sampleset = child.sample_poly(new, **kwargs).change_vartype(poly.vartype, inplace=True)
 
+        t0 = perf_counter()
+
         # we now need to add the isolated back in, in a way that minimizes
         # the energy. There are lots of ways to do this but for now we'll just
         # do one
@@ -360,7 +383,12 @@ class PolyCutOffComposite(dimod.ComposedPolySampler):
         vectors = sampleset.data_vectors
         vectors.pop('energy')  # we're going to recalculate the energy anyway
 
-        return dimod.SampleSet.from_samples_bqm((samples, variables), poly, **vectors)
+        answer = dimod.SampleSet.from_samples_bqm((samples, variables), poly, **vectors)
+        timer.record('postprocessing', perf_counter() - t0)
+
+        # keep the stages timed by the child
+        answer.info.update(timing_client=sampleset.info.get('timing_client', {}))
+        return timer.update(answer)
 
 
 def _restore_isolated_higherorder(sampleset, poly, isolated):
@@ -32,8 +32,9 @@ from warnings import warn
 import dimod
 import minorminer
 
-from dwave.embedding import (target_to_source, unembed_sampleset,
+from dwave.embedding import (target_to_source, unembed_sampleset, embed_samples,
                              chain_to_quadratic, EmbeddedStructure)
+from dwave.system.instrumentation import StageTimer
 from dwave.system.warnings import WarningHandler, WarningAction
 
 __all__ = ('EmbeddingComposite',
@@ -243,6 +244,7 @@ class EmbeddingComposite(dimod.ComposedSampler):
 
         # solve the problem on the child system
         child = self.child
+        timer = StageTimer(self)
 
         # apply the embedding to the given problem to map it to the child sampler
         __, target_edgelist, target_adjacency = self.target_structure
@@ -262,19 +264,23 @@ class EmbeddingComposite(dimod.ComposedSampler):
                                         for key, val in self.embedding_parameters
                                         if key not in embedding_parameters)
 
-        embedding = self.find_embedding(source_edgelist, target_edgelist,
-                                        **embedding_parameters)
+        with timer.stage('embedding_search'):
+            embedding = self.find_embedding(source_edgelist, target_edgelist,
+                                            **embedding_parameters)
 
         if bqm and not embedding:
             raise ValueError("no embedding found")
 
+        t0 = perf_counter()
         if not hasattr(embedding, 'embed_bqm'):
             embedding = EmbeddedStructure(target_edgelist, embedding)
 
-        t0 = perf_counter()
+        t1 = perf_counter()
         bqm_embedded = embedding.embed_bqm(bqm, chain_strength=chain_strength,
                                            smear_vartype=dimod.SPIN)
-        embedding_time = perf_counter() - t0
+        t2 = perf_counter()
+        embedding_time = t2 - t1
+        timer.record('bias_embedding', t2 - t0)
 
         if warnings is None:
             warnings = self.warnings_default
@@ -283,18 +289,18 @@ class EmbeddingComposite(dimod.ComposedSampler):
 
         warninghandler = WarningHandler(warnings)
 
-        warninghandler.chain_strength(bqm, embedding.chain_strength, embedding)
-        warninghandler.chain_length(embedding)
+        with timer.stage('warnings'):
+            warninghandler.chain_strength(bqm, embedding.chain_strength, embedding)
+            warninghandler.chain_length(embedding)
 
         if 'initial_state' in parameters:
             # if initial_state was provided in terms of the source BQM, we want
             # to modify it to now provide the initial state for the target BQM.
             # we do this by spreading the initial state values over the
             # chains
-            state = parameters['initial_state']
-            parameters['initial_state'] = {u: state[v]
-                                           for v, chain in embedding.items()
-                                           for u in chain}
+            with timer.stage('bias_embedding'):
+                samples, labels = embed_samples(parameters['initial_state'], embedding)
+                parameters['initial_state'] = dict(zip(labels, samples[0].tolist()))
 
         if self.scale_aware and 'ignored_interactions' in child.parameters:
 
@@ -311,7 +317,8 @@ class EmbeddingComposite(dimod.ComposedSampler):
         def async_unembed(response):
             # unembed the sampleset aysnchronously.
 
-            warninghandler.chain_break(response, embedding)
+            with timer.stage('warnings'):
+                warninghandler.chain_break(response, embedding)
 
             response.resolve()
 
@@ -321,6 +328,7 @@ class EmbeddingComposite(dimod.ComposedSampler):
                                           chain_break_fraction=chain_break_fraction,
                                           return_embedding=return_embedding)
             unembedding_time = perf_counter() - t0
+            timer.record('unembedding', unembedding_time)
 
             if return_embedding:
                 timing = dict(embedding=embedding_time, unembedding=unembedding_time)
@@ -330,8 +338,9 @@ class EmbeddingComposite(dimod.ComposedSampler):
                     timing=timing)
 
             if chain_break_fraction and len(sampleset):
-                warninghandler.issue("All samples have broken chains",
-                                     func=lambda: (sampleset.record.chain_break_fraction.all(), None))
+                with timer.stage('warnings'):
+                    warninghandler.issue("All samples have broken chains",
+                                         func=lambda: (sampleset.record.chain_break_fraction.all(), None))
 
             if warninghandler.action is WarningAction.SAVE:
                 # we're done with the warning handler so we can just pass the list
@@ -339,7 +348,7 @@ class EmbeddingComposite(dimod.ComposedSampler):
                 # do a copy
                 sampleset.info.setdefault('warnings', []).extend(warninghandler.saved)
 
-            return sampleset
+            return timer.update(sampleset)
 
         return dimod.SampleSet.from_future(response, async_unembed)
 
@@ -23,6 +23,7 @@ the :ref:`qpu_config_emulate_with_fbo` section.
 import numbers
 
 from collections import defaultdict
+from time import perf_counter
 from typing import Sequence, Mapping, Any
 
 import dimod
@@ -30,6 +31,8 @@ import numpy as np
 
 from dimod.decorators import nonblocking_sample_method
 
+from dwave.system.instrumentation import StageTimer
+
 
 __all__ = ["LinearAncillaComposite"]
 
@@ -138,6 +141,9 @@ class LinearAncillaComposite(dimod.ComposedSampler, dimod.Structured):
         if h_tolerance < 0:
             raise ValueError("h_tolerance needs to be positive or zero")
 
+        timer = StageTimer(self)
+        t0 = perf_counter()
+
         child = self.child
         qpu_properties = _innermost_child_properties(child)
         target_graph = child.to_networkx_graph()
@@ -215,9 +221,13 @@ class LinearAncillaComposite(dimod.ComposedSampler, dimod.Structured):
             used_ancillas[ancilla].append(variable)
             _bqm.set_linear(variable, h_tolerance * np.sign(bias))
 
+        timer.record('preprocessing', perf_counter() - t0)
+
         sampleset = self.child.sample(_bqm, flux_biases=flux_biases, **parameters)
         yield
-        yield dimod.SampleSet.from_samples_bqm(
+
+        t0 = perf_counter()
+        answer = dimod.SampleSet.from_samples_bqm(
             [
                 {k: v for k, v in sample.items() if k not in used_ancillas}
                 for sample in sampleset.samples()
@@ -225,6 +235,11 @@ class LinearAncillaComposite(dimod.ComposedSampler, dimod.Structured):
             bqm=bqm,
             info=sampleset.info.update(used_ancillas),
         )
+        timer.record('postprocessing', perf_counter() - t0)
+
+        # keep the stages timed by the child
+        answer.info.update(timing_client=sampleset.info.get('timing_client', {}))
+        yield timer.update(answer)
 
 
 def _innermost_child_properties(sampler: dimod.Sampler) -> Mapping[str, Any]:
@@ -25,16 +25,50 @@ parallel.
 from typing import Optional
 
 import networkx as nx
+import numpy as np
 
 import dimod
 import dwave.embedding
 
-from dwave.embedding.utils import adjacency_to_edges, target_to_source
+from dwave.embedding.utils import _chain_pairs
+from dwave.system.instrumentation import StageTimer
 from minorminer.utils.parallel_embeddings import find_multiple_embeddings
 
 __all__ = ["ParallelEmbeddingComposite"]
 
 
+def _common_source_edges(target_adjacency, embeddings):
+    """Find the source edges supported by every one of the disjoint embeddings.
+
+    The chains of all embeddings are processed in a single vectorized pass
+    over the target adjacency.
+    """
+    pairs = _chain_pairs(target_adjacency,
+                         (chain for embedding in embeddings for chain in embedding.values()))
+
+    # index source variables consistently across embeddings
+    labels = list(dict.fromkeys(v for embedding in embeddings for v in embedding))
+    label_to_idx = {v: idx for idx, v in enumerate(labels)}
+    sizes = np.fromiter(map(len, embeddings), dtype=np.intp, count=len(embeddings))
+    embedding_idx = np.repeat(np.arange(len(embeddings), dtype=np.intp), sizes)
+    variable_idx = np.fromiter((label_to_idx[v] for embedding in embeddings for v in embedding),
+                               dtype=np.intp, count=sizes.sum())
+
+    # edges between chains of different embeddings are not source edges
+    pairs = pairs[embedding_idx[pairs[:, 0]] == embedding_idx[pairs[:, 1]]]
+    u = variable_idx[pairs[:, 0]]
+    v = variable_idx[pairs[:, 1]]
+
+    # pairs are unique per embedding, so common edges are counted once by each
+    num_labels = len(labels)
+    keys, counts = np.unique(np.minimum(u, v) * num_labels + np.maximum(u, v),
+                             return_counts=True)
+    keys = keys[counts == len(embeddings)]
+
+    heads, tails = np.divmod(keys, max(num_labels, 1))
+    return [(labels[i], labels[j]) for i, j in zip(heads.tolist(), tails.tolist())]
+
+
 class ParallelEmbeddingComposite(dimod.Composite, dimod.Structured, dimod.Sampler):
     """Parallelizes sampling of a small problem on a structured sampler.
 
@@ -227,18 +261,7 @@ class ParallelEmbeddingComposite(dimod.Composite, dimod.Structured, dimod.Sample
                         "source graph is inconsistent with the embeddings specified"
                     )
             if self.edgelist is None:
-                # Find the intersection graph (slow but thorough):
-                edgeset = set(
-                    adjacency_to_edges(
-                        target_to_source(target_adjacency, embeddings[0])
-                    )
-                )
-                for emb in embeddings[1:]:
-                    edgeset0 = set(
-                        adjacency_to_edges(target_to_source(target_adjacency, emb))
-                    )
-                    edgeset = edgeset.intersection(edgeset0)
-                self.edgelist = list(edgeset)
+                self.edgelist = _common_source_edges(target_adjacency, embeddings)
             # could check viability of edgelist (valid embeddings), but this is slow and not the job of the composite.
         else:
             if source is None:
@@ -317,6 +340,7 @@ class ParallelEmbeddingComposite(dimod.Composite, dimod.Structured, dimod.Sample
         responses, info = self.sample_multiple(bqms, chain_strengths, **kwargs)
 
         if self.num_embeddings == 1:
+            responses[0].info.update(timing_client=info['timing_client'])
             return responses[0]
 
         answer = dimod.concatenate(responses)
@@ -350,7 +374,10 @@ class ParallelEmbeddingComposite(dimod.Composite, dimod.Structured, dimod.Sample
                 Chain strength per BQM.
 
             initial_states:
-                Initial state per BQM.
+                Initial state per BQM. Each initial state can be any
+                ``samples_like`` object accepted by :func:`dimod.as_samples`
+                with a single sample, such as a dict or a NumPy array indexed
+                by integer source variables.
 
             **kwargs:
                 Optional keyword arguments for the sampling method.
@@ -366,40 +393,45 @@ class ParallelEmbeddingComposite(dimod.Composite, dimod.Structured, dimod.Sample
             The :meth:`.sample_multiple` method.
         """
 
+        timer = StageTimer(self)
+
         # apply the embeddings to the given problem to tile it across the child sampler
-        embedded_bqm = dimod.BinaryQuadraticModel.empty(bqms[0].vartype)
-
-        __, __, target_adjacency = self.target_structure
-        if not chain_strengths:
-            chain_strengths = [None] * self.num_embeddings
-
-        if initial_states is not None and any(i_s for i_s in initial_states):
-            kwargs["initial_state"] = {
-                u: state[v]
-                for embedding, state in zip(self.embeddings, initial_states)
-                for v, chain in embedding.items()
-                for u in chain
-            }
-
-        for embedding, bqm, chain_strength in zip(
-            self.embeddings, bqms, chain_strengths
-        ):
-            embedded_bqm.update(
-                dwave.embedding.embed_bqm(
-                    bqm, embedding, target_adjacency, chain_strength=chain_strength
+        with timer.stage('bias_embedding'):
+            embedded_bqm = dimod.BinaryQuadraticModel.empty(bqms[0].vartype)
+
+            __, __, target_adjacency = self.target_structure
+            if not chain_strengths:
+                chain_strengths = [None] * self.num_embeddings
+
+            if initial_states is not None and any(i_s is not None and len(i_s)
+                                                  for i_s in initial_states):
+                initial_state = {}
+                for embedding, state in zip(self.embeddings, initial_states):
+                    samples, labels = dwave.embedding.embed_samples(state, embedding)
+                    initial_state.update(zip(labels, samples[0].tolist()))
+                kwargs["initial_state"] = initial_state
+
+            for embedding, bqm, chain_strength in zip(
+                self.embeddings, bqms, chain_strengths
+            ):
+                embedded_bqm.update(
+                    dwave.embedding.embed_bqm(
+                        bqm, embedding, target_adjacency, chain_strength=chain_strength
+                    )
                 )
-            )
 
         # solve the problem on the child system
         tiled_response = self.child.sample(embedded_bqm, **kwargs)
+        tiled_response.resolve()
 
-        responses = []
-        for embedding, bqm in zip(self.embeddings, bqms):
-            responses.append(
-                dwave.embedding.unembed_sampleset(tiled_response, embedding, bqm)
-            )
+        with timer.stage('unembedding'):
+            responses = []
+            for embedding, bqm in zip(self.embeddings, bqms):
+                responses.append(
+                    dwave.embedding.unembed_sampleset(tiled_response, embedding, bqm)
+                )
 
-        return responses, tiled_response.info
+        return responses, timer.update_info(dict(tiled_response.info))
 
     @property
     def num_embeddings(self):
@@ -0,0 +1,268 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+A composite that records the problems submitted to a structured sampler, and
+the responses, so that they can be replayed offline with
+:class:`~dwave.system.testing.ReplaySampler`.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+
+from time import perf_counter
+
+import dimod
+
+from dwave.system.instrumentation import StageTimer
+from dwave.system.utilities import _bqm_fingerprint
+
+__all__ = ['Recording', 'RecordingComposite']
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(obj):
+    # NumPy arrays and scalars in parameters
+    try:
+        return obj.tolist()
+    except AttributeError:
+        raise TypeError(f"object of type {type(obj).__name__} "
+                        "is not JSON serializable") from None
+
+
+def _json_default_lossy(obj):
+    # objects in the info of a sample set that JSON cannot represent, such as
+    # the categories of saved warnings, are recorded by name
+    try:
+        return _json_default(obj)
+    except TypeError:
+        if isinstance(obj, type):
+            return f'{obj.__module__}.{obj.__qualname__}'
+        return repr(obj)
+
+
+def _parameters_key(parameters):
+    """Return a canonical encoding of sampling parameters."""
+    return json.dumps(parameters, sort_keys=True, default=_json_default)
+
+
+def _open_store(path, mode):
+    if os.fspath(path).endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _read_store(path):
+    """Return the sampler structure and the responses saved in a store."""
+    structure = None
+    responses = []
+    with _open_store(path, 'r') as f:
+        for line in f:
+            record = json.loads(line)
+            if record.pop('type') == 'sampler':
+                if structure is None:
+                    structure = record
+            else:
+                responses.append(record)
+
+    if structure is None:
+        raise ValueError(f"{path!r} does not contain a recorded sampler")
+
+    return structure, responses
+
+
+class Recording:
+    """Sampler structure and responses saved by :class:`RecordingComposite`.
+
+    Args:
+        path (str or path-like):
+            Path of a store written by :class:`RecordingComposite`.
+
+    Attributes:
+        nodelist (list): Nodes of the recorded sampler.
+        edgelist (list): Edges of the recorded sampler.
+        properties (dict): Properties of the recorded sampler.
+        parameters (dict): Parameters of the recorded sampler.
+        responses (dict): Recorded responses, as lists of
+            ``(sampleset, latency)`` tuples in the order they were recorded,
+            keyed by :meth:`key`.
+
+    Examples:
+        >>> from dwave.system import Recording
+        >>> recording = Recording('responses.jsonl.gz')    # doctest: +SKIP
+        >>> responses = recording.responses[Recording.key(bqm, dict(num_reads=100))]  # doctest: +SKIP
+
+    """
+
+    def __init__(self, path):
+        structure, records = _read_store(path)
+
+        self.nodelist = structure['nodelist']
+        self.edgelist = [tuple(edge) for edge in structure['edgelist']]
+        self.properties = structure['properties']
+        self.parameters = structure['parameters']
+
+        self.responses = {}
+        for record in records:
+            key = (record['fingerprint'], record['parameters_key'])
+            self.responses.setdefault(key, []).append(
+                (dimod.SampleSet.from_serializable(record['sampleset']), record['latency']))
+
+    @staticmethod
+    def key(bqm, parameters):
+        """Return the key of the responses recorded for a problem.
+
+        Args:
+            bqm (:class:`~dimod.BinaryQuadraticModel`):
+                Binary quadratic model sampled.
+
+            parameters (dict):
+                Parameters of the sampling call.
+
+        """
+        return (_bqm_fingerprint(bqm), _parameters_key(parameters))
+
+
+class RecordingComposite(dimod.ComposedSampler, dimod.Structured):
+    """Composite that records the problems and responses of a structured sampler.
+
+    Every problem sampled by this composite is passed unchanged to its child
+    sampler. When the returned sample set is resolved, a digest of the binary
+    quadratic model, the sampling parameters, the sample set (including its
+    ``info`` field, with any timing information) and the time from submission
+    to resolution are appended to a store: a file with one JSON object per
+    line, compressed with gzip if its name ends in ``.gz``. The structure and
+    properties of the child sampler are saved when the store is created.
+
+    A store can be replayed, without network access, with
+    :class:`~dwave.system.testing.ReplaySampler`, or loaded with
+    :class:`Recording`.
+
+    Args:
+        child_sampler (:class:`dimod.Sampler`):
+            A structured dimod sampler, such as a
+            :class:`~dwave.system.samplers.DWaveSampler`.
+
+        path (str or path-like):
+            Path of the store. Responses are appended to an existing store.
+
+    Examples:
+        This example records the responses of a sampler and replays them.
+
+        >>> import dimod
+        >>> from dwave.system import DWaveSampler, EmbeddingComposite, RecordingComposite
+        >>> from dwave.system.testing import ReplaySampler
+        ...
+        >>> bqm = dimod.generators.ran_r(1, 6, seed=1)
+        >>> embedding = {v: [v] for v in bqm.variables}
+        >>> with DWaveSampler() as qpu:      # doctest: +SKIP
+        ...     sampler = RecordingComposite(qpu, 'responses.jsonl.gz')
+        ...     sampleset = EmbeddingComposite(sampler).sample(bqm, num_reads=100)
+        >>> replay = ReplaySampler('responses.jsonl.gz')   # doctest: +SKIP
+
+    """
+
+    def __init__(self, child_sampler, path):
+        self._children = [child_sampler]
+        self.path = path
+        self._lock = threading.Lock()
+
+        if not os.path.exists(path) or not os.path.getsize(path):
+            self._write(dict(type='sampler',
+                             nodelist=child_sampler.nodelist,
+                             edgelist=child_sampler.edgelist,
+                             properties=child_sampler.properties,
+                             parameters=child_sampler.parameters))
+
+    @property
+    def children(self) -> list:
+        """Child samplers that are used by this composite."""
+        return self._children
+
+    @property
+    def nodelist(self) -> list:
+        """Nodes available to the child sampler."""
+        return self.child.nodelist
+
+    @property
+    def edgelist(self) -> list:
+        """Edges available to the child sampler."""
+        return self.child.edgelist
+
+    @property
+    def parameters(self) -> dict:
+        """Parameters of the child sampler."""
+        return self.child.parameters
+
+    @property
+    def properties(self) -> dict:
+        """Properties of the child sampler."""
+        return self.child.properties
+
+    def sample(self, bqm, **parameters):
+        """Sample from the child sampler and record the response.
+
+        Args:
+            bqm (:class:`~dimod.BinaryQuadraticModel`):
+                Binary quadratic model to be sampled from.
+
+            **parameters:
+                Parameters for the sampling method, specified by the child
+                sampler. Parameters must be JSON serializable, or NumPy
+                arrays.
+
+        Returns:
+            :class:`~dimod.SampleSet`: The sample set returned by the child
+            sampler. The response is recorded when the sample set is resolved.
+
+        """
+        timer = StageTimer(self)
+
+        with timer.stage('recording'):
+            fingerprint, key = Recording.key(bqm, parameters)
+
+        t0 = perf_counter()
+        sampleset = self.child.sample(bqm, **parameters)
+
+        def hook(sampleset):
+            sampleset.resolve()
+            latency = perf_counter() - t0
+
+            with timer.stage('recording'):
+                try:
+                    self._write(dict(type='response',
+                                     fingerprint=fingerprint,
+                                     parameters=json.loads(key),
+                                     # JSON turns the keys of mappings, such
+                                     # as initial states, into strings, so
+                                     # responses are matched on the encoding
+                                     parameters_key=key,
+                                     sampleset=sampleset.to_serializable(),
+                                     latency=latency))
+                except Exception:
+                    # a response that cannot be recorded is still returned
+                    logger.exception("failed to record the response to %s", self.path)
+
+            return timer.update(sampleset)
+
+        return dimod.SampleSet.from_future(sampleset, hook)
+
+    def _write(self, record):
+        line = json.dumps(record, default=_json_default_lossy) + '\n'
+        with self._lock, _open_store(self.path, 'a') as f:
+            f.write(line)
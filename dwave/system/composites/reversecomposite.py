@@ -21,9 +21,13 @@ Composites that do batch operations for
 
 import collections.abc as abc
 
+from time import perf_counter
+
 import dimod
 import numpy as np
 
+from dwave.system.instrumentation import StageTimer, _merge_timing
+
 __all__ = ['ReverseAdvanceComposite', 'ReverseBatchStatesComposite']
 
 
@@ -149,10 +153,16 @@ class ReverseAdvanceComposite(dimod.ComposedSampler):
             if "answer_mode" in child.parameters:
                 parameters['answer_mode'] = 'histogram'
 
+        timer = StageTimer(self)
+        child_timing = {}
+
         samplesets = None
         for schedule_idx, anneal_schedule in enumerate(anneal_schedules):
             sampleset = child.sample(bqm, anneal_schedule=anneal_schedule, initial_state=initial_state,
                                      **parameters)
+            _merge_timing(child_timing, sampleset.info.get('timing_client', {}))
+
+            t0 = perf_counter()
 
             initial_state, _ = dimod.as_samples(initial_state)
 
@@ -178,6 +188,8 @@ class ReverseAdvanceComposite(dimod.ComposedSampler):
             else:
                 samplesets = dimod.concatenate((samplesets, sampleset))
 
+            timer.record('postprocessing', perf_counter() - t0)
+
             if schedule_idx+1 == len(anneal_schedules):
                 # no need to create the next initial state - last iteration
                 break
@@ -194,7 +206,8 @@ class ReverseAdvanceComposite(dimod.ComposedSampler):
                 initial_state = dict(zip(sampleset.variables, sampleset.record.sample[-1]))
 
         samplesets.info['anneal_schedules'] = anneal_schedules
-        return samplesets
+        samplesets.info['timing_client'] = child_timing
+        return timer.update(samplesets)
 
 
 class ReverseBatchStatesComposite(dimod.ComposedSampler, dimod.Initialized):
@@ -334,10 +347,16 @@ class ReverseBatchStatesComposite(dimod.ComposedSampler, dimod.Initialized):
         if 'answer_mode' in child.parameters:
             parameters['answer_mode'] = 'histogram'
 
+        timer = StageTimer(self)
+        child_timing = {}
+
         samplesets = None
 
         for initial_state in parsed_initial_states:
             sampleset = child.sample(bqm, initial_state=dict(zip(bqm.variables, initial_state)), **parameters)
+            _merge_timing(child_timing, sampleset.info.get('timing_client', {}))
+
+            t0 = perf_counter()
 
             if 'initial_state' not in sampleset.record.dtype.names:
                 init_state_vect = [initial_state.copy() for i in range(len(sampleset.record.energy))]
@@ -348,4 +367,7 @@ class ReverseBatchStatesComposite(dimod.ComposedSampler, dimod.Initialized):
             else:
                 samplesets = dimod.concatenate((samplesets, sampleset))
 
-        return samplesets
+            timer.record('postprocessing', perf_counter() - t0)
+
+        samplesets.info['timing_client'] = child_timing
+        return timer.update(samplesets)
@@ -0,0 +1,297 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+A composite that schedules the problems submitted to a sampler shared by many
+callers, with a bounded priority queue and limits on the number of problems in
+flight.
+"""
+
+import collections
+import concurrent.futures
+import itertools
+import threading
+
+from time import perf_counter
+
+import dimod
+
+from dwave.system.instrumentation import StageTimer
+
+__all__ = ['SchedulingComposite']
+
+
+class _Job:
+    __slots__ = ('priority', 'seq', 'tenant', 'bqm', 'parameters', 'future',
+                 'queued', 'started')
+
+    def __init__(self, priority, seq, tenant, bqm, parameters):
+        self.priority = priority
+        self.seq = seq
+        self.tenant = tenant
+        self.bqm = bqm
+        self.parameters = parameters
+        self.future = concurrent.futures.Future()
+        self.queued = perf_counter()
+        self.started = None
+
+    def key(self):
+        # higher priorities first, then in order of submission
+        return (-self.priority, self.seq)
+
+
+class SchedulingComposite(dimod.ComposedSampler, dimod.Structured):
+    """Composite that schedules the problems submitted to its child sampler.
+
+    Problems sampled by this composite, from any number of threads, are held
+    in a queue and submitted to the child sampler by a dispatcher thread, in
+    order of priority and then of submission, while:
+
+    *   at most ``max_in_flight`` problems are in flight (submitted and not
+        yet resolved), and
+    *   at most ``tenant_limits[tenant]`` of those were submitted for a given
+        ``tenant``.
+
+    When the queue holds ``max_queue_size`` problems, calls to :meth:`sample`
+    block until there is space (backpressure).
+
+    Sample sets are returned immediately and resolve when the child sampler's
+    sample set does. The time each problem spent in the queue is added, as the
+    ``queue`` stage, to the ``timing_client`` field of the sample set's
+    ``info``.
+
+    Args:
+        child_sampler (:class:`dimod.Sampler`):
+            A dimod sampler, such as a
+            :class:`~dwave.system.samplers.DWaveSampler`. The composite is
+            structured if the child sampler is.
+
+        max_in_flight (int, optional, default=4):
+            Maximum number of problems in flight.
+
+        tenant_limits (dict, optional):
+            Maximum number of problems in flight for each tenant, each a
+            positive integer. Tenants not in the dict are limited only by
+            ``max_in_flight``.
+
+        max_queue_size (int, optional, default=0):
+            Maximum number of queued problems. If 0, the queue is unbounded.
+
+        priority_window (float, optional, default=0):
+            Time, in seconds, to hold a problem queued on an empty queue
+            before dispatching it, so that problems submitted in a burst are
+            dispatched in order of priority. Problems are still submitted to
+            the child sampler one at a time.
+
+    Examples:
+        This example shares one QPU sampler between threads, with at most
+        two problems in flight and at most one for batch jobs, and gives
+        priority to latency-critical problems.
+
+        >>> import dimod
+        >>> from dwave.system import DWaveSampler, SchedulingComposite
+        ...
+        >>> with SchedulingComposite(DWaveSampler(), max_in_flight=2,
+        ...                          tenant_limits={'batch': 1}) as sampler:   # doctest: +SKIP
+        ...     u, v = sampler.edgelist[0]
+        ...     bqm = dimod.BQM({}, {(u, v): -1}, 0, 'SPIN')
+        ...     batch = [sampler.sample(bqm, tenant='batch') for _ in range(10)]
+        ...     urgent = sampler.sample(bqm, priority=1)
+        ...     print(urgent.first.energy)
+        -1.0
+
+    """
+
+    def __init__(self, child_sampler, max_in_flight=4, tenant_limits=None,
+                 max_queue_size=0, priority_window=0):
+        if max_in_flight < 1:
+            raise ValueError("'max_in_flight' must be a positive integer")
+        if any(limit < 1 for limit in (tenant_limits or {}).values()):
+            raise ValueError("'tenant_limits' must be positive integers")
+
+        self._children = [child_sampler]
+        self.max_in_flight = max_in_flight
+        self.tenant_limits = dict(tenant_limits or {})
+        self.max_queue_size = max_queue_size
+        self.priority_window = priority_window
+
+        self._queue = []
+        self._seq = itertools.count()
+        self._in_flight = collections.Counter()  # by tenant
+        self._submitted = 0
+        self._completed = 0
+        self._window_end = 0.
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix='SchedulingComposite')
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True,
+                                            name='SchedulingComposite-dispatcher')
+        self._dispatcher.start()
+
+    @property
+    def children(self) -> list:
+        """Child samplers that are used by this composite."""
+        return self._children
+
+    @property
+    def nodelist(self) -> list:
+        """Nodes available to the child sampler."""
+        return self.child.nodelist
+
+    @property
+    def edgelist(self) -> list:
+        """Edges available to the child sampler."""
+        return self.child.edgelist
+
+    @property
+    def parameters(self) -> dict:
+        """Parameters of the child sampler, and ``priority`` and ``tenant``."""
+        parameters = self.child.parameters.copy()
+        parameters.update(priority=[], tenant=[])
+        return parameters
+
+    @property
+    def properties(self) -> dict:
+        """Properties of the child sampler."""
+        return self.child.properties
+
+    def metrics(self) -> dict:
+        """Return a snapshot of the scheduler's state.
+
+        Returns:
+            dict: With the number of problems ``queued`` and ``in_flight``,
+            the problems in flight for each tenant as ``in_flight_by_tenant``,
+            and the total numbers of problems ``submitted`` to the child
+            sampler and ``completed``.
+
+        """
+        with self._condition:
+            return dict(queued=len(self._queue),
+                        in_flight=sum(self._in_flight.values()),
+                        in_flight_by_tenant=dict(+self._in_flight),
+                        submitted=self._submitted,
+                        completed=self._completed)
+
+    def sample(self, bqm, priority=0, tenant=None, **parameters):
+        """Queue a problem for the child sampler.
+
+        Args:
+            bqm (:class:`~dimod.BinaryQuadraticModel`):
+                Binary quadratic model to be sampled from.
+
+            priority (number, optional, default=0):
+                Priority of the problem. Problems of higher priority are
+                submitted first.
+
+            tenant (hashable, optional):
+                Tenant the problem is submitted for, as limited by
+                ``tenant_limits``.
+
+            **parameters:
+                Parameters for the sampling method, specified by the child
+                sampler.
+
+        Returns:
+            :class:`~dimod.SampleSet`: A sample set that resolves when the
+            child sampler's sample set does.
+
+        """
+        timer = StageTimer(self)
+
+        with self._condition:
+            while (not self._closed and self.max_queue_size
+                    and len(self._queue) >= self.max_queue_size):
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("cannot sample from a closed SchedulingComposite")
+
+            job = _Job(priority, next(self._seq), tenant, bqm, parameters)
+            if not self._queue:
+                self._window_end = job.queued + self.priority_window
+            self._queue.append(job)
+            self._condition.notify_all()
+
+        def hook(future):
+            sampleset = future.result()
+            timer.record('queue', job.started - job.queued)
+            return timer.update(sampleset)
+
+        return dimod.SampleSet.from_future(job.future, hook)
+
+    def _next_job(self):
+        """Return the job to dispatch next, or None."""
+        if sum(self._in_flight.values()) >= self.max_in_flight:
+            return None
+
+        eligible = (job for job in self._queue
+                    if self._in_flight[job.tenant] < self.tenant_limits.get(job.tenant,
+                                                                           self.max_in_flight))
+        return min(eligible, key=_Job.key, default=None)
+
+    def _dispatch(self):
+        condition = self._condition
+        while True:
+            with condition:
+                while True:
+                    if self._closed and not self._queue:
+                        return
+
+                    timeout = self._window_end - perf_counter()
+                    if timeout > 0:
+                        condition.wait(timeout)
+                        continue
+
+                    job = self._next_job()
+                    if job is not None:
+                        break
+                    condition.wait()
+
+                self._queue.remove(job)
+                self._in_flight[job.tenant] += 1
+                self._submitted += 1
+                job.started = perf_counter()
+                condition.notify_all()  # space in the queue
+
+            self._executor.submit(self._run, job)
+
+    def _run(self, job):
+        sampleset = exception = None
+        try:
+            sampleset = self.child.sample(job.bqm, **job.parameters)
+            sampleset.resolve()
+        except BaseException as exc:
+            exception = exc
+
+        # free the slot before the caller sees the result
+        with self._condition:
+            self._in_flight[job.tenant] -= 1
+            self._completed += 1
+            self._condition.notify_all()
+
+        if exception is not None:
+            job.future.set_exception(exception)
+        else:
+            job.future.set_result(sampleset)
+
+    def close(self):
+        """Submit the queued problems, wait for them to resolve, and close
+        the child sampler."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+        super().close()
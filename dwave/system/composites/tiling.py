@@ -33,6 +33,7 @@ import dimod
 import dwave_networkx as dnx
 
 import dwave.embedding
+from dwave.system.instrumentation import StageTimer
 
 __all__ = ['TilingComposite']
 
@@ -309,26 +310,31 @@ class TilingComposite(dimod.Composite, dimod.Structured, dimod.Sampler):
 
         """
 
+        timer = StageTimer(self)
+
         # apply the embeddings to the given problem to tile it across the child sampler
-        embedded_bqm = dimod.BinaryQuadraticModel.empty(bqm.vartype)
-        __, __, target_adjacency = self.child.structure
-        for embedding in self.embeddings:
-            embedded_bqm.update(dwave.embedding.embed_bqm(bqm, embedding, target_adjacency))
+        with timer.stage('bias_embedding'):
+            embedded_bqm = dimod.BinaryQuadraticModel.empty(bqm.vartype)
+            __, __, target_adjacency = self.child.structure
+            for embedding in self.embeddings:
+                embedded_bqm.update(dwave.embedding.embed_bqm(bqm, embedding, target_adjacency))
 
         # solve the problem on the child system
         tiled_response = self.child.sample(embedded_bqm, **kwargs)
+        tiled_response.resolve()
 
-        responses = []
+        with timer.stage('unembedding'):
+            responses = []
 
-        for embedding in self.embeddings:
-            embedding = {v: chain for v, chain in embedding.items() if v in bqm.variables}
+            for embedding in self.embeddings:
+                embedding = {v: chain for v, chain in embedding.items() if v in bqm.variables}
 
-            responses.append(dwave.embedding.unembed_sampleset(tiled_response, embedding, bqm))
+                responses.append(dwave.embedding.unembed_sampleset(tiled_response, embedding, bqm))
 
-        answer = dimod.concatenate(responses)
+            answer = dimod.concatenate(responses)
         answer.info.update(tiled_response.info)
 
-        return answer
+        return timer.update(answer)
 
     @property
     def num_tiles(self):
@@ -0,0 +1,200 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Client-side timing of the processing stages of samplers and composites.
+
+Every sampler and composite in ``dwave-system`` times its own processing
+stages (for example, embedding search, bias embedding, submission, waiting
+for results and unembedding) and adds the durations, in seconds, to the
+``timing_client`` field of the returned sample set's
+:attr:`~dimod.SampleSet.info`. Each stage is timed by exactly one layer of a
+stack of composites, so durations of stages with the same name are summed.
+
+Stage durations are also passed to any callbacks registered with
+:func:`add_timing_callback`, for example to export them as metrics.
+"""
+
+import logging
+
+from time import perf_counter
+
+import dimod
+
+__all__ = ['StageTimer',
+           'add_timing_callback',
+           'remove_timing_callback',
+           ]
+
+logger = logging.getLogger(__name__)
+
+_callbacks = []
+
+
+def add_timing_callback(callback):
+    """Register a callback for client-side stage timings.
+
+    Args:
+        callback (callable):
+            A function ``callback(sampler, timing)`` called every time a
+            sampler or composite finishes processing a problem, where
+            ``sampler`` is the sampler or composite and ``timing`` is a dict
+            mapping the names of its processing stages to their durations,
+            in seconds. Callbacks are called from the thread that resolves
+            the sample set. Exceptions raised by a callback are logged and
+            do not affect sampling.
+
+    Examples:
+        This example collects the stage timings of a mock QPU sampler.
+
+        >>> from dwave.system.instrumentation import (add_timing_callback,
+        ...                                           remove_timing_callback)
+        >>> from dwave.system.testing import MockDWaveSampler
+        ...
+        >>> timings = []
+        >>> callback = lambda sampler, timing: timings.append(timing)
+        >>> add_timing_callback(callback)
+        >>> sampler = MockDWaveSampler()
+        >>> sampleset = sampler.sample_ising({sampler.nodelist[0]: 1}, {}).resolve()
+        >>> remove_timing_callback(callback)
+        >>> 'submission' in timings[0]
+        True
+
+    """
+    _callbacks.append(callback)
+
+
+def remove_timing_callback(callback):
+    """Unregister a callback added with :func:`add_timing_callback`.
+
+    Raises:
+        ValueError: If ``callback`` is not registered.
+
+    """
+    _callbacks.remove(callback)
+
+
+class _Stage:
+    __slots__ = ('timer', 'name', 't0')
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.record(self.name, perf_counter() - self.t0)
+
+
+class StageTimer:
+    """Accumulate the durations of the processing stages of one sampling call.
+
+    Args:
+        sampler (:class:`dimod.Sampler`):
+            Sampler or composite whose stages are timed, passed to the
+            registered callbacks.
+
+    Examples:
+        >>> import dimod
+        >>> from dwave.system.instrumentation import StageTimer
+        ...
+        >>> timer = StageTimer(dimod.ExactSolver())
+        >>> with timer.stage('preprocessing'):
+        ...     bqm = dimod.BQM({'a': 1}, {}, 0, 'SPIN')
+        >>> sampleset = timer.update(dimod.ExactSolver().sample(bqm))
+        >>> list(sampleset.info['timing_client'])
+        ['preprocessing']
+
+    """
+
+    __slots__ = ('sampler', 'timing')
+
+    def __init__(self, sampler):
+        self.sampler = sampler
+        self.timing = {}
+
+    def stage(self, name):
+        """Return a context manager that times the ``name`` stage.
+
+        Repeated stages of the same name are summed.
+        """
+        return _Stage(self, name)
+
+    def record(self, name, duration):
+        """Add ``duration``, in seconds, to the ``name`` stage."""
+        timing = self.timing
+        timing[name] = timing.get(name, 0.) + duration
+
+    def update(self, sampleset):
+        """Add the timed stages to a sample set and notify the callbacks.
+
+        Args:
+            sampleset (:class:`~dimod.SampleSet`):
+                A resolved sample set. Its ``timing_client`` info field,
+                which can hold the stages of a child sampler, is updated with
+                the stages timed here.
+
+        Returns:
+            :class:`~dimod.SampleSet`: The given sample set.
+
+        """
+        self.update_info(sampleset.info)
+        return sampleset
+
+    def deferred_update(self, sampleset):
+        """Time the wait for an unresolved sample set.
+
+        Args:
+            sampleset (:class:`~dimod.SampleSet`):
+                A sample set, typically constructed from a future.
+
+        Returns:
+            :class:`~dimod.SampleSet`: A sample set that, when resolved, adds
+            the wait for ``sampleset`` as the ``wait`` stage and then the
+            timed stages as described in :meth:`update`.
+
+        """
+        def hook(sampleset):
+            with self.stage('wait'):
+                sampleset.resolve()
+            return self.update(sampleset)
+
+        return dimod.SampleSet.from_future(sampleset, hook)
+
+    def update_info(self, info):
+        """Add the timed stages to an ``info`` dict and notify the callbacks.
+
+        Returns:
+            dict: The given ``info`` dict.
+
+        """
+        # composites often share the child's info, so do not modify it in place
+        info['timing_client'] = _merge_timing(dict(info.get('timing_client', ())), self.timing)
+
+        for callback in _callbacks:
+            try:
+                callback(self.sampler, self.timing)
+            except Exception:
+                logger.exception("timing callback %r failed", callback)
+
+        return info
+
+
+def _merge_timing(target, source):
+    """Add the stage durations in ``source`` to those in ``target``."""
+    for name, duration in source.items():
+        target[name] = target.get(name, 0.) + duration
+    return target
@@ -14,6 +14,8 @@
 
 import typing
 
+from dwave.system.utilities import _lazy_attributes
+
 
 class ResultInfoDict(typing.TypedDict, total=False):
     """Returned in ``SampleSet.info`` and ``LeapHybridNLSampler.SampleResult.info``.
@@ -28,6 +30,12 @@ class ResultInfoDict(typing.TypedDict, total=False):
     problem_data_id: str
 
 
-from dwave.system.samplers.clique import *
-from dwave.system.samplers.dwave_sampler import *
-from dwave.system.samplers.leap_hybrid_sampler import *
+# samplers are imported on first use
+__getattr__, __dir__, __all__ = _lazy_attributes(__name__, {
+    'clique': ['DWaveCliqueSampler'],
+    'dwave_sampler': ['DWaveSampler', 'qpu_graph'],
+    'leap_hybrid_sampler': ['LeapHybridSampler', 'LeapHybridBQMSampler',
+                            'LeapHybridDQMSampler', 'LeapHybridCQMSampler',
+                            'LeapHybridNLSampler', 'StrideHybridSolver'],
+    })
+__all__.append('ResultInfoDict')
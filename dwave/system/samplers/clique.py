@@ -13,6 +13,7 @@
 #    limitations under the License.
 
 from numbers import Number
+from time import perf_counter
 from typing import Tuple
 
 import dimod
@@ -22,6 +23,7 @@ from minorminer.busclique import find_clique_embedding, busgraph_cache
 from dwave.preprocessing import ScaleComposite
 from dwave.system.samplers.dwave_sampler import DWaveSampler
 from dwave.system.coupling_groups import coupling_groups
+from dwave.system.instrumentation import StageTimer
 
 __all__ = ['DWaveCliqueSampler']
 
@@ -76,6 +78,9 @@ class _QubitCouplingComposite(dimod.ComposedSampler):
         if bqm.vartype is not dimod.SPIN:
             raise ValueError("bqm must have SPIN vartype")
 
+        timer = StageTimer(self)
+        t0 = perf_counter()
+
         if any(('per_qubit_coupling_range' in self.child.properties.keys(),
                 'per_group_coupling_range' in self.child.properties.keys())):
 
@@ -125,9 +130,11 @@ class _QubitCouplingComposite(dimod.ComposedSampler):
             elif bias > max_J:
                 bqm.set_quadratic(u, v, max_J)
 
+        timer.record('preprocessing', perf_counter() - t0)
+
         sampleset = self.child.sample(bqm, **parameters)
         yield sampleset
-        yield sampleset
+        yield timer.update(sampleset)
 
 
 class DWaveCliqueSampler(dimod.Sampler):
@@ -444,9 +451,12 @@ class DWaveCliqueSampler(dimod.Sampler):
         # handle circular import. todo: fix
         from dwave.system.composites.embedding import FixedEmbeddingComposite
 
+        timer = StageTimer(self)
+
         # get the embedding
-        embedding = find_clique_embedding(bqm.variables, self.target_graph,
-                                          use_cache=True)
+        with timer.stage('embedding_search'):
+            embedding = find_clique_embedding(bqm.variables, self.target_graph,
+                                              use_cache=True)
 
         # returns an empty embedding when the BQM is too large
         if not embedding and bqm.num_variables:
@@ -485,4 +495,5 @@ class DWaveCliqueSampler(dimod.Sampler):
                                    )
 
         # change_vartype is non-blocking
-        return sampleset.change_vartype(original_bqm.vartype)
+        sampleset = sampleset.change_vartype(original_bqm.vartype)
+        return dimod.SampleSet.from_future(sampleset, timer.update)
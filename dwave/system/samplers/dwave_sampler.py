@@ -18,15 +18,27 @@ A :ref:`dimod <index_dimod>` :term:`sampler` for D-Wave quantum computers.
 
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import collections.abc as abc
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
 from collections import defaultdict
+from numbers import Integral
 from typing import Optional, Dict, TYPE_CHECKING
 
 import dimod
 import dwave_networkx as dnx
+import numpy as np
 from dimod.exceptions import BinaryQuadraticModelStructureError
 from dwave.cloud.client import Client
+from dwave.cloud.config import get_cache_dir
+from dwave.cloud.solver import StructuredSolver
 from dwave.cloud.exceptions import (
     SolverError, SolverAuthenticationError, InvalidAPIResponseError,
     RequestTimeout, PollingTimeout, ProblemUploadError, ProblemStructureError,
@@ -34,11 +46,9 @@ from dwave.cloud.exceptions import (
 )
 
 from dwave.system.exceptions import FailoverCondition, RetryCondition
+from dwave.system.instrumentation import StageTimer
 from dwave.system.warnings import WarningHandler, WarningAction
 
-if TYPE_CHECKING:
-    from dwave.cloud.solver import StructuredSolver
-
 __all__ = ['DWaveSampler', 'qpu_graph']
 
 
@@ -105,6 +115,230 @@ def _get_solver_id(solver: StructuredSolver) -> str:
     return solver.id
 
 
+def _get_solver_data_json(solver: StructuredSolver) -> str:
+    """Return the solver's configuration, as returned by SAPI, encoded as JSON."""
+
+    # a pydantic model in cloud-client>=0.14
+    if hasattr(solver.data, 'model_dump_json'):
+        return solver.data.model_dump_json()
+
+    # a dict until cloud-client==0.14
+    return json.dumps(solver.data)
+
+
+def _first(items, limit=10):
+    """Format at most ``limit`` items for an error message."""
+    if len(items) <= limit:
+        return ', '.join(map(repr, items))
+    return ', '.join(map(repr, items[:limit])) + f', ... ({len(items)} in total)'
+
+
+def _ordered_solvers(client, refresh=False):
+    """Return the solvers filtered and ordered according to the client config."""
+    # the only solver filters used by `DWaveSampler` are those
+    # propagated to `Client.from_config` on construction
+    filters = copy.deepcopy(client.config.solver)
+    order_by = filters.pop('order_by', 'avg_load')
+    return client.get_solvers(refresh=refresh, order_by=order_by, **filters)
+
+
+def _solver_parameters(properties):
+    parameters = {param: ['parameters'] for param in properties['parameters']}
+    parameters.update(warnings=[])
+    parameters.update(label=[])
+    return parameters
+
+
+def _solver_structure(nodelist, edgelist):
+    n = nodelist[-1] + 1 if nodelist else 0
+    active = np.zeros(n, dtype=bool)
+    active[nodelist] = True
+
+    edges = np.asarray(edgelist, dtype=np.int64).reshape(-1, 2)
+    couplers = np.sort(edges[:, 0]*n + edges[:, 1])
+
+    return active, couplers
+
+
+class _CircuitBreaker:
+    """Failure tracking for one solver.
+
+    The breaker opens on a failure, excluding the solver from failover for
+    ``cooldown`` seconds, doubled for each consecutive failure (up to 64
+    times), and closes on a success.
+    """
+
+    def __init__(self, cooldown):
+        self.cooldown = cooldown
+        self.failures = 0
+        self.retry_at = 0.
+
+    @property
+    def closed(self):
+        return time.monotonic() >= self.retry_at
+
+    def record_success(self):
+        self.failures = 0
+        self.retry_at = 0.
+
+    def record_failure(self):
+        self.failures += 1
+        self.retry_at = time.monotonic() + self.cooldown * 2**min(self.failures - 1, 6)
+
+
+class _SolverMonitor:
+    """Background health tracking of the solvers available to a client.
+
+    A daemon thread refreshes the list of online solvers every ``interval``
+    seconds and prebuilds the sampler attributes derived from each solver,
+    so that a failover can switch to a ready solver without querying
+    :term:`SAPI` or rebuilding the node and edge lists.
+    """
+
+    def __init__(self, client, interval):
+        self.client = client
+        self.interval = interval
+
+        self._breakers = defaultdict(lambda: _CircuitBreaker(interval))
+        self._standby = []  # (solver, attributes) in the configured order
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+        # the thread holds only a weak reference, and stops when the monitor
+        # (and the sampler that owns it) is closed or garbage-collected
+        self._thread = threading.Thread(
+            target=self._run, args=(weakref.ref(self), self._stopped, interval),
+            daemon=True, name='DWaveSampler-monitor')
+        self._thread.start()
+        weakref.finalize(self, self._stopped.set)
+
+    @staticmethod
+    def _run(ref, stopped, interval):
+        while True:
+            monitor = ref()
+            if monitor is None:
+                return
+            try:
+                monitor.refresh()
+            except Exception:
+                # keep the last known solvers until SAPI is reachable
+                pass
+            del monitor
+            if stopped.wait(interval):
+                return
+
+    def refresh(self):
+        """Refresh the online solvers and prebuild their attributes."""
+        with self._lock:
+            previous = {_get_solver_id(solver): attributes
+                        for solver, attributes in self._standby}
+
+        standby = []
+        for solver in _ordered_solvers(self.client, refresh=True):
+            attributes = previous.get(_get_solver_id(solver))
+            if attributes is None:
+                nodelist = sorted(solver.nodes)
+                edgelist = sorted(set((u, v) if u < v else (v, u) for u, v in solver.edges))
+                attributes = dict(_nodelist=nodelist,
+                                  _edgelist=edgelist,
+                                  _structure=_solver_structure(nodelist, edgelist))
+            else:
+                attributes = attributes.copy()
+
+            # properties can be updated without a change of the solver graph
+            attributes.update(_properties=solver.properties.copy(),
+                              _parameters=_solver_parameters(solver.properties))
+            standby.append((solver, attributes))
+
+        with self._lock:
+            self._standby = standby
+
+    def record_success(self, solver_id):
+        with self._lock:
+            self._breakers[solver_id].record_success()
+
+    def record_failure(self, solver_id):
+        with self._lock:
+            self._breakers[solver_id].record_failure()
+
+    def standby(self, exclude):
+        """Return the preferred healthy solver, other than ``exclude``, and
+        its prebuilt attributes, or None if there is none."""
+        with self._lock:
+            candidates = []
+            for rank, (solver, attributes) in enumerate(self._standby):
+                solver_id = _get_solver_id(solver)
+                breaker = self._breakers.get(solver_id)
+                if solver_id == exclude or breaker is not None and not breaker.closed:
+                    continue
+                failures = breaker.failures if breaker is not None else 0
+                candidates.append((failures, rank, solver, attributes))
+
+        if not candidates:
+            return None
+        _, _, solver, attributes = min(candidates, key=lambda c: c[:2])
+        return solver, attributes
+
+    def close(self):
+        self._stopped.set()
+        self._thread.join()
+
+
+class _SolverCache:
+    """On-disk cache of the solver selected for a client configuration.
+
+    Each entry holds the solver's configuration, as returned by :term:`SAPI`,
+    and its sorted node and edge lists as arrays.
+    """
+
+    def __init__(self, directory, config):
+        if directory is True:
+            directory = os.path.join(get_cache_dir(), 'dwave-system-solvers')
+        self.directory = directory
+
+        # everything that affects solver selection, including the token that
+        # determines solver access
+        fields = {field: getattr(config, field, None)
+                  for field in ('endpoint', 'region', 'token', 'client', 'solver')}
+        key = json.dumps(fields, sort_keys=True, default=str)
+        self.path = os.path.join(
+            directory, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '.npz')
+
+    def load(self, client):
+        """Return the cached solver and its sorted node and edge lists, or
+        None if the solver is not cached."""
+        try:
+            with np.load(self.path) as data:
+                solver = StructuredSolver(client=client,
+                                          data=json.loads(data['solver'].item()))
+                nodelist = data['nodelist'].tolist()
+                edgelist = list(map(tuple, data['edgelist'].tolist()))
+        except Exception:
+            # missing, stale or corrupted entries are refetched
+            return None
+        return solver, nodelist, edgelist
+
+    def save(self, solver, nodelist, edgelist):
+        """Save a solver and its sorted node and edge lists."""
+        if not isinstance(solver, StructuredSolver):
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # write atomically so that concurrent processes read complete entries
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.npz')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f,
+                         solver=np.array(_get_solver_data_json(solver)),
+                         nodelist=np.asarray(nodelist, dtype=np.int32),
+                         edgelist=np.asarray(edgelist, dtype=np.int32).reshape(-1, 2))
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
 class DWaveSampler(dimod.Sampler, dimod.Structured):
     r"""Submits binary quadratic models directly to D-Wave quantum computers.
 
@@ -146,6 +380,30 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
 
                Ignored since 1.16.0. See note for ``failover`` parameter above.
 
+        solver_cache (bool or str, optional, default=False):
+            Cache the selected solver on disk, along with its sorted
+            :attr:`.nodelist` and :attr:`.edgelist`, in the given directory or,
+            if ``True``, in a user-local cache directory. Entries are keyed by
+            the configuration that determines solver selection. When an entry
+            exists, the sampler is constructed from it without querying
+            :term:`SAPI`, and the solver is validated online in the
+            background. Validation completes before the first problem is
+            submitted; if the cached solver is no longer available, or has
+            changed, a new solver is selected as on failover (see
+            :meth:`.trigger_failover`) and the cache entry is updated.
+
+        health_check_interval (float, optional, default=None):
+            Track the health of the available solvers in the background,
+            refreshing the list of online solvers every
+            ``health_check_interval`` seconds and preparing the
+            :attr:`.nodelist`, :attr:`.edgelist`, :attr:`.properties` and
+            :attr:`.parameters` of each. A solver that fails is not selected
+            on failover for ``health_check_interval`` seconds, doubled for
+            each consecutive failure, or until it successfully returns a
+            sample set. :meth:`.trigger_failover` then switches to the
+            preferred healthy solver without querying :term:`SAPI`. If
+            ``None``, solver health is not tracked.
+
         **config:
             Keyword arguments passed to
             :meth:`~dwave.cloud.client.Client.from_config`.
@@ -203,7 +461,8 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
             :class:`.DWaveSampler`.
         *   :ref:`qpu_basic_config`.
     """
-    def __init__(self, failover=False, retry_interval=-1, **config):
+    def __init__(self, failover=False, retry_interval=-1, solver_cache=False,
+                 health_check_interval=None, **config):
         # strongly prefer QPU solvers; requires kwarg-level override
         config.setdefault('client', 'qpu')
 
@@ -219,7 +478,30 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
         self._solver_penalty = defaultdict(int)
 
         self.client = Client.from_config(**config)
+
+        self._monitor = None
+        if health_check_interval is not None:
+            self._monitor = _SolverMonitor(self.client, health_check_interval)
+
+        self._solver_cache = None
+        self._validation = None
+        if solver_cache:
+            self._solver_cache = _SolverCache(solver_cache, self.client.config)
+
+            cached = self._solver_cache.load(self.client)
+            if cached is not None:
+                self.solver, self._nodelist, self._edgelist = cached
+
+                # defer the online query, so that it overlaps with other work
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='DWaveSampler')
+                self._validation = executor.submit(self._validate_solver)
+                executor.shutdown(wait=False)
+                return
+
         self.solver = self._get_solver(penalty=self._solver_penalty)
+        if self._solver_cache is not None:
+            self._solver_cache.save(self.solver, self.nodelist, self.edgelist)
 
     def close(self):
         """Close the underlying cloud client to release system resources such as
@@ -231,8 +513,37 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
         See also:
             :meth:`~dwave.cloud.client.Client.close`.
         """
+        if self._monitor is not None:
+            self._monitor.close()
+        self._wait_for_validation(raise_exception=False)
         self.client.close()
 
+    def _validate_solver(self):
+        """Check that the cached solver is still available and unchanged."""
+        filters = copy.deepcopy(self.client.config.solver)
+        filters.pop('order_by', None)
+        solvers = {_get_solver_id(solver): solver
+                   for solver in self.client.get_solvers(order_by=None, **filters)}
+
+        solver = solvers.get(_get_solver_id(self.solver))
+        if solver is None:
+            solver = self._get_solver(penalty=self._solver_penalty)
+        self._set_solver(solver)
+
+        self._solver_cache.save(self.solver, self.nodelist, self.edgelist)
+
+    def _wait_for_validation(self, raise_exception=True):
+        validation = self._validation
+        if validation is None:
+            return
+        try:
+            validation.result()
+        except Exception:
+            if raise_exception:
+                raise
+        finally:
+            self._validation = None
+
     def _get_solver(self, *, refresh: bool = False, penalty: Optional[Dict[str, int]] = None):
         """Get the least penalized solver from the list of solvers filtered and
         ordered according to user config.
@@ -243,11 +554,7 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
         if penalty is None:
             penalty = {}
 
-        # the only solver filters used by `DWaveSampler` are those
-        # propagated to `Client.from_config` on construction
-        filters = copy.deepcopy(self.client.config.solver)
-        order_by = filters.pop('order_by', 'avg_load')
-        solvers = self.client.get_solvers(refresh=refresh, order_by=order_by, **filters)
+        solvers = _ordered_solvers(self.client, refresh=refresh)
 
         # we now just need to de-prioritize penalized solvers
         solvers.sort(key=lambda solver: penalty.get(_get_solver_id(solver), 0))
@@ -311,11 +618,7 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
         try:
             return self._parameters
         except AttributeError:
-            parameters = {param: ['parameters']
-                          for param in self.properties['parameters']}
-            parameters.update(warnings=[])
-            parameters.update(label=[])
-            self._parameters = parameters
+            self._parameters = parameters = _solver_parameters(self.properties)
             return parameters
 
     @property
@@ -366,35 +669,55 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
         return nodelist
 
     def trigger_failover(self):
-        """Trigger a failover and connect to a new solver."""
+        """Trigger a failover and connect to a new solver.
+
+        If solver health is tracked (see the ``health_check_interval``
+        parameter), switches to the preferred healthy solver, which is
+        prepared in the background; otherwise, or if no other solver is
+        healthy, queries :term:`SAPI` for the next solver.
+        """
 
         # penalize the solver that just failed
-        self._solver_penalty[_get_solver_id(self.solver)] += 1
+        solver_id = _get_solver_id(self.solver)
+        self._solver_penalty[solver_id] += 1
 
-        # select the next solver in user-defined preference order, but try to
-        # avoid the penalized (failed) ones
-        self.solver = self._get_solver(refresh=True, penalty=self._solver_penalty)
+        self._wait_for_validation(raise_exception=False)
 
-        # delete the lazily-constructed attributes
-        try:
-            del self._edgelist
-        except AttributeError:
-            pass
+        # failures are recorded when the failed sample set is resolved
+        standby = None
+        if self._monitor is not None:
+            standby = self._monitor.standby(exclude=solver_id)
 
-        try:
-            del self._nodelist
-        except AttributeError:
-            pass
+        if standby is not None:
+            self._set_solver(*standby)
+        else:
+            # select the next solver in user-defined preference order, but try
+            # to avoid the penalized (failed) ones
+            self._set_solver(self._get_solver(refresh=True, penalty=self._solver_penalty))
+
+        if self._solver_cache is not None:
+            self._solver_cache.save(self.solver, self.nodelist, self.edgelist)
+
+    def _set_solver(self, solver, attributes=None):
+        """Switch to ``solver``, resetting the attributes derived from it or
+        setting them to the prebuilt ``attributes``."""
+        if _get_solver_id(solver) == _get_solver_id(self.solver):
+            # the same solver graph, but properties can be updated
+            lazy = ('_parameters', '_properties')
+        else:
+            lazy = ('_edgelist', '_nodelist', '_parameters', '_properties', '_structure')
 
-        try:
-            del self._parameters
-        except AttributeError:
-            pass
+        self.solver = solver
 
-        try:
-            del self._properties
-        except AttributeError:
-            pass
+        # delete the lazily-constructed attributes
+        for name in lazy:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+
+        if attributes is not None:
+            vars(self).update(attributes)
 
     def sample(self, bqm, warnings=None, **kwargs):
         """Sample from the specified binary quadratic model.
@@ -444,10 +767,35 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
 
         """
 
+        timer = StageTimer(self)
+
+        if self._validation is not None:
+            with timer.stage('validation'):
+                self._wait_for_validation()
+
+        with timer.stage('preprocessing'):
+            # check the structure before the problem is encoded for submission
+            try:
+                labels = np.asarray(bqm.variables) if bqm.num_variables else np.empty(0, int)
+            except ValueError:
+                # mixed labels, such as integers and tuples
+                labels = np.empty(0, object)
+            if labels.ndim == 1 and labels.dtype.kind == 'f' and (labels == labels.round()).all():
+                labels = labels.astype(int)
+            elif labels.ndim != 1 or labels.dtype.kind not in 'iu':
+                msg = ("Problem graph incompatible with solver. Please use 'EmbeddingComposite' "
+                       "to map the problem graph to the solver. Variables are not qubits: "
+                       f"{_first([v for v in bqm.variables if not isinstance(v, Integral)])}.")
+                raise BinaryQuadraticModelStructureError(msg)
+
+            _, (irow, icol, _), _ = bqm.to_numpy_vectors(variable_order=bqm.variables)
+            self._validate_structure(labels, labels[irow], labels[icol])
+
         solver = self.solver
 
         try:
-            future = solver.sample_bqm(bqm, **kwargs)
+            with timer.stage('submission'):
+                future = solver.sample_bqm(bqm, **kwargs)
         except ProblemStructureError as exc:
             msg = ("Problem graph incompatible with solver. Please use 'EmbeddingComposite' "
                    "to map the problem graph to the solver.")
@@ -456,26 +804,37 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
         if warnings is None:
             warnings = self.warnings_default
         warninghandler = WarningHandler(warnings)
-        warninghandler.energy_scale(bqm)
+        with timer.stage('warnings'):
+            warninghandler.energy_scale(bqm)
 
+        return self._sampleset_from_future(future, solver, timer, warninghandler)
+
+    def _sampleset_from_future(self, future, solver, timer, warninghandler):
         # need a hook so that we can lazily check the sampleset for warnings
         # and handle failover consistently
         def _hook(computation):
             def resolve(computation):
                 sampleset = computation.sampleset
-                sampleset.resolve()
+                with timer.stage('wait'):
+                    sampleset.resolve()
+
+                if self._monitor is not None:
+                    self._monitor.record_success(_get_solver_id(solver))
 
                 if warninghandler is not None:
-                    warninghandler.too_few_samples(sampleset)
+                    with timer.stage('warnings'):
+                        warninghandler.too_few_samples(sampleset)
                     if warninghandler.action is WarningAction.SAVE:
                         sampleset.info['warnings'] = warninghandler.saved
 
-                return sampleset
+                return timer.update(sampleset)
 
             try:
                 return resolve(computation)
 
             except (ProblemUploadError, RequestTimeout, PollingTimeout) as exc:
+                if self._monitor is not None:
+                    self._monitor.record_failure(_get_solver_id(solver))
                 if not self.failover:
                     raise exc
 
@@ -485,10 +844,12 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
                 raise RetryCondition("resubmit problem") from exc
 
             except (SolverError, InvalidAPIResponseError) as exc:
-                if not self.failover:
-                    raise exc
                 if isinstance(exc, SolverAuthenticationError):
                     raise exc
+                if self._monitor is not None:
+                    self._monitor.record_failure(_get_solver_id(solver))
+                if not self.failover:
+                    raise exc
 
                 # failover on:
                 # - solver offline, solver disabled or not found
@@ -499,6 +860,174 @@ class DWaveSampler(dimod.Sampler, dimod.Structured):
 
         return dimod.SampleSet.from_future(future, _hook)
 
+    @property
+    def _structure_arrays(self):
+        """Active qubits as a mask and active couplers as the sorted keys
+        ``u*n + v``, ``u < v``, where ``n`` is the length of the mask."""
+        try:
+            return self._structure
+        except AttributeError:
+            pass
+
+        self._structure = structure = _solver_structure(self.nodelist, self.edgelist)
+        return structure
+
+    def _validate_structure(self, qubits, row, col):
+        """Check that a problem uses only active qubits and couplers.
+
+        Args:
+            qubits (:class:`numpy.ndarray`): Qubits of the problem.
+            row (:class:`numpy.ndarray`): First qubit of each interaction.
+            col (:class:`numpy.ndarray`): Second qubit of each interaction.
+
+        Raises:
+            :exc:`~dimod.exceptions.BinaryQuadraticModelStructureError`: With
+                the inactive qubits and couplers in the message.
+
+        """
+        active, couplers = self._structure_arrays
+        n = len(active)
+
+        # qubits out of the range of the mask are inactive
+        inactive = (qubits < 0) | (qubits >= n)
+        inactive[~inactive] = ~active[qubits[~inactive]]
+
+        u = np.minimum(row, col)
+        v = np.maximum(row, col)
+        missing = (u < 0) | (v >= n) | (u == v)
+        missing[~missing] = ~np.isin(u[~missing]*n + v[~missing], couplers)
+
+        if inactive.any() or missing.any():
+            msg = ("Problem graph incompatible with solver. Please use 'EmbeddingComposite' "
+                   "to map the problem graph to the solver.")
+            if inactive.any():
+                msg += f" Inactive qubits: {_first(qubits[inactive].tolist())}."
+            if missing.any():
+                msg += (" Inactive couplers: "
+                        f"{_first(list(zip(row[missing].tolist(), col[missing].tolist())))}.")
+            raise BinaryQuadraticModelStructureError(msg)
+
+    def sample_arrays(self, h, row, col, J, offset=0, vartype=dimod.SPIN,
+                      warnings=None, **kwargs):
+        """Sample from a problem given as NumPy arrays indexed by qubit.
+
+        A faster alternative to :meth:`.sample` for problems that are already
+        mapped to qubits. The structure of the problem is checked against
+        :attr:`.nodelist` and :attr:`.edgelist` with array operations, and no
+        :class:`~dimod.BinaryQuadraticModel` is constructed.
+
+        Args:
+            h (array-like):
+                Linear biases indexed by qubit. Qubits with zero bias that are
+                not in any interaction are not part of the problem.
+
+            row (array-like of ints):
+                First qubit of each interaction.
+
+            col (array-like of ints):
+                Second qubit of each interaction.
+
+            J (array-like):
+                Quadratic bias of each interaction. Biases of repeated
+                interactions, in either order, are summed.
+
+            offset (float, optional, default=0):
+                Constant energy offset.
+
+            vartype (:class:`~dimod.Vartype`/str/set, optional, default='SPIN'):
+                Variable type of the problem: ``'SPIN'`` for an Ising model,
+                with ``h`` and ``J`` as its biases, or ``'BINARY'`` for a
+                QUBO, with ``h`` as its diagonal and ``J`` as its
+                off-diagonal elements.
+
+            warnings (:class:`~dwave.system.warnings.WarningAction`, optional):
+                Defines what warning action to take, if any (see the
+                :ref:`system_warnings` section). The default behavior is to
+                ignore warnings.
+
+            **kwargs:
+                Optional keyword arguments for the sampling method, specified
+                per solver in :attr:`.parameters`.
+
+        Returns:
+            :class:`~dimod.SampleSet`: Sample set of the qubits in the
+            problem, as described for :meth:`.sample`.
+
+        Raises:
+            :exc:`~dimod.exceptions.BinaryQuadraticModelStructureError`: If
+                the problem uses an inactive qubit or coupler.
+
+        Examples:
+            This example submits a two-qubit Ising problem.
+
+            >>> import numpy as np
+            >>> from dwave.system import DWaveSampler
+            ...
+            >>> with DWaveSampler() as sampler:     # doctest: +SKIP
+            ...     u, v = sampler.edgelist[0]
+            ...     h = np.zeros(v + 1)
+            ...     h[u] = -1
+            ...     sampleset = sampler.sample_arrays(h, [u], [v], [-1], num_reads=100)
+
+        """
+        timer = StageTimer(self)
+        vartype = dimod.as_vartype(vartype)
+
+        # check the structure of the validated solver
+        if self._validation is not None:
+            with timer.stage('validation'):
+                self._wait_for_validation()
+
+        with timer.stage('preprocessing'):
+            h = np.asarray(h, dtype=np.float64)
+            row = np.asarray(row, dtype=np.int64)
+            col = np.asarray(col, dtype=np.int64)
+            J = np.asarray(J, dtype=np.float64)
+
+            if h.ndim != 1:
+                raise ValueError("h must be a one-dimensional array")
+            if not (row.ndim == 1 and row.shape == col.shape == J.shape):
+                raise ValueError("row, col and J must be one-dimensional arrays "
+                                 "of the same length")
+
+            qubits = np.flatnonzero(h)
+            self._validate_structure(qubits, row, col)
+
+            # sum the biases of repeated interactions
+            n = len(self._structure_arrays[0])
+            keys = np.minimum(row, col)*n + np.maximum(row, col)
+            keys, inverse = np.unique(keys, return_inverse=True)
+            J = np.bincount(inverse.ravel(), weights=J, minlength=len(keys))
+            u, v = np.divmod(keys, n)
+
+            linear = dict(zip(qubits.tolist(), h[qubits].tolist()))
+            quadratic = dict(zip(zip(u.tolist(), v.tolist()), J.tolist()))
+
+        solver = self.solver
+
+        try:
+            with timer.stage('submission'):
+                if vartype is dimod.SPIN:
+                    problem = (linear, quadratic)
+                    future = solver.sample_ising(linear, quadratic, offset=offset, **kwargs)
+                else:
+                    qubo = {(v, v): bias for v, bias in linear.items()}
+                    qubo.update(quadratic)
+                    problem = (qubo,)
+                    future = solver.sample_qubo(qubo, offset=offset, **kwargs)
+        except ProblemStructureError as exc:
+            msg = ("Problem graph incompatible with solver. Please use 'EmbeddingComposite' "
+                   "to map the problem graph to the solver.")
+            raise BinaryQuadraticModelStructureError(msg) from exc
+
+        if warnings is None:
+            warnings = self.warnings_default
+        warninghandler = WarningHandler(warnings)
+        with timer.stage('warnings'):
+            warninghandler.energy_scale(problem)
+
+        return self._sampleset_from_future(future, solver, timer, warninghandler)
+
     def sample_ising(self, h, *args, **kwargs):
         # to be consistent with the cloud-client, we ignore the 0 biases
         # on missing nodes for lists
@@ -18,9 +18,12 @@
 """
 
 import concurrent.futures
+import hashlib
+import threading
 import warnings
 from collections import abc
 from numbers import Number
+from time import monotonic, perf_counter
 from typing import Any, Dict, List, NamedTuple, Optional
 
 import dimod
@@ -28,8 +31,9 @@ import dwave.optimization
 import numpy
 from dwave.cloud.client import Client
 
+from dwave.system.instrumentation import StageTimer
 from dwave.system.samplers import ResultInfoDict
-from dwave.system.utilities import classproperty, FeatureFlags
+from dwave.system.utilities import classproperty, compress_file, FeatureFlags
 
 
 __all__ = ['LeapHybridSampler',
@@ -41,12 +45,129 @@ __all__ = ['LeapHybridSampler',
            ]
 
 
+class _UploadCache:
+    """Futures for the ids of uploaded problem data, by a content hash of the
+    serialized problem.
+
+    Entries expire after ``ttl`` seconds, well within the time problem data
+    is retained by SAPI, and are discarded if the upload, or sampling an
+    uploaded problem, fails. If ``ttl`` is 0 or None, nothing is cached.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._uploads = {}  # digest -> (future, expiry)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(file, chunk_size=2**20):
+        """Hash the contents of a file-like object, then rewind it."""
+        file.seek(0)
+        digest = hashlib.blake2b(digest_size=32)
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+        file.seek(0)
+        return digest.hexdigest()
+
+    def upload(self, file, upload):
+        """Return the key of the file's contents and the id of the uploaded
+        problem, calling ``upload(file)`` only if the contents are not cached.
+        """
+        if not self.ttl:
+            return None, upload(file).result()
+
+        key = self.digest(file)
+        now = monotonic()
+        with self._lock:
+            future, expiry = self._uploads.get(key, (None, 0))
+            if expiry <= now:
+                future = upload(file)
+                self._uploads = {k: entry for k, entry in self._uploads.items() if entry[1] > now}
+                self._uploads[key] = (future, now + self.ttl)
+
+        try:
+            return key, future.result()
+        except Exception:
+            self.discard(key)
+            raise
+
+    def discard(self, key):
+        with self._lock:
+            self._uploads.pop(key, None)
+
+    def watch(self, key, sampleset):
+        """Return a sample set that discards ``key`` if ``sampleset`` fails to
+        resolve, for example because the uploaded problem data expired."""
+        if key is None:
+            return sampleset
+
+        def hook(sampleset):
+            try:
+                sampleset.resolve()
+            except Exception:
+                self.discard(key)
+                raise
+            return sampleset
+
+        return dimod.SampleSet.from_future(sampleset, hook)
+
+
+# uploaded problems are reused for an hour by default
+_UPLOAD_CACHE_TTL = 60 * 60
+
+# problems serialized and uploaded concurrently by each sampler
+_MAX_UPLOAD_WORKERS = 4
+
+
+def _upload_executor(sampler):
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=_MAX_UPLOAD_WORKERS, thread_name_prefix=type(sampler).__name__)
+
+
+def _sampleset_from_submitted(timer, submitted, postprocess=None):
+    """Return a sample set that resolves the sample set returned by the
+    ``submitted`` future, timing only the wait for the solver as the ``wait``
+    stage."""
+    def hook(submitted):
+        sampleset = submitted.result()
+        with timer.stage('wait'):
+            sampleset.resolve()
+        if postprocess is not None:
+            sampleset = postprocess(sampleset)
+        return timer.update(sampleset)
+
+    return dimod.SampleSet.from_future(submitted, hook)
+
+
 class _ScopedSamplerMixin(dimod.Scoped):
     """A mixin that implements ``close`` method to close the underlying cloud
     client. A default context manager that closes resources on exit is
     inherited from :class:`~dimod.Scoped`.
     """
 
+    # executor for serialization and upload, if the sampler uses one
+    _executor = None
+
+    # whether serialized problems are compressed before they are uploaded
+    _compress_uploads = False
+
+    def _init_uploads(self, upload_cache_ttl, compress_uploads):
+        if compress_uploads and 'gzip' not in self.solver.properties.get('supported_compression', ()):
+            raise ValueError("selected solver does not accept gzip-compressed problem data")
+
+        self._upload_cache = _UploadCache(upload_cache_ttl)
+        self._executor = _upload_executor(self)
+        self._compress_uploads = compress_uploads
+
+    def _compress(self, timer, file):
+        """Return the serialized problem, compressed if the sampler compresses
+        uploads. The file is closed if it is replaced."""
+        if not self._compress_uploads:
+            return file
+
+        with file, timer.stage('compression'):
+            return compress_file(file)
+
     def close(self):
         """Close the underlying cloud client to release system resources such as
         threads.
@@ -58,6 +179,8 @@ class _ScopedSamplerMixin(dimod.Scoped):
 
         See: :meth:`~dwave.cloud.client.Client.close`.
         """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
         self.client.close()
 
 
@@ -72,6 +195,17 @@ class LeapHybridSampler(_ScopedSamplerMixin, dimod.Sampler):
     :ref:`cloud_configuration` section.\ [#]_
 
     Args:
+        upload_cache_ttl (float, optional, default=3600):
+            Time, in seconds, for which uploaded problem data is reused when an
+            identical problem is sampled again. If 0 or None, problem data is
+            uploaded for every call.
+
+        compress_uploads (bool, optional, default=False):
+            Compress serialized problems with gzip, in blocks compressed in
+            parallel by :func:`~dwave.system.utilities.compress_file`, before
+            they are uploaded. The solver must list ``'gzip'`` in its
+            ``supported_compression`` property.
+
         **config:
             Keyword arguments passed to
             :meth:`~dwave.cloud.client.Client.from_config`.
@@ -111,7 +245,8 @@ class LeapHybridSampler(_ScopedSamplerMixin, dimod.Sampler):
         return dict(supported_problem_types__contains='bqm',
                     order_by='-properties.version')
 
-    def __init__(self, **config):
+    def __init__(self, upload_cache_ttl=_UPLOAD_CACHE_TTL, compress_uploads=False,
+                 **config):
         # strongly prefer hybrid solvers; requires kwarg-level override
         config.setdefault('client', 'hybrid')
 
@@ -133,6 +268,7 @@ class LeapHybridSampler(_ScopedSamplerMixin, dimod.Sampler):
 
         self.client = Client.from_config(**config)
         self.solver = self.client.get_solver()
+        self._init_uploads(upload_cache_ttl, compress_uploads)
 
         # check user-specified solver conforms to our requirements
         if self.properties.get('category') != 'hybrid':
@@ -195,7 +331,9 @@ class LeapHybridSampler(_ScopedSamplerMixin, dimod.Sampler):
 
         Returns:
             :class:`~dimod.SampleSet`: Sample set constructed from a (non-blocking)
-            :class:`~concurrent.futures.Future`-like object.
+            :class:`~concurrent.futures.Future`-like object. The problem is
+            uploaded in a background thread, so the method returns without
+            waiting for the upload.
 
         Examples:
             This example samples a randomly generated binary quadratic model
@@ -232,25 +370,43 @@ class LeapHybridSampler(_ScopedSamplerMixin, dimod.Sampler):
 
         return self._sample(bqm, time_limit=time_limit, **kwargs)
 
+    def _submit_bqm(self, timer, bqm, ignore_labels, **kwargs):
+        """Serialize, upload and submit the given BQM, returning a sample set."""
+        with timer.stage('serialization'):
+            fv = bqm.to_file(version=2, ignore_labels=ignore_labels)
+
+        fv = self._compress(timer, fv)
+
+        with fv, timer.stage('upload'):
+            key, sapi_problem_id = self._upload_cache.upload(fv, self.solver.upload_bqm)
+
+        with timer.stage('submission'):
+            future = self.solver.sample_bqm(sapi_problem_id, **kwargs)
+
+        return self._upload_cache.watch(key, future.sampleset)
+
     def _sample(self, bqm, **kwargs):
         """Sample from the given BQM."""
-        with bqm.to_file(version=2) as fv:
-            sapi_problem_id = self.solver.upload_bqm(fv).result()
+        timer = StageTimer(self)
+
+        # copy, so the BQM can be modified while it is serialized in the background
+        submitted = self._executor.submit(
+            self._submit_bqm, timer, bqm.copy(), False, **kwargs)
 
-        return self.solver.sample_bqm(sapi_problem_id, **kwargs).sampleset
+        return _sampleset_from_submitted(timer, submitted)
 
     def _sample_large(self, bqm, **kwargs):
         """Sample from the unlabelled version of the BQM, then apply the
         labels to the returned sampleset.
         """
-        with bqm.to_file(version=2, ignore_labels=True) as fv:
-            sapi_problem_id = self.solver.upload_bqm(fv).result()
+        timer = StageTimer(self)
 
-        sampleset = self.solver.sample_bqm(sapi_problem_id, **kwargs).sampleset
+        submitted = self._executor.submit(
+            self._submit_bqm, timer, bqm.copy(), True, **kwargs)
 
-        # relabel, as of dimod 0.9.5+ this is not blocking
         mapping = dict(enumerate(bqm.variables))
-        return sampleset.relabel_variables(mapping)
+        return _sampleset_from_submitted(
+            timer, submitted, lambda sampleset: sampleset.relabel_variables(mapping))
 
     def min_time_limit(self, bqm):
         """Return the minimum ``time_limit`` accepted for the given problem.
@@ -289,6 +445,17 @@ class LeapHybridDQMSampler(_ScopedSamplerMixin):
     :ref:`cloud_configuration` section.\ [#]_
 
     Args:
+        upload_cache_ttl (float, optional, default=3600):
+            Time, in seconds, for which uploaded problem data is reused when an
+            identical problem is sampled again. If 0 or None, problem data is
+            uploaded for every call.
+
+        compress_uploads (bool, optional, default=False):
+            Compress serialized problems with gzip, in blocks compressed in
+            parallel by :func:`~dwave.system.utilities.compress_file`, before
+            they are uploaded. The solver must list ``'gzip'`` in its
+            ``supported_compression`` property.
+
         **config:
             Keyword arguments passed to
             :meth:`~dwave.cloud.client.Client.from_config`.
@@ -348,7 +515,8 @@ class LeapHybridDQMSampler(_ScopedSamplerMixin):
         return dict(supported_problem_types__contains='dqm',
                     order_by='-properties.version')
 
-    def __init__(self, **config):
+    def __init__(self, upload_cache_ttl=_UPLOAD_CACHE_TTL, compress_uploads=False,
+                 **config):
         # strongly prefer hybrid solvers; requires kwarg-level override
         config.setdefault('client', 'hybrid')
 
@@ -370,6 +538,7 @@ class LeapHybridDQMSampler(_ScopedSamplerMixin):
 
         self.client = Client.from_config(**config)
         self.solver = self.client.get_solver()
+        self._init_uploads(upload_cache_ttl, compress_uploads)
 
         # check user-specified solver conforms to our requirements
         if self.properties.get('category') != 'hybrid':
@@ -447,7 +616,9 @@ class LeapHybridDQMSampler(_ScopedSamplerMixin):
 
         Returns:
             :class:`~dimod.SampleSet`: Sample set constructed from a (non-blocking)
-            :class:`~concurrent.futures.Future`-like object.
+            :class:`~concurrent.futures.Future`-like object. The problem is
+            uploaded in a background thread, so the method returns without
+            waiting for the upload.
 
         Examples:
             See the example in :class:`LeapHybridDQMSampler`.
@@ -481,12 +652,35 @@ class LeapHybridDQMSampler(_ScopedSamplerMixin):
             )
             compress = compressed or compress
 
-        with dqm.to_file(compress=compress, ignore_labels=True) as f:
-            sapi_problem_id = self.solver.upload_problem(f).result()
+        timer = StageTimer(self)
+
+        def submit(dqm):
+            with timer.stage('serialization'):
+                f = dqm.to_file(compress=compress, ignore_labels=True)
+
+            f = self._compress(timer, f)
+
+            with f, timer.stage('upload'):
+                key, sapi_problem_id = self._upload_cache.upload(f, self.solver.upload_problem)
+
+            with timer.stage('submission'):
+                future = self.solver.sample_dqm(sapi_problem_id, time_limit=time_limit, **kwargs)
 
-        future = self.solver.sample_dqm(sapi_problem_id, time_limit=time_limit, **kwargs)
+            return key, future
 
-        yield future
+        # copy, so the DQM can be modified while it is sampled in the background
+        dqm = dqm.copy()
+        submitted = self._executor.submit(submit, dqm)
+
+        yield submitted
+
+        key, future = submitted.result()
+        with timer.stage('wait'):
+            try:
+                future.result()
+            except Exception:
+                self._upload_cache.discard(key)
+                raise
 
         sampleset = future.sampleset.relabel_variables(dict(enumerate(dqm.variables)))
 
@@ -496,7 +690,7 @@ class LeapHybridDQMSampler(_ScopedSamplerMixin):
             # to tell which
             sampleset.record.energy = dqm.energies(sampleset)
 
-        yield sampleset
+        yield timer.update(sampleset)
 
     def min_time_limit(self, dqm):
         """Return the minimum ``time_limit`` accepted for the given problem.
@@ -535,6 +729,17 @@ class LeapHybridCQMSampler(_ScopedSamplerMixin):
     :ref:`cloud_configuration` section.\ [#]_
 
     Args:
+        upload_cache_ttl (float, optional, default=3600):
+            Time, in seconds, for which uploaded problem data is reused when an
+            identical problem is sampled again. If 0 or None, problem data is
+            uploaded for every call.
+
+        compress_uploads (bool, optional, default=False):
+            Compress serialized problems with gzip, in blocks compressed in
+            parallel by :func:`~dwave.system.utilities.compress_file`, before
+            they are uploaded. The solver must list ``'gzip'`` in its
+            ``supported_compression`` property.
+
         **config:
             Keyword arguments passed to
             :meth:`~dwave.cloud.client.Client.from_config`.
@@ -597,7 +802,8 @@ class LeapHybridCQMSampler(_ScopedSamplerMixin):
         arguments overrides this specification.
     """
 
-    def __init__(self, **config):
+    def __init__(self, upload_cache_ttl=_UPLOAD_CACHE_TTL, compress_uploads=False,
+                 **config):
         # strongly prefer hybrid solvers; requires kwarg-level override
         config.setdefault('client', 'hybrid')
 
@@ -619,6 +825,7 @@ class LeapHybridCQMSampler(_ScopedSamplerMixin):
 
         self.client = Client.from_config(**config)
         self.solver = self.client.get_solver()
+        self._init_uploads(upload_cache_ttl, compress_uploads)
 
         # For explicitly named solvers:
         if self.properties.get('category') != 'hybrid':
@@ -687,7 +894,9 @@ class LeapHybridCQMSampler(_ScopedSamplerMixin):
 
         Returns:
             :class:`~dimod.SampleSet`: Sample set constructed from a (non-blocking)
-            :class:`~concurrent.futures.Future`-like object.
+            :class:`~concurrent.futures.Future`-like object. The problem is
+            uploaded in a background thread, so the method returns without
+            waiting for the upload.
 
         Examples:
             See the example in :class:`LeapHybridCQMSampler`.
@@ -698,10 +907,14 @@ class LeapHybridCQMSampler(_ScopedSamplerMixin):
             raise TypeError("first argument 'cqm' must be a ConstrainedQuadraticModel, "
                             f"recieved {type(cqm).__name__}")
 
+        timer = StageTimer(self)
+        t0 = perf_counter()
+
         # developer note: this is a temporary fix until
         # https://github.com/dwavesystems/dimod/issues/1303 is fixed
         # and should be reverted afterwards
-        with cqm.to_file() as fcqm:
+        fcqm = cqm.to_file()
+        try:
             data = dimod.serialization.fileview.read_header(
                 fcqm,
                 dimod.constrained.CQM_MAGIC_PREFIX,
@@ -762,9 +975,27 @@ class LeapHybridCQMSampler(_ScopedSamplerMixin):
                     f"{cqm.num_quadratic_variables()}. "
                     f"{contact_sales_str}")
 
-            sapi_problem_id = self.solver.upload_problem(fcqm).result()
+            timer.record('serialization', perf_counter() - t0)
+        except BaseException:
+            fcqm.close()
+            raise
 
-        return self.solver.sample_cqm(sapi_problem_id, time_limit=time_limit, **kwargs).sampleset
+        def submit():
+            f = self._compress(timer, fcqm)
+
+            with f, timer.stage('upload'):
+                key, sapi_problem_id = self._upload_cache.upload(f, self.solver.upload_problem)
+
+            with timer.stage('submission'):
+                future = self.solver.sample_cqm(sapi_problem_id, time_limit=time_limit, **kwargs)
+
+            return self._upload_cache.watch(key, future.sampleset)
+
+        # the model is validated against its serialized form, so only the
+        # upload and submission run in the background
+        submitted = self._executor.submit(submit)
+
+        return _sampleset_from_submitted(timer, submitted)
 
     def min_time_limit(self, cqm: dimod.ConstrainedQuadraticModel) -> float:
         """Return the minimum ``time_limit``, in seconds, accepted for the given
@@ -1008,9 +1239,13 @@ class StrideHybridSolver(_ScopedSamplerMixin):
             self.solver.properties.get("maximum_number_of_states", num_states),
             num_states
         )
-        problem_data_id = self.solver.upload_nlm(model, max_num_states=max_num_states).result()
+        timer = StageTimer(self)
+
+        with timer.stage('upload'):
+            problem_data_id = self.solver.upload_nlm(model, max_num_states=max_num_states).result()
 
-        future = self.solver.sample_nlm(problem_data_id, time_limit=time_limit, **kwargs)
+        with timer.stage('submission'):
+            future = self.solver.sample_nlm(problem_data_id, time_limit=time_limit, **kwargs)
 
         def hook(model, future):
             # TODO: known dwave-optimization bug, don't check header for now
@@ -1019,7 +1254,8 @@ class StrideHybridSolver(_ScopedSamplerMixin):
         model.states.from_future(future, hook)
 
         def collect():
-            timing = future.timing.copy()
+            with timer.stage('wait'):
+                timing = future.timing.copy()
             info = dict(
                 timing=timing,
                 warnings=timing.pop('warnings', []),
@@ -1032,7 +1268,7 @@ class StrideHybridSolver(_ScopedSamplerMixin):
                 # note: no point using stacklevel, as this is a different thread
                 warnings.warn(msg, category=UserWarning)
 
-            return StrideHybridSolver.SampleResult(model, info)
+            return StrideHybridSolver.SampleResult(model, timer.update_info(info))
 
         result = self._executor.submit(collect)
 
@@ -65,33 +65,43 @@ r"""Some notes on the parameter-estimation methods provided below:
     asymmetry or background susceptibility.
 """
 
+import concurrent.futures
+import functools
 import warnings
 import numpy as np
-import networkx as nx
+import numpy.typing as npt
 
 import dimod
-from scipy import optimize
-from typing import Tuple, Union, Optional, Literal, List
-from collections import defaultdict
+from typing import Dict, Hashable, Tuple, Union, Optional, Literal, List
 
 __all__ = [
     "background_susceptibility_bqm",
     "background_susceptibility_ising",
     "effective_field",
     "fast_effective_temperature",
+    "fast_effective_temperature_map",
     "fluxbias_to_h",
     "freezeout_effective_temperature",
     "h_to_fluxbias",
     "Ip_in_units_of_B",
     "maximum_pseudolikelihood",
     "maximum_pseudolikelihood_temperature",
+    "TemperatureAccumulator",
 ]
 
+# multipliers converting to SI units
+_ENERGY_UNITS = {"GHz": 1e9 * 6.62607e-34, "J": 1}  # Plank's constant converts Hz to J
+_CURRENT_UNITS = {"uA": 1e-6, "A": 1}
+_INDUCTANCE_UNITS = {"pH": 1e-12, "H": 1}
+_TEMPERATURE_UNITS = {"mK": 1e-3, "K": 1}
+
 
 def effective_field(
     bqm: dimod.BinaryQuadraticModel,
     samples: Union[None, dimod.SampleSet, Tuple[np.ndarray, list]] = None,
     current_state_energy: bool = False,
+    chunk_size: Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
 ) -> Tuple[np.ndarray, list]:
     r"""Returns the effective field for all variables and all samples.
 
@@ -145,6 +155,13 @@ def effective_field(
             that ``current_state_energy`` is typically negative for positive
             temperature samples, meaning energy is not decreased by flipping the
             spin against its current assignment.
+        chunk_size:
+            Number of samples for which effective fields are computed at a
+            time, bounding the memory used for intermediate results. By
+            default, all samples are processed at once.
+        dtype:
+            Data type of the returned effective fields, for example
+            ``np.float32`` to halve their memory. Defaults to ``np.float64``.
     Returns:
         samples_like:
             A tuple of the effective fields and the variable labels. Effective
@@ -181,15 +198,31 @@ def effective_field(
         bqm = bqm.change_vartype(dimod.SPIN, inplace=False)
         samples = 2 * samples - 1
 
-    h, (irow, icol, qdata), offset = bqm.to_numpy_vectors(variable_order=labels)
-    # eff_field = h + J*s OR diag(Q) + (Q-diag(Q))*b
-    effective_fields = np.tile(h[np.newaxis, :], (samples.shape[0], 1))
-    for sI in range(samples.shape[0]):
-        np.add.at(effective_fields[sI, :], irow, qdata * samples[sI, icol])
-        np.add.at(effective_fields[sI, :], icol, qdata * samples[sI, irow])
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
 
-    if current_state_energy is True:
-        effective_fields = 2 * samples * effective_fields
+    from scipy import sparse  # deferred, as it is slow to import
+
+    h, (irow, icol, qdata), offset = bqm.to_numpy_vectors(variable_order=labels)
+    h = h.astype(dtype, copy=False)
+
+    # eff_field = h + J*s OR diag(Q) + (Q-diag(Q))*b, for all samples at once,
+    # with J the symmetric coupling matrix (repeated entries are summed)
+    num_var = len(h)
+    J = sparse.csr_matrix((np.concatenate((qdata, qdata)).astype(dtype, copy=False),
+                           (np.concatenate((irow, icol)), np.concatenate((icol, irow)))),
+                          shape=(num_var, num_var))
+
+    num_samples = samples.shape[0]
+    step = chunk_size or max(num_samples, 1)
+    effective_fields = np.empty((num_samples, num_var), dtype=dtype)
+    for start in range(0, num_samples, step):
+        s = samples[start:start + step].astype(dtype, copy=False)
+        fields = effective_fields[start:start + step]
+        fields[...] = s @ J
+        fields += h
+        if current_state_energy is True:
+            fields *= 2 * s
 
     return (effective_fields, labels)
 
@@ -266,31 +299,45 @@ def background_susceptibility_ising(
         dh = J @ h  # matched dimensions assumed
         dJ = J @ J  # J = J.T, a square matrix is assumed.
         k = np.sum(np.diagonal(dJ)) / 2
-    else:
-        # Assume h and J have dictionary attributes
-        if len(h):
-            dh = {n: 0 for n in h.keys()}
-            for ij, Jval in J.items():
-                i, j = ij
-                dh[j] += h[i] * Jval
-                dh[i] += h[j] * Jval
-        else:
-            dh = {}
-
-        G = nx.from_edgelist(J.keys())
-        J = {
-            frozenset(e): Jval for e, Jval in J.items()
-        }  # Convert for unambiguous indexing
-        dJ = defaultdict(float)
-        for n in G.nodes():
-            neighs = list(G.neighbors(n))
-            for idx, n1 in enumerate(neighs):
-                for n2 in neighs[idx + 1 :]:
-                    dJ[tuple(frozenset((n1, n2)))] += (
-                        J[frozenset((n, n1))] * J[frozenset((n, n2))]
-                    )
-        dJ = dict(dJ)
-        k = 0
+        return dh, dJ, k
+
+    from scipy import sparse  # deferred, as it is slow to import
+
+    if isinstance(h, np.ndarray) and sparse.issparse(J):
+        dh = J @ h  # matched dimensions assumed
+        dJ = J @ J  # J = J.T, a square matrix is assumed.
+        k = dJ.diagonal().sum() / 2
+        return dh, dJ, k
+
+    # Assume h and J have dictionary attributes
+    index = {n: idx for idx, n in enumerate(h)}
+    for ij in J:
+        for n in ij:
+            index.setdefault(n, len(index))
+    labels = list(index)
+
+    irow = np.fromiter((index[i] for i, _ in J), dtype=np.int64, count=len(J))
+    icol = np.fromiter((index[j] for _, j in J), dtype=np.int64, count=len(J))
+    data = np.fromiter(J.values(), dtype=float, count=len(J))
+    J = sparse.csr_matrix(
+        (np.concatenate((data, data)),
+         (np.concatenate((irow, icol)), np.concatenate((icol, irow)))),
+        shape=(len(labels), len(labels)),
+    )
+
+    h_vector = np.zeros(len(labels))
+    h_vector[:len(h)] = np.fromiter(h.values(), dtype=float, count=len(h))
+    dh = dict(zip(h.keys(), (J @ h_vector)[:len(h)].tolist()))
+
+    # second-order couplings, between variables two couplers apart
+    dJ = (J @ J).tocoo()
+    upper = dJ.row < dJ.col
+    dJ = {
+        (labels[i], labels[j]): Jval
+        for i, j, Jval in zip(dJ.row[upper].tolist(), dJ.col[upper].tolist(),
+                              dJ.data[upper].tolist())
+    }
+    k = 0
 
     return dh, dJ, k
 
@@ -347,12 +394,27 @@ def background_susceptibility_bqm(bqm: dimod.BinaryQuadraticModel, chi: Optional
         of this example gives
         :math:`h_1 + h_2 \chi J_{1,2} = 0.3 + 0.8*(-0.01)*1.2 = 0.2904`.
     """
-    source_type = bqm.vartype
-    bqm = bqm.change_vartype(dimod.SPIN)
-    dh, dJ, _ = background_susceptibility_ising(bqm.linear, bqm.quadratic)
-    dbqm = dimod.BinaryQuadraticModel(source_type).from_ising(dh, dJ)
+    from scipy import sparse  # deferred, as it is slow to import
+
+    labels = list(bqm.variables)
+    h, (irow, icol, qdata), _ = bqm.spin.to_numpy_vectors(variable_order=labels)
+    num_var = len(h)
+    J = sparse.csr_matrix(
+        (np.concatenate((qdata, qdata)),
+         (np.concatenate((irow, icol)), np.concatenate((icol, irow)))),
+        shape=(num_var, num_var),
+    )
+    dh, dJ, _ = background_susceptibility_ising(h, J)
+
+    dJ = dJ.tocoo()
+    upper = dJ.row < dJ.col
+    dbqm = dimod.BinaryQuadraticModel.from_numpy_vectors(
+        dh, (dJ.row[upper], dJ.col[upper], dJ.data[upper]), 0, dimod.SPIN,
+        variable_order=labels,
+    )
+    dbqm.change_vartype(bqm.vartype, inplace=True)
     if chi is not None:
-        dbqm = bqm.change_vartype(source_type) + chi * dbqm
+        dbqm = bqm + chi * dbqm
     return dbqm
 
 
@@ -586,7 +648,31 @@ def _x_bootstrap_pseudo_likelihood(en1, max_excitation, num_bootstrap_samples):
     return x, x_bootstraps
 
 
-def _create_d_mean_log_pseudo_likelihood(en1, degenerate_fields, sample_weights):
+class _ExponentialFactor:
+    """Calculate ``exp(sum_i x_i en1_i)`` for multi-parameter estimation.
+
+    Root finding evaluates the derivative and the Jacobian at the same points,
+    so the last result is reused.
+    """
+
+    def __init__(self, en1):
+        self.fields = en1.reshape(en1.shape[0], -1)
+        self._x = None
+        self._value = None
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        if self._x is None or not np.array_equal(x, self._x):
+            with warnings.catch_warnings():  # Overflow errors are safe
+                warnings.simplefilter(action="ignore", category=RuntimeWarning)
+                self._value = np.exp(x @ self.fields)
+            self._x = x.copy()
+        return self._value
+
+
+def _create_d_mean_log_pseudo_likelihood(
+    en1, degenerate_fields, sample_weights, exp_factor=None
+):
     """Construct d_mean_log_pseudo_likelihood function for root finding routine."""
     if en1.ndim == 2 or en1.shape[0] == 1:
         # Derivative of mean (w.r.t samples) log pseudo liklihood amounts
@@ -627,21 +713,20 @@ def _create_d_mean_log_pseudo_likelihood(en1, degenerate_fields, sample_weights)
                 "Exploiting degenerate multi-dimensional fields is not supported."
             )
 
+        if exp_factor is None:
+            exp_factor = _ExponentialFactor(en1)
+        # fields and sample weights flattened over samples and variables
+        fields = exp_factor.fields
+        weights = np.repeat(sample_weights, en1.shape[-1])
+
         def d_mean_log_pseudo_likelihood(x):
-            with warnings.catch_warnings():  # Overflow errors are safe
-                warnings.simplefilter(action="ignore", category=RuntimeWarning)
-                expFactor = np.exp(np.sum(en1 * x[:, np.newaxis, np.newaxis], axis=0))
-            return np.sum(
-                sample_weights[np.newaxis, :]
-                * np.sum(en1 / (1 + expFactor[np.newaxis, :, :]), axis=-1),
-                axis=-1,
-            )
+            return fields @ (weights / (1 + exp_factor(x)))
 
     return d_mean_log_pseudo_likelihood
 
 
 def _create_dd_mean_log_pseudo_likelihood(
-    en1, degenerate_fields, sample_weights, use_jacobian
+    en1, degenerate_fields, sample_weights, use_jacobian, exp_factor=None
 ):
     """Construct dd_mean_log_pseudo_likelihood function for root finding routine."""
     if use_jacobian is False:
@@ -675,28 +760,130 @@ def _create_dd_mean_log_pseudo_likelihood(
                 return -np.sum(sample_weights * np.sum(en1 * en1 / norm, axis=1))
 
     else:
+        if exp_factor is None:
+            exp_factor = _ExponentialFactor(en1)
+        # fields and sample weights flattened over samples and variables
+        fields = exp_factor.fields
+        weights = np.repeat(sample_weights, en1.shape[-1])
 
         def dd_mean_log_pseudo_likelihood(x):  # jacobian
-            # [Only] If few Hamiltonians efficient, this is the expected use case
+            expFactor = exp_factor(x)
             with warnings.catch_warnings():  # expFactor=Inf causes an irrelevant warning
                 warnings.simplefilter(action="ignore", category=RuntimeWarning)
-                expFactor = np.exp(np.sum(en1 * x[:, np.newaxis, np.newaxis], axis=0))
                 norm = expFactor + 2 + 1 / expFactor
-            return -np.sum(
-                [
-                    [
-                        sample_weights
-                        * np.sum(en1[i, :, :] * en1[j, :, :] / norm, axis=1)
-                        for i in range(en1.shape[0])
-                    ]
-                    for j in range(en1.shape[0])
-                ],
-                axis=-1,
-            )
+            return -(fields * (weights / norm)) @ fields.T
 
     return dd_mean_log_pseudo_likelihood
 
 
+def _bootstrap_pseudo_likelihood(en1, seed_sequence, kwargs):
+    """Estimate parameters for one bootstrap resample of the samples."""
+    num_samples = en1.shape[-2]
+    indices = np.random.default_rng(seed_sequence).integers(num_samples, size=num_samples)
+    x_bs, _ = maximum_pseudolikelihood(
+        en1=en1[..., indices, :], num_bootstrap_samples=0, **kwargs
+    )
+    return x_bs
+
+
+_bootstrap_en1 = None  # effective fields shared by the tasks of a worker process
+
+
+def _init_bootstrap_worker(en1):
+    global _bootstrap_en1
+    _bootstrap_en1 = en1
+
+
+def _bootstrap_worker(seed_sequence, kwargs):
+    return _bootstrap_pseudo_likelihood(_bootstrap_en1, seed_sequence, kwargs)
+
+
+def _batched_newton_pseudo_likelihood(en1_u, counts, x0, tol=1.48e-8, maxiter=50):
+    """Estimate the scalar parameter for many histograms of effective fields.
+
+    Row ``k`` of ``counts`` holds the weight of each of the unique fields
+    ``en1_u`` in the ``k``-th problem; Newton iterations run for all problems
+    together, starting from ``x0``. Returns NaN for problems that do not
+    converge.
+    """
+    # problems of local minima (or maxima) only have an infinite (or, for
+    # zero fields, unconstrained) estimate
+    present = counts > 0
+    max_excitation = np.where(present, en1_u, -np.inf).max(axis=1)
+    min_excitation = np.where(present, en1_u, np.inf).min(axis=1)
+    special = max_excitation * min_excitation >= 0
+    if np.any(special & (max_excitation == 0)):
+        warnings.warn(
+            "All local fields are zero, there is no gradient and the "
+            "parameter value is unconstrained. Zero is assigned."
+        )
+
+    x = np.array(np.broadcast_to(x0, len(counts)), dtype=float)
+    with warnings.catch_warnings():  # 0 * inf for zero fields
+        warnings.simplefilter(action="ignore", category=RuntimeWarning)
+        x[special] = np.where(
+            max_excitation[special] == 0, 0, np.sign(max_excitation[special]) * np.inf
+        )
+
+    converged = special.copy()
+    active = np.flatnonzero(~special)
+    for _ in range(maxiter):
+        if not len(active):
+            break
+        with warnings.catch_warnings():  # Overflow errors are safe
+            warnings.simplefilter(action="ignore", category=RuntimeWarning)
+            expFactor = np.exp(np.outer(x[active], en1_u))
+            d = np.sum(counts[active] * (en1_u / (1 + expFactor)), axis=1)
+            dd = -np.sum(
+                counts[active] * (en1_u * en1_u / (expFactor + 2 + 1 / expFactor)), axis=1
+            )
+            step = d / dd
+        x[active] -= step
+
+        done = np.abs(step) <= tol
+        converged[active[done]] = True
+        active = active[~done & np.isfinite(step)]
+
+    x[~converged] = np.nan
+    return x
+
+
+def _batched_bootstrap_pseudo_likelihood(en1, x0, seeds, tol=1.48e-8, maxiter=50):
+    """Estimate the scalar parameter for all bootstrap resamples at once.
+
+    Effective fields are histogrammed, and each resample is represented by
+    the number of occurrences of each unique field, so that Newton iterations
+    run for all resamples together. Returns NaN for resamples that do not
+    converge.
+    """
+    from scipy import sparse  # deferred, as it is slow to import
+
+    num_samples, num_var = en1.shape
+    en1_u, inverse = np.unique(en1, return_inverse=True)
+
+    # occurrences of each unique field in each sample
+    occurrences = sparse.csr_matrix(
+        (np.ones(en1.size), (np.repeat(np.arange(num_samples), num_var), inverse.ravel())),
+        shape=(num_samples, len(en1_u)),
+    )
+
+    x_bootstraps = np.empty(len(seeds))
+    block = max(1, 2**22 // max(len(en1_u), num_samples))  # bounds memory
+    for start in range(0, len(seeds), block):
+        multiplicities = np.array([
+            np.bincount(
+                np.random.default_rng(seed_sequence).integers(num_samples, size=num_samples),
+                minlength=num_samples,
+            )
+            for seed_sequence in seeds[start:start + block]
+        ], dtype=float)
+        counts = multiplicities @ occurrences
+        x_bootstraps[start:start + block] = _batched_newton_pseudo_likelihood(
+            en1_u, counts, x0, tol, maxiter)
+
+    return x_bootstraps
+
+
 def maximum_pseudolikelihood(
     en1: Optional[np.ndarray] = None,
     bqms: Union[None, List[dimod.BinaryQuadraticModel]] = None,
@@ -710,6 +897,7 @@ def maximum_pseudolikelihood(
     return_optimize_object: bool = False,
     degenerate_fields: Optional[bool] = None,
     use_jacobian: bool = True,
+    max_workers: Optional[int] = None,
 ) -> Tuple:
     r"""Maximimum pseudolikelihood estimator for exponential models.
 
@@ -760,8 +948,14 @@ def maximum_pseudolikelihood(
             bias if samples are uncorrelated. Currently supported for samplesets
             only with uniform ``sample_weights``; an aggregated or weighted
             sampleset must be disaggregated (raw format) with repetitions.
+            For a single BQM, with the default ``optimize_method``, all
+            bootstrap estimators are calculated together by Newton's method,
+            unless ``kwargs_opt`` sets options other than ``xtol`` and
+            ``maxiter``.
         seed: Seeds the bootstrap method (if provided), allowing reproducibility
-            of the estimators.
+            of the estimators. Each resample is drawn by its own
+            :class:`numpy.random.Generator`, so the estimators do not depend on
+            ``max_workers``.
         x0: Initial guess for the fitting parameters. Should have the same
             length as ``bqms``, when provided.
         optimize_method (str, optional, default=None):
@@ -791,6 +985,10 @@ def maximum_pseudolikelihood(
             methods. The associated complexity of this non-essential calculation
             is quadratic in ``len(bqms)``; use of the second derivative is
             disabled by setting this parameter to False.
+        max_workers: Number of processes used to calculate bootstrap
+            estimators that are calculated one at a time, for example for
+            multiple BQMs. By default, or if 1, estimators are calculated in
+            the calling process.
     Returns:
         Tuple: Optimal parameters and a list of bootstrapped estimates
         (``x_estimate``, ``x_bootstrap_estimates``):
@@ -881,10 +1079,15 @@ def maximum_pseudolikelihood(
                 x0 = np.zeros(en1.shape[0])
                 x0[0] = -1 / max_excitation[0]  # Smallest gap
 
+        # shared between the derivative and the jacobian
+        exp_factor = _ExponentialFactor(en1) if en1.ndim == 3 else None
+
         d_mean_log_pseudo_likelihood = _create_d_mean_log_pseudo_likelihood(
-            en1, degenerate_fields, sample_weights
+            en1, degenerate_fields, sample_weights, exp_factor
         )
 
+        from scipy import optimize  # deferred, as it is slow to import
+
         if optimize_method == "bisect" and en1.ndim == 2:
             bisect_bracket = kwargs_opt.pop("bracket", (1e-3, 1000))
             # bisect can be relatively robust, since we can have a problem of
@@ -919,7 +1122,7 @@ def maximum_pseudolikelihood(
             # given large variance in effective fields or poor initial condition
             # choices.
             dd_mean_log_pseudo_likelihood = _create_dd_mean_log_pseudo_likelihood(
-                en1, degenerate_fields, sample_weights, use_jacobian
+                en1, degenerate_fields, sample_weights, use_jacobian, exp_factor
             )
 
             # Use of root finding routines are preferred to fsolve; best option
@@ -947,30 +1150,44 @@ def maximum_pseudolikelihood(
                 raise ValueError(
                     "Bootstraps require uniform sample_weights (num_occurrences)"
                 )
-            prng = np.random.RandomState(seed)
-            num_samples = en1.shape[0]
-            x_bootstraps = []
-            for _ in range(num_bootstrap_samples):
-                indices = prng.choice(num_samples, num_bootstrap_samples, replace=True)
-                if en1.ndim == 2:
-                    x_bs, _ = maximum_pseudolikelihood(
-                        en1=en1[indices, :],
-                        num_bootstrap_samples=0,
-                        x0=x,
-                        optimize_method=optimize_method,
-                        kwargs_opt=kwargs_opt,
-                        return_optimize_object=return_optimize_object,
-                    )
-                else:
-                    x_bs, _ = maximum_pseudolikelihood(
-                        en1=en1[:, indices, :],
-                        num_bootstrap_samples=0,
-                        x0=x,
-                        optimize_method=optimize_method,
-                        kwargs_opt=kwargs_opt,
-                        return_optimize_object=return_optimize_object,
-                    )
-                x_bootstraps.append(x_bs)
+            # one independent stream per resample, so that estimates do not
+            # depend on how resamples are distributed between processes
+            seeds = np.random.SeedSequence(seed).spawn(num_bootstrap_samples)
+            kwargs_bs = dict(
+                x0=x,
+                optimize_method=optimize_method,
+                kwargs_opt=kwargs_opt,
+                return_optimize_object=return_optimize_object,
+            )
+
+            # the batched Newton iterations honour only the tolerance and
+            # the iteration limit of the optimization arguments
+            if (en1.ndim == 2 and optimize_method is None and not return_optimize_object
+                    and kwargs_opt.keys() <= {"xtol", "maxiter"}):
+                x_bootstraps = _batched_bootstrap_pseudo_likelihood(
+                    en1, x, seeds, tol=kwargs_opt.get("xtol", 1.48e-8),
+                    maxiter=kwargs_opt.get("maxiter", 50))
+
+                # resamples for which Newton's method failed are solved one
+                # at a time, as in the general case
+                for i in np.flatnonzero(np.isnan(x_bootstraps)):
+                    x_bootstraps[i] = _bootstrap_pseudo_likelihood(en1, seeds[i], kwargs_bs)
+            elif max_workers is not None and max_workers > 1:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_bootstrap_worker,
+                    initargs=(en1,),
+                ) as executor:
+                    x_bootstraps = list(executor.map(
+                        functools.partial(_bootstrap_worker, kwargs=kwargs_bs),
+                        seeds,
+                        chunksize=-(-num_bootstrap_samples // (4 * max_workers)),
+                    ))
+            else:
+                x_bootstraps = [
+                    _bootstrap_pseudo_likelihood(en1, seed_sequence, kwargs_bs)
+                    for seed_sequence in seeds
+                ]
 
             if return_optimize_object is False:
                 x_bootstraps = np.array(x_bootstraps)
@@ -991,6 +1208,229 @@ def maximum_pseudolikelihood(
     return x, x_bootstraps
 
 
+class TemperatureAccumulator:
+    r"""Accumulate a maximum-pseudolikelihood temperature estimate across many
+    sample sets.
+
+    Only a weighted histogram of the effective fields (as returned by
+    :func:`effective_field` with ``current_state_energy=True``) is kept, so
+    samples can be discarded after each update and memory is bounded by
+    ``max_bins``. The estimate of :func:`maximum_pseudolikelihood_temperature`
+    for all the accumulated samples, and its confidence interval, are
+    available at any time, without bootstrapping.
+
+    The confidence interval is derived from the asymptotic (sandwich) variance
+    of the estimator, which treats the effective fields as independent. For
+    strongly correlated models, where the fields of the variables of a sample
+    are not independent, the interval can be optimistic.
+
+    Args:
+        bqm: Binary quadratic model describing the sample distribution,
+            used if none is given to :meth:`update`.
+        max_bins: Maximum number of distinct effective fields kept. When
+            exceeded, fields are merged into ``max_bins`` bins of equal width,
+            each represented by its weighted mean field. If ``None``, all
+            distinct fields are kept, which is exact and bounded for models
+            of low precision.
+
+    Examples:
+        This example accumulates a temperature estimate over several sample
+        sets for a spin glass.
+
+        >>> import dimod
+        >>> from dwave.system import DWaveSampler
+        >>> from dwave.system.temperatures import TemperatureAccumulator
+        >>> from random import random
+        ...
+        >>> sampler = DWaveSampler()
+        >>> bqm = dimod.BQM.from_ising({}, {e: 1-2*random() for e in sampler.edgelist})
+        >>> accumulator = TemperatureAccumulator(bqm)
+        >>> for _ in range(5):
+        ...     accumulator.update(sampler.sample(bqm, num_reads=100, auto_scale=False))
+        >>> print(accumulator.temperature(), accumulator.confidence_interval())    # doctest: +SKIP
+        0.2358 (0.2307, 0.2411)
+
+    """
+
+    def __init__(self, bqm: Optional[dimod.BinaryQuadraticModel] = None,
+                 max_bins: Optional[int] = 2**16):
+        if max_bins is not None and max_bins < 1:
+            raise ValueError("max_bins must be a positive integer")
+
+        self.bqm = bqm
+        self.max_bins = max_bins
+
+        self.fields = np.empty(0)
+        self.weights = np.empty(0)
+        self.num_samples = 0.0
+
+        self._x = None  # estimate of the parameter, -1/T, if up to date
+        self._x0 = None  # last estimate
+
+    fields = None  # overwritten by init
+    """:class:`numpy.ndarray`: Distinct effective fields, in increasing order."""
+
+    weights = None  # overwritten by init
+    """:class:`numpy.ndarray`: Total weight of each of the :attr:`fields`."""
+
+    num_samples = None  # overwritten by init
+    """float: Total weight (number of occurrences) of the accumulated samples."""
+
+    def update(self,
+               sampleset: Union[dimod.SampleSet, Tuple[np.ndarray, List]],
+               sample_weights: Optional[np.ndarray] = None,
+               bqm: Optional[dimod.BinaryQuadraticModel] = None):
+        """Add the effective fields of the given samples.
+
+        Args:
+            sampleset: Set of samples, as a :class:`~dimod.SampleSet` or a
+                ``samples_like`` object; see :func:`~dimod.as_samples`.
+            sample_weights: Weights of the samples, as numbers of occurrences.
+                Defaults to ``sampleset.record.num_occurrences`` for a
+                :class:`~dimod.SampleSet` and to 1 otherwise.
+            bqm: Binary quadratic model describing the distribution of the
+                samples. Defaults to the model given on construction.
+
+        """
+        if bqm is None:
+            bqm = self.bqm
+        if bqm is None:
+            raise ValueError("a bqm must be given, on construction or update")
+
+        en1, _ = effective_field(bqm, sampleset, current_state_energy=True)
+
+        if sample_weights is None:
+            if isinstance(sampleset, dimod.SampleSet):
+                sample_weights = sampleset.record.num_occurrences
+            else:
+                sample_weights = np.ones(en1.shape[0])
+        sample_weights = np.asarray(sample_weights, dtype=float)
+
+        if sample_weights.shape != en1.shape[:1]:
+            raise ValueError(
+                "The sample weights must match the sampleset shape, "
+                f"sample_weights.shape={sample_weights.shape}, en1.shape[0]=={en1.shape[0]}"
+            )
+        if np.any(sample_weights < 0):
+            raise ValueError("sample weights must be non-negative")
+
+        fields = np.concatenate((self.fields, en1.ravel()))
+        weights = np.concatenate((self.weights, np.repeat(sample_weights, en1.shape[1])))
+
+        self.fields, inverse = np.unique(fields, return_inverse=True)
+        self.weights = np.bincount(inverse.ravel(), weights=weights,
+                                   minlength=len(self.fields))
+
+        if self.max_bins is not None and len(self.fields) > self.max_bins:
+            self._merge_bins()
+
+        keep = self.weights > 0
+        self.fields = self.fields[keep]
+        self.weights = self.weights[keep]
+
+        self.num_samples += float(sample_weights.sum())
+        self._x = None
+
+    def _merge_bins(self):
+        """Merge the fields into ``max_bins`` bins of equal width."""
+        low, high = self.fields[0], self.fields[-1]
+        bins = ((self.fields - low) * (self.max_bins / (high - low))).astype(np.int64)
+        np.minimum(bins, self.max_bins - 1, out=bins)
+
+        weights = np.bincount(bins, weights=self.weights, minlength=self.max_bins)
+        moments = np.bincount(bins, weights=self.weights * self.fields,
+                              minlength=self.max_bins)
+        with np.errstate(invalid="ignore"):  # empty bins are dropped
+            self.fields = moments / weights
+        self.weights = weights
+
+        keep = weights > 0
+        order = np.argsort(self.fields[keep], kind="stable")
+        self.fields = self.fields[keep][order]
+        self.weights = self.weights[keep][order]
+
+    def _estimate(self):
+        """Return the estimate of the parameter, -1/T, for the accumulated fields."""
+        if not self.weights.sum():
+            raise ValueError("no samples with positive weight have been accumulated")
+
+        if self._x is None:
+            # warm start from the previous estimate
+            x0 = self._x0 if self._x0 is not None and -np.inf < self._x0 < 0 else None
+
+            x, _ = maximum_pseudolikelihood(
+                en1=self.fields[:, np.newaxis],
+                sample_weights=self.weights,
+                x0=x0,
+                degenerate_fields=False,  # already distinct
+            )
+            self._x = self._x0 = float(x)
+
+        return self._x
+
+    def temperature(self) -> float:
+        """Maximum-pseudolikelihood temperature of the accumulated samples.
+
+        Returns:
+            float: Temperature estimate, 0 if only local minima (without
+            excitations) have been accumulated.
+
+        """
+        x = self._estimate()
+        return -1 / x if x else float("inf")
+
+    def standard_error(self) -> float:
+        r"""Asymptotic standard error of the estimate of the inverse
+        temperature, :math:`\beta = 1/T`.
+
+        Returns:
+            float: Standard error, NaN if the estimate is not finite.
+
+        """
+        x = self._estimate()
+        if not np.isfinite(x):
+            return float("nan")
+
+        # sandwich variance of the estimating equation sum_f w f p(f) = 0
+        with warnings.catch_warnings():  # Overflow errors are safe
+            warnings.simplefilter(action="ignore", category=RuntimeWarning)
+            p = 1 / (1 + np.exp(x * self.fields))
+        score = self.fields * p
+        information = np.sum(self.weights * score * (self.fields - score))
+        variance = np.sum(self.weights * score * score) / information**2
+        return float(np.sqrt(variance))
+
+    def confidence_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """Confidence interval of the temperature estimate.
+
+        Args:
+            confidence: Confidence level of the interval.
+
+        Returns:
+            Tuple: Lower and upper bounds on the temperature. The upper bound
+            is infinite if the interval of the inverse temperature includes 0,
+            and both bounds are the estimate if it is not finite.
+
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+
+        x = self._estimate()
+        if not np.isfinite(x):
+            T = self.temperature()
+            return T, T
+
+        from statistics import NormalDist
+
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        width = z * self.standard_error()
+
+        # T = -1/x increases with x for x < 0
+        low = -1 / (x - width)
+        high = -1 / (x + width) if x + width < 0 else float("inf")
+        return low, high
+
+
 def Ip_in_units_of_B(
     Ip: Union[None, float, np.ndarray] = None,
     B: Union[None, float, np.ndarray] = 1.391,
@@ -1059,31 +1499,29 @@ def Ip_in_units_of_B(
         >>> from dwave.system.temperatures import Ip_in_units_of_B
         >>> ip = Ip_in_units_of_B(B=2.308, units_B="GHz", MAFM=2.113, units_MAFM="pH")
     """
-    h = 6.62607e-34  # Plank's constant for converting energy in Hertz to Joules
     Phi0 = 2.0678e-15  # superconducting magnetic flux quantum (h/2e); units: Weber=J/A
 
-    if units_B == "GHz":
-        B_multiplier = 1e9 * h  # D-Wave schedules use GHz by convention
-    elif units_B == "J":
-        B_multiplier = 1
-    else:
+    try:
+        B_multiplier = _ENERGY_UNITS[units_B]  # To Joules
+    except KeyError:
         raise ValueError(
             "Schedule B must be in units GHz or J, " f"but given {units_B}"
-        )
+        ) from None
     if Ip is None:
-        B = B * B_multiplier  # To Joules
-        if units_MAFM == "pH":
-            MAFM = MAFM * 1e-12  # conversion from picohenry to Henry
-        elif units_MAFM != "H":
+        try:
+            MAFM = MAFM * _INDUCTANCE_UNITS[units_MAFM]  # To Henry
+        except KeyError:
             raise ValueError(
                 "MAFM must be in units pH or H, " f"but given {units_MAFM}"
-            )
-        Ip = np.sqrt(B / (2 * MAFM))  # Units of A = C/s, O(1e-6)
+            ) from None
+        Ip = np.sqrt(B * B_multiplier / (2 * MAFM))  # Units of A = C/s, O(1e-6)
     else:
-        if units_Ip == "uA":
-            Ip = Ip * 1e-6  # Conversion from microamps to amp
-        elif units_Ip != "A":
-            raise ValueError("Ip must be in units uA or A, " f"but given {units_Ip}")
+        try:
+            Ip = Ip * _CURRENT_UNITS[units_Ip]  # To amps
+        except KeyError:
+            raise ValueError(
+                "Ip must be in units uA or A, " f"but given {units_Ip}"
+            ) from None
 
     return Ip * Phi0 / B_multiplier
 
@@ -1312,26 +1750,46 @@ def freezeout_effective_temperature(
         agreement with estimates by this function at reported single-qubit
         freeze-out values :math:`s^*` and device physical parameters.
     """
-    # Convert units_B to Joules
-    if units_B == "GHz":
-        h = 6.62607e-34  # J/Hz
-        freezeout_B *= h * 1e9
-    elif units_B == "J":
-        pass
-    else:
-        raise ValueError("Units must be 'J' (Joules) or 'mK' (milli-Kelvin)")
-
-    if units_T == "mK":
-        temperature = temperature * 1e-3
-    elif units_T == "K":
-        pass
-    else:
-        raise ValueError("Units must be 'K' (Kelvin) or 'mK' (milli-Kelvin)")
+    try:
+        freezeout_B = freezeout_B * _ENERGY_UNITS[units_B]  # To Joules
+    except KeyError:
+        raise ValueError("Units must be 'J' (Joules) or 'GHz' (Giga-Hertz)") from None
+
+    try:
+        temperature = temperature * _TEMPERATURE_UNITS[units_T]  # To Kelvin
+    except KeyError:
+        raise ValueError("Units must be 'K' (Kelvin) or 'mK' (milli-Kelvin)") from None
     kB = 1.3806503e-23  # Joules/Kelvin
 
     return 2 * temperature * kB / freezeout_B
 
 
+def _fast_temperature_sampler_params(num_reads, sampler_params):
+    """Return the sampler parameters for single-qubit temperature estimation."""
+    # Create local sampling_params copy - default necessary additional fields:
+    if sampler_params is None:
+        sampler_params0 = {}
+    else:
+        sampler_params0 = sampler_params.copy()
+    if num_reads is None:
+        # Default is 1000, makes efficient use of QPU access time:
+        if "num_reads" not in sampler_params0:
+            sampler_params0["num_reads"] = 1000
+    elif sampler_params0.get("num_reads", num_reads) != num_reads:
+        raise ValueError(
+            "sampler_params['num_reads'] != num_reads, incompatible input arguments."
+        )
+    else:
+        sampler_params0["num_reads"] = num_reads
+    if "auto_scale" in sampler_params0 and sampler_params0["auto_scale"] is not False:
+        raise ValueError(
+            "sampler_params['auto_scale'] == False, is required by this method."
+        )
+    else:
+        sampler_params0["auto_scale"] = False
+    return sampler_params0
+
+
 def fast_effective_temperature(
     sampler: dimod.Sampler,
     num_reads: Optional[int] = None,
@@ -1390,7 +1848,7 @@ def fast_effective_temperature(
         num_bootstrap_samples (int, optional, default=0):
             Number of bootstrap samples to use for estimation of the standard
             error. By default no bootstrapping is performed and the standard
-            error defaults to 0.
+            error defaults to 0. If None, the number of reads is used.
 
     Returns:
         Tuple[float, float]:
@@ -1452,27 +1910,7 @@ def fast_effective_temperature(
         {var: h_values[idx] for idx, var in enumerate(nodelist)}, {}
     )
 
-    # Create local sampling_params copy - default necessary additional fields:
-    if sampler_params is None:
-        sampler_params0 = {}
-    else:
-        sampler_params0 = sampler_params.copy()
-    if num_reads is None:
-        # Default is 1000, makes efficient use of QPU access time:
-        if "num_reads" not in sampler_params0:
-            sampler_params0["num_reads"] = 1000
-    elif sampler_params0.get("num_reads") != num_reads:
-        raise ValueError(
-            "sampler_params['num_reads'] != num_reads, incompatible input arguments."
-        )
-    else:
-        sampler_params0["num_reads"] = num_reads
-    if "auto_scale" in sampler_params0 and sampler_params0["auto_scale"] is not False:
-        raise ValueError(
-            "sampler_params['auto_scale'] == False, is required by this method."
-        )
-    else:
-        sampler_params0["auto_scale"] = False
+    sampler_params0 = _fast_temperature_sampler_params(num_reads, sampler_params)
 
     if num_bootstrap_samples is None:
         num_bootstrap_samples = sampler_params0["num_reads"]
@@ -1490,3 +1928,184 @@ def fast_effective_temperature(
         return T, np.float64(0.0)
     else:
         return T, np.sqrt(np.var(Tboot))
+
+
+def fast_effective_temperature_map(
+    sampler: dimod.Sampler,
+    h_range: Union[Tuple, Dict[Hashable, Tuple]] = (-1 / 6.1, 1 / 6.1),
+    regions: Optional[Dict[Hashable, List]] = None,
+    num_reads: Optional[int] = None,
+    seed: Union[None, int, np.random.RandomState] = None,
+    sampler_params: dict = None,
+    num_bootstrap_samples: Optional[int] = 0,
+) -> Dict[Hashable, Tuple[np.float64, np.float64]]:
+    r"""Estimate the effective temperatures of several regions of a sampler,
+    or for several ranges of external fields, with one sampling call.
+
+    This function generalizes :func:`fast_effective_temperature` to many
+    estimates: single-qubit problems, with external fields drawn from a range
+    for each region, are programmed onto disjoint subsets of qubits and
+    submitted to the sampler as one problem. The temperature of each region
+    is then inferred from its qubits' samples, with the estimates for all
+    regions calculated together.
+
+    Args:
+        sampler (:class:`dimod.Sampler`, optional, default=\ :class:`~dwave.system.samplers.DWaveSampler`):
+            A dimod sampler.
+
+        h_range (tuple or dict, default = :math:`[-1/6.1,1/6.1]`):
+            Range of external fields probed for temperature inference, as in
+            :func:`fast_effective_temperature`, for all regions; or a dict
+            mapping each region to its range.
+
+        regions (dict, optional):
+            Disjoint sets of variables, as a dict mapping each region to a
+            list of variables. If not provided, the node list of the
+            structured sampler is divided, at random, between the regions of
+            ``h_range``, which must then be a dict.
+
+        num_reads (int, optional):
+            Number of reads to use. Defaults to 1000 when not specified in the
+            ``sampler_params`` parameter.
+
+        seed (int, optional):
+            Seeds the problem-generation process, allowing reproducibility from
+            pseudo-random samplers.
+
+        sampler_params (dict, optional):
+            Any additional non-default sampler parameters. If ``num_reads`` is
+            provided, must be compatible with ``num_reads`` parameter.
+
+        num_bootstrap_samples (int, optional, default=0):
+            Number of bootstrap samples to use for estimation of the standard
+            errors. By default no bootstrapping is performed and the standard
+            errors default to 0. If None, the number of reads is used, as in
+            :func:`fast_effective_temperature`.
+
+    Returns:
+        dict: Effective temperature and standard error (:math:`\pm 1` sigma)
+        of each region, as a dict of form ``{region: (T, sigma), ...}``.
+
+    Raises:
+        ValueError: If regions are not disjoint, or if no regions are provided
+            and either ``h_range`` is not a dict or the sampler is not
+            structured.
+
+    Examples:
+       This example estimates the temperatures of the two halves of a quantum
+       computer's qubits, and for two ranges of external fields, with one
+       call to the sampler each.
+
+       >>> from dwave.system.temperatures import fast_effective_temperature_map
+       >>> from dwave.system import DWaveSampler
+       >>> sampler = DWaveSampler()
+       ...
+       >>> half = len(sampler.nodelist) // 2
+       >>> regions = {'lower': sampler.nodelist[:half], 'upper': sampler.nodelist[half:]}
+       >>> temperatures = fast_effective_temperature_map(sampler, regions=regions)
+       >>> temperatures = fast_effective_temperature_map(
+       ...     sampler, h_range={'narrow': (-0.1, 0.1), 'wide': (-0.3, 0.3)})
+       >>> print(temperatures['narrow'][0])    # doctest: +SKIP
+       0.21685104745347336
+    """
+    if sampler is None:
+        from dwave.system import DWaveSampler
+
+        sampler = DWaveSampler()
+
+    prng = np.random.RandomState(seed)
+
+    if regions is None:
+        if not isinstance(h_range, dict):
+            raise ValueError("regions are not provided and h_range is not a dict.")
+        if not hasattr(sampler, "nodelist"):
+            raise ValueError(
+                "regions are not provided and cannot be inferred from the sampler."
+            )
+        # spread each region over the whole sampler
+        nodes = np.asarray(sampler.nodelist, dtype=object)[prng.permutation(len(sampler.nodelist))]
+        regions = dict(zip(h_range, (parts.tolist() for parts in np.array_split(nodes, len(h_range)))))
+
+    if not isinstance(h_range, dict):
+        h_range = dict.fromkeys(regions, h_range)
+
+    for low, high in h_range.values():
+        if "h_range" in sampler.properties:
+            if low < sampler.properties["h_range"][0]:
+                raise ValueError("h_range[0] exceeds programmable range")
+
+            if high > sampler.properties["h_range"][1]:
+                raise ValueError("h_range[1] exceeds programmable range")
+
+    keys = list(regions)
+    nodelist = [v for key in keys for v in regions[key]]
+    if len(set(nodelist)) != len(nodelist):
+        raise ValueError("regions must be disjoint")
+    sizes = [len(regions[key]) for key in keys]
+
+    low, high = np.repeat([h_range[key] for key in keys], sizes, axis=0).T
+    h_values = low + (high - low) * prng.rand(len(nodelist))
+    bqm = dimod.BinaryQuadraticModel.from_ising(dict(zip(nodelist, h_values)), {})
+
+    sampler_params0 = _fast_temperature_sampler_params(num_reads, sampler_params)
+
+    if num_bootstrap_samples is None:
+        num_bootstrap_samples = sampler_params0["num_reads"]
+
+    sampleset = sampler.sample(bqm, **sampler_params0)
+
+    # spins in the order of nodelist, so each region's columns are contiguous
+    spins = sampleset.change_vartype(dimod.SPIN).record.sample
+    spins = spins[:, [sampleset.variables.index(v) for v in nodelist]]
+    num_occurrences = sampleset.record.num_occurrences
+
+    # the effective field of a spin is 2*s*h, so the fields of each qubit
+    # take two values, weighted by the number of samples in each state
+    fields = np.concatenate((2 * h_values, -2 * h_values))
+    up = num_occurrences @ (spins > 0)
+    weights = np.concatenate((up, num_occurrences.sum() - up)).astype(float)
+
+    starts = np.cumsum([0] + sizes)
+    x = np.empty(len(keys))
+    block = max(1, 2**22 // max(2 * len(nodelist), 1))  # bounds memory
+    for first in range(0, len(keys), block):
+        last = min(first + block, len(keys))
+        columns = np.arange(starts[first], starts[last])
+        region = np.repeat(np.arange(last - first), sizes[first:last])
+
+        counts = np.zeros((last - first, 2 * len(columns)))
+        counts[region, np.arange(len(columns))] = weights[columns]
+        counts[region, len(columns) + np.arange(len(columns))] = weights[len(nodelist) + columns]
+        en1_u = np.concatenate((fields[columns], fields[len(nodelist) + columns]))
+
+        with np.errstate(divide="ignore"):
+            x0 = -1 / np.where(counts > 0, en1_u, -np.inf).max(axis=1)
+        x[first:last] = _batched_newton_pseudo_likelihood(en1_u, counts, x0)
+
+    with np.errstate(divide="ignore"):
+        T = -1 / x
+
+    temperatures = {}
+    for k, key in enumerate(keys):
+        if num_bootstrap_samples or np.isnan(x[k]):
+            # as in the general case, for regions where Newton's method failed
+            region_en1 = 2 * spins[:, starts[k]:starts[k + 1]] * h_values[starts[k]:starts[k + 1]]
+            if num_bootstrap_samples:
+                # bootstrapping requires disaggregated samples
+                region_en1 = np.repeat(region_en1, num_occurrences, axis=0)
+                sample_weights = None
+            else:
+                sample_weights = num_occurrences
+            T_k, Tboot = maximum_pseudolikelihood_temperature(
+                en1=region_en1,
+                optimize_method="bisect" if np.isnan(x[k]) else None,
+                num_bootstrap_samples=num_bootstrap_samples,
+                sample_weights=sample_weights,
+            )
+            sigma = np.sqrt(np.var(Tboot)) if num_bootstrap_samples else 0.0
+        else:
+            T_k, sigma = T[k], 0.0
+
+        temperatures[key] = (np.float64(T_k), np.float64(sigma))
+
+    return temperatures
@@ -13,6 +13,10 @@
 #    limitations under the License.
 
 import concurrent.futures
+import functools
+import gzip
+import itertools
+import time
 import warnings
 import weakref
 from uuid import uuid4
@@ -20,9 +24,38 @@ from uuid import uuid4
 import numpy as np
 import dimod
 import dwave.cloud.computation
+from dwave.cloud.solver import StructuredSolver
+from dwave.cloud.testing.mocks import qpu_problem_timing_data, structured_solver_data
 
 from dwave.samplers import SteepestDescentSampler
 from dwave.system import qpu_graph
+from dwave.system.composites import Recording
+from dwave.system.instrumentation import StageTimer
+from dwave.system.utilities import _bqm_fingerprint
+
+
+def _graph_lists(graph):
+    """Return the sorted nodes and edges of a QPU graph.
+
+    Each edge ``(u, v)`` has ``u < v``. Edges are also returned as a read-only
+    array of the indices of their nodes in the node list.
+    """
+    nodelist = sorted(graph.nodes)
+    edgelist = sorted(tuple(sorted(edge)) for edge in graph.edges)
+    index = {v: i for i, v in enumerate(nodelist)}
+    edges = np.fromiter((index[v] for edge in edgelist for v in edge),
+                        dtype=np.int64, count=2*len(edgelist)).reshape(-1, 2)
+    edges.setflags(write=False)
+    return nodelist, edgelist, edges
+
+
+@functools.lru_cache(maxsize=16)
+def _qpu_lattice(topology_type, topology_shape):
+    """Return the nodes and edges of a fully yielded QPU lattice.
+
+    Memoized so that mock samplers of the same topology share the template.
+    """
+    return _graph_lists(qpu_graph(topology_type, topology_shape, None, None))
 
 
 class MockDWaveSampler(dimod.Sampler, dimod.Structured):
@@ -108,6 +141,33 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
             Set ``exact_solver_cutoff`` to zero to disable exact ground state
             calculation explicitly.
 
+        cache_ground_states (bool, optional, default=False):
+            If True, ground states determined for ``exact_solver_cutoff`` are
+            cached per binary quadratic model, so resubmitting the same problem
+            does not repeat the brute-force search.
+
+        latency (float, optional, default=0):
+            Time, in seconds, added to every sampling call to emulate the
+            round trip to an online system.
+
+        concurrency (int, optional):
+            If provided, problems are run on a background pool of
+            ``concurrency`` threads, emulating a solver that processes that
+            many problems at a time and queues the rest. Sampling methods
+            then return unresolved sample sets backed by futures. Use
+            :meth:`close` to release the threads.
+
+        time_scale (float, optional, default=0):
+            Fraction of the estimated QPU access time, reported under the
+            ``timing`` field of the sample set's info, for which each problem
+            occupies the mocked solver. A value of 1 emulates QPU time in
+            real time.
+
+    The reported QPU timing is estimated from ``num_reads``,
+    ``annealing_time`` (or ``anneal_schedule``), thermalization parameters
+    and the number of active qubits, using the ``problem_timing_data``
+    property.
+
     Examples
         The first example creates a MockSampler without reference to a
         particular online system, with a fully-yielded Chimera C16 structure.
@@ -131,6 +191,16 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
         >>> print(ss.first.energy)
         -1
 
+        For load testing a pipeline, :class:`LoadTestSampler` returns
+        structurally valid samples in time linear in the number of reads and
+        qubits, and ground states of repeated small problems are cached.
+
+        >>> from dwave.system.testing import LoadTestSampler
+        >>> mock_sampler = MockDWaveSampler(topology_type='pegasus',
+        ...                                 substitute_sampler=LoadTestSampler(seed=5),
+        ...                                 cache_ground_states=True,
+        ...                                 parameter_warnings=False)
+
     """
     nodelist = None
     edgelist = None
@@ -145,6 +215,10 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
                  substitute_sampler=None, 
                  substitute_kwargs=None, 
                  exact_solver_cutoff=None,
+                 cache_ground_states=False,
+                 latency=0,
+                 concurrency=None,
+                 time_scale=0,
                  **config):
         
         self.mocked_parameters={'answer_mode',
@@ -169,6 +243,15 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
 
         self.parameter_warnings = parameter_warnings
         self.exact_solver_cutoff = exact_solver_cutoff
+        self.ground_states = {} if cache_ground_states else None
+        self.latency = latency
+        self.time_scale = time_scale
+
+        if concurrency is None:
+            self.executor = None
+        else:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix='MockDWaveSampler')
 
         #Parse or default topology dependent arguments:
         if properties is not None and 'topology' in properties:
@@ -201,44 +284,50 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
             'topology': {'type': topology_type, 'shape': topology_shape}
         }
         #Create graph object, introduce defects per input arguments
-        if nodelist is not None:
-            self.nodelist = nodelist.copy()
-        if edgelist is not None:
-            self.edgelist = edgelist.copy()
-        # Note that self.to_networkx_graph would point to an inherited
-        # version rather than the class method here, without topology
-        # information, for clarity helper function is separated.
-        solver_graph = qpu_graph(self.properties['topology']['type'],
-                                 self.properties['topology']['shape'],
-                                 self.nodelist, self.edgelist)
+        if nodelist is None and edgelist is None:
+            # memoized, so mocks of the same topology are quick to create
+            lattice = _qpu_lattice(topology_type, tuple(topology_shape))
+        else:
+            # Note that self.to_networkx_graph would point to an inherited
+            # version rather than the class method here, without topology
+            # information, for clarity helper function is separated.
+            lattice = _graph_lists(qpu_graph(topology_type, topology_shape,
+                                             nodelist, edgelist))
+        nodelist, edgelist, edges = lattice
 
         if topology_type == 'pegasus':
             m = self.properties['topology']['shape'][0]
             num_qubits = m*(m-1)*24  # fabric_only=True technicality
         else:
-            num_qubits = len(solver_graph)
-        if broken_nodes is None and broken_edges is None:
-            self.nodelist = sorted(solver_graph.nodes)
-            self.edgelist = sorted(tuple(sorted(edge))
-                                   for edge in solver_graph.edges)
-        else:
-            if broken_nodes is None:
-                broken_nodes = []
-            self.nodelist = sorted(set(solver_graph.nodes).difference(broken_nodes))
-            if broken_edges is None:
-                broken_edges = []
-            self.edgelist = sorted(tuple(sorted((u, v))) for
-                                   u, v in solver_graph.edges
-                                   if u not in broken_nodes
-                                   and v not in broken_nodes
-                                   and (u, v) not in broken_edges
-                                   and (v, u) not in broken_edges)
+            num_qubits = len(nodelist)
+        if broken_nodes is not None or broken_edges is not None:
+            # defects are located by the indices of nodes in the node list
+            index = {v: i for i, v in enumerate(nodelist)}
+            keep = np.ones(len(edgelist), dtype=bool)
+            if broken_nodes is not None:
+                broken = np.zeros(len(nodelist), dtype=bool)
+                broken[[index[v] for v in broken_nodes if v in index]] = True
+                nodelist = list(itertools.compress(nodelist, ~broken))
+                keep &= ~broken[edges].any(axis=1)
+            if broken_edges is not None:
+                broken = np.array([(index[u], index[v]) for u, v in broken_edges
+                                   if u in index and v in index],
+                                  dtype=np.int64).reshape(-1, 2)
+                broken.sort(axis=1)
+                # compare edges by a scalar key, i*n + j
+                n = len(index)
+                keep &= ~np.isin(edges[:, 0]*n + edges[:, 1],
+                                 broken[:, 0]*n + broken[:, 1])
+            edgelist = list(itertools.compress(edgelist, keep))
+        self.nodelist = list(nodelist)
+        self.edgelist = list(edgelist)
         #Finalize yield-dependent properties:
+        qubits = set(self.nodelist)
         self.properties.update({
             'num_qubits': num_qubits,
             'qubits': self.nodelist.copy(),
             'couplers': self.edgelist.copy(),
-            'anneal_offset_ranges': [[-0.5, 0.5] if i in self.nodelist
+            'anneal_offset_ranges': [[-0.5, 0.5] if i in qubits
                                      else [0, 0] for i in range(len(self.nodelist))]})
         # Non-topology-dependent properties and parameters mocked from
         # Advantage_system4.1 accessed February 10th 2022
@@ -328,9 +417,7 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
             'num_reads_range': [1, 10000],
             'per_qubit_coupling_range': [-18.0, 15.0],
             'problem_run_duration_range': [0.0, 10000000.0],
-            # TODO: populate using `dwave.cloud.testing.mocks.qpu_problem_timing_data`
-            # (when the mock is merged and released)
-            'problem_timing_data': None,
+            'problem_timing_data': qpu_problem_timing_data(),
             'programming_thermalization_range': [0.0, 10000.0],
             'readout_thermalization_range': [0.0, 10000.0],
             'tags': [],
@@ -344,6 +431,11 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
             # topology-dependent arguments:
             self.properties.update(properties)
 
+    def close(self):
+        """Shut down the threads used when ``concurrency`` is set."""
+        if self.executor is not None:
+            self.executor.shutdown()
+
     @classmethod
     def from_qpu_sampler(cls, sampler):
         return cls(properties=sampler.properties,
@@ -377,24 +469,6 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
             else:
                 raise ValueError(f'kwarg {kw!r} invalid for MockDWaveSampler()')
 
-        # Timing values are for demonstration only. These could be made
-        # adaptive to sampler parameters and mocked topology in principle.
-        # we should do it in a follow-up PR, using estimate_qpu_access_time,
-        # once dwavesystems/dwave-cloud-client#530 is merged.
-        info = dict(problem_id=str(uuid4()),
-                    timing={'qpu_sampling_time': 82.08,
-                            'qpu_anneal_time_per_sample': 20.0,
-                            'qpu_readout_time_per_sample': 41.54,
-                            'qpu_access_time': 8550.28,
-                            'qpu_access_overhead_time': 9340.72,
-                            'qpu_programming_time': 8468.2,
-                            'qpu_delay_time_per_sample': 20.54,
-                            'total_post_processing_time': 1124.0,
-                            'post_processing_overhead_time': 1124.0})
-        label = kwargs.get('label')
-        if label is not None:
-            info.update(problem_label=label)
-        
         # Special handling of flux_biases, for compatibility with virtual graphs
         flux_biases = kwargs.get('flux_biases')
         if flux_biases is not None:
@@ -407,29 +481,287 @@ class MockDWaveSampler(dimod.Sampler, dimod.Structured):
         num_reads = kwargs.get('num_reads', substitute_kwargs.get('num_reads', 1))
         substitute_kwargs['num_reads'] = num_reads
 
+        info = dict(problem_id=str(uuid4()),
+                    timing=_qpu_timing(self, max(bqm.num_variables, 1),
+                                       **dict(kwargs, num_reads=num_reads)))
+        label = kwargs.get('label')
+        if label is not None:
+            info.update(problem_label=label)
+
         sampler_kwargs = kwargs.copy()
         sampler_kwargs.update(substitute_kwargs)
+
+        # the substitute sampler stands in for submitting to and waiting on
+        # the QPU
+        timer = StageTimer(self)
+        if self.executor is None:
+            with timer.stage('submission'):
+                ss = self._run(bqm, info, sampler_kwargs)
+            return timer.update(ss)
+
+        with timer.stage('submission'):
+            future = self.executor.submit(self._run, bqm, info, sampler_kwargs)
+        return timer.deferred_update(dimod.SampleSet.from_future(future))
+
+    def _run(self, bqm, info, sampler_kwargs):
+        # occupy the mocked solver for the (scaled) modelled QPU access time
+        delay = self.latency + self.time_scale * info['timing']['qpu_access_time'] * 1e-6
+        if delay:
+            time.sleep(delay)
+
         ss = self.substitute_sampler.sample(bqm, **sampler_kwargs)
         ss.info.update(info)
         # determine ground state exactly for small problems
         if 0 < len(bqm) <= self.exact_solver_cutoff and len(ss) >= 1:
-            ground = dimod.ExactSolver().sample(bqm).truncate(1)
+            ground = self._ground_state(bqm)
             ss.record[0].sample = ground.record[0].sample
             ss.record[0].energy = ground.record[0].energy
         
-        answer_mode = kwargs.get('answer_mode')
+        answer_mode = sampler_kwargs.get('answer_mode')
         if answer_mode is None or answer_mode == 'histogram':
             # Default for DWaveSampler() is 'histogram'
             ss = ss.aggregate()
 
         return ss
 
+    def _ground_state(self, bqm):
+        if self.ground_states is None:
+            return dimod.ExactSolver().sample(bqm).truncate(1)
+
+        key = _bqm_fingerprint(bqm)
+        try:
+            return self.ground_states[key]
+        except KeyError:
+            pass
+
+        ground = self.ground_states[key] = dimod.ExactSolver().sample(bqm).truncate(1)
+        return ground
+
     def to_networkx_graph(self):
         return qpu_graph(self.properties['topology']['type'],
                          self.properties['topology']['shape'],
                          self.nodelist, self.edgelist)
-    
-    
+
+
+# timing values are for demonstration only
+_DEMO_QPU_TIMING = {'qpu_sampling_time': 82.08,
+                    'qpu_anneal_time_per_sample': 20.0,
+                    'qpu_readout_time_per_sample': 41.54,
+                    'qpu_access_time': 8550.28,
+                    'qpu_access_overhead_time': 9340.72,
+                    'qpu_programming_time': 8468.2,
+                    'qpu_delay_time_per_sample': 20.54,
+                    'total_post_processing_time': 1124.0,
+                    'post_processing_overhead_time': 1124.0}
+
+
+def _qpu_timing(sampler, num_qubits, num_reads=1, reinitialize_state=True, **parameters):
+    """QPU timing, in microseconds, of a problem sampled by a mock QPU sampler.
+
+    Times are estimated by
+    :meth:`~dwave.cloud.solver.StructuredSolver.estimate_qpu_access_time`
+    from the ``problem_timing_data`` property of ``sampler``.
+    """
+    timing = dict(_DEMO_QPU_TIMING)
+
+    data = sampler.properties.get('problem_timing_data')
+    if data is None:
+        return timing
+
+    # a solver with only the timing data of the mocked sampler
+    solver = StructuredSolver(client=None, data=structured_solver_data(
+        properties=dict(supported_problem_types=['ising', 'qubo'],
+                        problem_timing_data=data)))
+
+    estimate = functools.partial(
+        solver.estimate_qpu_access_time, num_qubits,
+        reinitialize_state=reinitialize_state, **parameters)
+    programming_time = estimate(num_reads=0)
+    read_time = estimate(num_reads=1) - programming_time
+
+    anneal_schedule = parameters.get('anneal_schedule')
+    anneal_time = (parameters.get('annealing_time')
+                   or (anneal_schedule[-1][0] if anneal_schedule else None)
+                   or data['default_annealing_time'])
+
+    # thermalization and reverse-annealing deltas are not reported
+    # separately, so they are counted in the readout time
+    delay_time = data['qpu_delay_time_per_sample']
+    timing.update(qpu_sampling_time=num_reads * read_time,
+                  qpu_anneal_time_per_sample=anneal_time,
+                  qpu_readout_time_per_sample=read_time - anneal_time - delay_time,
+                  qpu_access_time=num_reads * read_time + programming_time,
+                  qpu_programming_time=programming_time,
+                  qpu_delay_time_per_sample=delay_time)
+    return timing
+
+
+class LoadTestSampler(dimod.Sampler):
+    """Fast placeholder sampler for load testing with :class:`MockDWaveSampler`.
+
+    Generates uniformly random samples, optionally improved by one greedy
+    sweep that sets each variable, in turn, to minimize its energy given the
+    current values of its neighbors. All reads are processed together, so
+    sampling takes time linear in the number of reads and in the number of
+    variables and interactions. The samples are not meant to follow any
+    particular distribution.
+
+    Args:
+        greedy (bool, optional, default=True):
+            If True, random samples are improved by a single greedy sweep.
+
+        seed (int, optional):
+            Seed for the random number generator. Successive sampling calls
+            continue the same random sequence.
+
+    Examples:
+        >>> import dimod
+        >>> from dwave.system.testing import LoadTestSampler
+        ...
+        >>> bqm = dimod.BQM.from_ising({}, {'ab': -1, 'bc': -1})
+        >>> sampleset = LoadTestSampler(seed=42).sample(bqm, num_reads=1000)
+        >>> len(sampleset)
+        1000
+
+    """
+    parameters = None
+    properties = None
+
+    def __init__(self, greedy=True, seed=None):
+        self.greedy = greedy
+        self.rng = np.random.default_rng(seed)
+        self.parameters = {'num_reads': []}
+        self.properties = {}
+
+    def sample(self, bqm, num_reads=1, **kwargs):
+        """Sample from a binary quadratic model.
+
+        Args:
+            bqm (:class:`~dimod.BinaryQuadraticModel`):
+                Binary quadratic model to be sampled from.
+
+            num_reads (int, optional, default=1):
+                Number of samples.
+
+            **kwargs:
+                Other parameters, such as those of :class:`MockDWaveSampler`,
+                are ignored.
+
+        Returns:
+            :class:`~dimod.SampleSet`
+
+        """
+        spin = bqm.vartype is dimod.SPIN
+        num_variables = bqm.num_variables
+
+        # variable-major so that each variable's values are contiguous
+        samples = self.rng.integers(0, 2, size=(num_variables, num_reads), dtype=np.int8)
+        if spin:
+            samples = 2*samples - 1
+
+        if self.greedy and num_variables:
+            ldata, (irow, icol, qdata), offset = bqm.to_numpy_vectors(
+                variable_order=bqm.variables)
+
+            # neighborhoods of each variable, in both directions
+            heads = np.concatenate((irow, icol))
+            tails = np.concatenate((icol, irow))
+            biases = np.concatenate((qdata, qdata))
+            order = np.argsort(heads, kind='stable')
+            tails = tails[order]
+            biases = biases[order]
+            starts = np.zeros(num_variables + 1, dtype=np.intp)
+            np.cumsum(np.bincount(heads, minlength=num_variables), out=starts[1:])
+
+            for v in range(num_variables):
+                nbrs = slice(starts[v], starts[v+1])
+                field = ldata[v] + biases[nbrs] @ samples[tails[nbrs]]
+
+                # keep the current value when both values have equal energy
+                samples[v, field > 0] = -1 if spin else 0
+                samples[v, field < 0] = 1
+
+        return dimod.SampleSet.from_samples_bqm((samples.T, bqm.variables), bqm)
+
+
+class ReplaySampler(dimod.Sampler, dimod.Structured):
+    """Sampler that replays responses recorded by :class:`~dwave.system.RecordingComposite`.
+
+    The sampler has the structure, properties and parameters of the recorded
+    sampler. Sampling a problem with the same binary quadratic model and
+    parameters as a recorded problem returns a copy of the recorded sample
+    set. Problems recorded several times are answered with their recorded
+    responses in turn, cycling back to the first.
+
+    Args:
+        path (str or path-like):
+            Path of a store written by :class:`~dwave.system.RecordingComposite`.
+
+        latency (bool, optional, default=False):
+            If True, sample sets resolve no sooner than their recorded
+            latency after submission.
+
+    Examples:
+        >>> from dwave.system.testing import ReplaySampler
+        >>> sampler = ReplaySampler('responses.jsonl.gz')   # doctest: +SKIP
+
+    """
+    nodelist = None
+    edgelist = None
+    properties = None
+    parameters = None
+
+    def __init__(self, path, latency=False):
+        recording = Recording(path)
+
+        self.nodelist = recording.nodelist
+        self.edgelist = recording.edgelist
+        self.properties = recording.properties
+        self.parameters = recording.parameters
+        self.latency = latency
+
+        self._responses = {key: itertools.cycle(r)
+                           for key, r in recording.responses.items()}
+
+    def sample(self, bqm, **parameters):
+        """Return a recorded response.
+
+        Args:
+            bqm (:class:`~dimod.BinaryQuadraticModel`):
+                Binary quadratic model to be sampled from.
+
+            **parameters:
+                Parameters of the recorded sampler.
+
+        Returns:
+            :class:`~dimod.SampleSet`
+
+        Raises:
+            ValueError: If no response was recorded for ``bqm`` with
+                ``parameters``.
+
+        """
+        try:
+            responses = self._responses[Recording.key(bqm, parameters)]
+        except KeyError:
+            raise ValueError("no response was recorded for the given problem "
+                             "and parameters") from None
+
+        sampleset, latency = next(responses)
+        sampleset = sampleset.copy()
+
+        if not self.latency:
+            return sampleset
+
+        t0 = time.perf_counter()
+
+        def hook(sampleset):
+            time.sleep(max(latency - (time.perf_counter() - t0), 0))
+            return sampleset
+
+        return dimod.SampleSet.from_future(sampleset, hook)
+
+
 class MockLeapHybridDQMSampler(dimod.Scoped):
     """Mock sampler modeled after LeapHybridDQMSampler that can be used for tests."""
     def __init__(self, **config):
@@ -471,26 +803,77 @@ class MockLeapHybridDQMSampler(dimod.Scoped):
         return self.properties['minimum_time_limit'][0][1]
 
 
+def _load_uploaded(file):
+    """Load a model uploaded to a mock hybrid solver."""
+    if file.read(2) == b'\x1f\x8b':
+        # gzip-compressed, see dwave.system.utilities.compress_file
+        file.seek(0)
+        return dimod.serialization.fileview.load(gzip.decompress(file.read()))
+    file.seek(0)
+    return dimod.serialization.fileview.load(file)
+
+
+def _hybrid_future(sampleset, problem_type):
+    """Return a resolved cloud-client future for ``sampleset``."""
+    future = dwave.cloud.computation.Future('fake_solver', None)
+
+    # Note: dwave-cloud-client>=0.11.3 does not keep a strong ref to sampleset,
+    # but we can keep it here for tests to work with older versions of the client
+    # TODO: remove 'sampleset' from _result when we start requiring 0.11.3+
+    future._result = {'sampleset': sampleset, 'problem_type': problem_type}
+    if hasattr(future, '_sampleset'):
+        # _sampleset is a weakref in 0.11.3+, but a resolved sampleset prior to 0.11.3
+        # (also it's not set until .sampleset property is accessed)
+        future._sampleset = weakref.ref(sampleset)
+
+    return future
+
+
 class MockLeapHybridSolver(dimod.Scoped):
+    """Mock hybrid solver for BQMs, CQMs and DQMs.
+
+    Problem data can be uploaded compressed by
+    :func:`~dwave.system.utilities.compress_file`.
+    """
 
-    properties = {'supported_problem_types': ['bqm'],
+    properties = {'supported_problem_types': ['bqm', 'cqm', 'dqm'],
+                  'supported_compression': ['gzip'],
                   'minimum_time_limit': [[1, 1.0], [1024, 1.0],
                                          [4096, 10.0], [10000, 40.0]],
+                  'minimum_time_limit_s': 1.0,
+                  'maximum_number_of_constraints': 100,
+                  'maximum_number_of_variables': 500,
+                  'maximum_number_of_biases': 2000,
+                  'maximum_number_of_quadratic_variables': 200,
                   'parameters': {'time_limit': None},
                   'category': 'hybrid',
                   'quota_conversion_rate': 1}
 
-    supported_problem_types = ['bqm']
+    supported_problem_types = ['bqm', 'cqm', 'dqm']
 
     def close(self):
         pass
 
     def upload_bqm(self, bqm, **parameters):
-        bqm_adjarray = dimod.serialization.fileview.load(bqm)
+        return self.upload_problem(bqm)
+
+    def upload_problem(self, problem, **parameters):
         future = concurrent.futures.Future()
-        future.set_result(bqm_adjarray)
+        future.set_result(_load_uploaded(problem))
         return future
 
+    def sample_cqm(self, sapi_problem_id, time_limit, **parameters):
+        cqm = sapi_problem_id
+        samples = {v: cqm.lower_bound(v) for v in cqm.variables}
+        return _hybrid_future(dimod.SampleSet.from_samples_cqm(samples, cqm), 'cqm')
+
+    def sample_dqm(self, sapi_problem_id, time_limit, **parameters):
+        dqm = sapi_problem_id
+        samples = np.zeros((1, dqm.num_variables()), dtype=int)
+        sampleset = dimod.SampleSet.from_samples((samples, dqm.variables), 'DISCRETE',
+                                                 energy=dqm.energies(samples))
+        return _hybrid_future(sampleset, 'dqm')
+
     def sample_bqm(self, sapi_problem_id, time_limit):
         
         bqm = dimod.BQM(sapi_problem_id.linear,
@@ -499,16 +882,4 @@ class MockLeapHybridSolver(dimod.Scoped):
                                     sapi_problem_id.vartype)
         sampler = SteepestDescentSampler()
         result = sampler.sample(bqm, timeout=1000*int(time_limit))
-        result = sampler.sample(bqm, timeout=1000*int(time_limit))
-        future = dwave.cloud.computation.Future('fake_solver', None)
-
-        # Note: dwave-cloud-client>=0.11.3 does not keep a strong ref to sampleset,
-        # but we can keep it here for tests to work with older versions of the client
-        # TODO: remove 'sampleset' from _result when we start requiring 0.11.3+
-        future._result = {'sampleset': result, 'problem_type': 'bqm'}
-        if hasattr(future, '_sampleset'):
-            # _sampleset is a weakref in 0.11.3+, but a resolved sampleset prior to 0.11.3
-            # (also it's not set until .sampleset property is accessed)
-            future._sampleset = weakref.ref(result)
-
-        return future
+        return _hybrid_future(result, 'bqm')
@@ -15,17 +15,25 @@
 """Utility functions."""
 
 import os
+import collections
+import concurrent.futures
+import gzip
+import importlib
 import json
-import networkx as nx
+import hashlib
+import tempfile
+import sys
 import numpy as np
 import warnings
 
 from typing import Union
 
 __all__ = [
+    'AnnealSchedule',
     'anneal_schedule_with_offset',
     'classproperty',
     'common_working_graph',
+    'compress_file',
     'energy_scales_custom_schedule',
     ]
 
@@ -51,6 +59,50 @@ def _asarray(
 
     return array
 
+
+def _bqm_fingerprint(bqm) -> str:
+    "Return a digest identifying the variables, biases and vartype of a BQM."
+    ldata, (irow, icol, qdata), offset = bqm.to_numpy_vectors(sort_indices=True)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((bqm.vartype.name, list(bqm.variables), float(offset))).encode())
+    for array in (ldata, irow, icol, qdata):
+        digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _lazy_attributes(package: str, origins: dict) -> tuple:
+    """Return the module ``__getattr__`` and ``__dir__`` functions (:pep:`562`)
+    and ``__all__`` of a package that imports its attributes on first access.
+
+    Args:
+        package: Name of the package.
+        origins: Mapping of submodules, relative to the package, to the names
+            of the attributes they provide.
+    """
+    submodules = {name: submodule for submodule, names in origins.items() for name in names}
+
+    def __getattr__(name):
+        try:
+            submodule = submodules[name]
+        except KeyError:
+            # submodules that are not imported yet, like ``dwave.system.warnings``
+            try:
+                return importlib.import_module(f'{package}.{name}')
+            except ModuleNotFoundError as err:
+                if err.name != f'{package}.{name}':
+                    raise
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(importlib.import_module(f'{package}.{submodule}'), name)
+        setattr(sys.modules[package], name, value)  # bypass __getattr__ from now on
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])).union(submodules))
+
+    return __getattr__, __dir__, sorted(submodules)
+
 # taken from https://stackoverflow.com/a/39542816, licensed under CC BY-SA 3.0
 # not needed in py39+
 class classproperty(property):
@@ -94,6 +146,8 @@ def common_working_graph(graph0, graph1):
                   "and will be removed in dwave-system 2.0. Use networkx.intersection() instead.",
                   DeprecationWarning, stacklevel=2)
 
+    import networkx as nx
+
     G = nx.Graph()
     G.add_nodes_from(v for v in graph0 if v in graph1)
     G.add_edges_from((u, v) for u in graph0 for v in graph0[u]
@@ -120,6 +174,263 @@ class FeatureFlags:
         return cls.get('hss_solver_config_override')
 
 
+class AnnealSchedule:
+    r"""Anneal schedule of a quantum computer, prepared for repeated,
+    vectorized interpolation.
+
+    The schedule table is validated once, on construction, and the energy
+    scales, persistent current and unit conversions it supports are
+    calculated for arrays of anneal fractions, :math:`s`, and
+    :ref:`anneal offsets <qpu_qa_anneal_offsets>` (for example, one per
+    qubit) together, following NumPy's broadcasting rules.
+
+    Args:
+        schedule:
+            Anneal schedule, as a 4-column |array-like|_, with column values for
+            :math:`s, A, B, c` as provided by (and typically taken from) the
+            spreadsheet columns of the published
+            :ref:`Per-QPU Solver Properties and Schedules <qpu_solver_properties_specific>`
+            page. If set, do not set parameters ``s``, ``A``, ``B``, and ``c``.
+        s: Normalized anneal fraction, :math:`\frac{t}{t_a}`, as a
+            1-dimensional |array-like|_. If set, ``schedule`` must be ``None``
+            and values must be provided for ``A``, ``B``, and ``c``.
+        A: Transverse or tunneling energy, :math:`A(s)`, as a 1-dimensional
+            |array-like|_.
+        B: Energy applied to the problem Hamiltonian, :math:`B(s)`, as a
+            1-dimensional |array-like|_.
+        c: Normalized control bias, :math:`c(s)`, as a 1-dimensional
+            |array-like|_.
+        MAFM: Mutual inductance, :math:`M_{AFM}`, specified for each quantum
+            computer in the :ref:`qpu_solver_properties_specific` section.
+            Required for the persistent current and flux-bias conversions.
+        units_B: Units of :math:`A` and :math:`B`: ``'GHz'`` (gigahertz)
+            or ``'J'`` (Joules).
+        units_MAFM: Units of ``MAFM``: ``'pH'`` (picohenry) or ``'H'``
+            (Henry).
+
+    Examples:
+        For a default schedule provided as array :code:`schedule`, this
+        example converts flux biases on three qubits, with different anneal
+        offsets, to equivalent biases ``h`` at :math:`s=0.612`.
+
+        >>> from dwave.system import AnnealSchedule
+        ...
+        >>> qpu_schedule = AnnealSchedule(schedule, MAFM=1.647)  # doctest: +SKIP
+        >>> h = qpu_schedule.fluxbias_to_h([1e-5, 2e-5, 1e-5], 0.612,
+        ...                                anneal_offset=[0, 0.01, -0.01])  # doctest: +SKIP
+
+    """
+    def __init__(self,
+                 schedule: Union[np.typing.ArrayLike, list[list[float]], None] = None,
+                 s: Union[np.typing.ArrayLike, list[float], None] = None,
+                 A: Union[np.typing.ArrayLike, list[float], None] = None,
+                 B: Union[np.typing.ArrayLike, list[float], None] = None,
+                 c: Union[np.typing.ArrayLike, list[float], None] = None,
+                 MAFM: Union[float, None] = None,
+                 units_B: str = "GHz",
+                 units_MAFM: str = "pH"):
+
+        if schedule is not None and (
+            s is not None or A is not None or B is not None or c is not None):
+
+            raise ValueError("Either `schedule` or `s, A, B, c`"
+                " can be specified. Got both inputs.")
+
+        if schedule is None and (
+            s is None or A is None or B is None or c is None):
+
+            raise ValueError("If `schedule` is unspecified, you must"
+                " specify all of `s, A, B, c`. Not all were specified.")
+
+        if schedule is not None:
+            schedule = _asarray('schedule', schedule, 4)
+            s, A, B, c = schedule.T
+        else:
+            s = _asarray('s', s, 1)
+            A = _asarray('A', A, 1)
+            B = _asarray('B', B, 1)
+            c = _asarray('c', c, 1)
+
+        self.s = s
+        self.A = A
+        self.B = B
+        self.c = c
+        self.MAFM = MAFM
+        self.units_B = units_B
+        self.units_MAFM = units_MAFM
+
+    s = None  # overwritten by init
+    """:class:`numpy.ndarray`: Normalized anneal fractions of the schedule table."""
+
+    A = None  # overwritten by init
+    """:class:`numpy.ndarray`: Tunneling energies of the schedule table."""
+
+    B = None  # overwritten by init
+    """:class:`numpy.ndarray`: Problem energies of the schedule table."""
+
+    c = None  # overwritten by init
+    """:class:`numpy.ndarray`: Normalized control biases of the schedule table."""
+
+    def energy_scales(self, s: np.typing.ArrayLike,
+                      anneal_offset: np.typing.ArrayLike = 0.0) -> tuple:
+        r"""Energy scales :math:`A(s)` and :math:`B(s)`, for the given anneal
+        offsets.
+
+        Args:
+            s: Normalized anneal fractions.
+            anneal_offset: Anneal offsets, broadcast against ``s``.
+
+        Returns:
+            Tuple of :class:`numpy.ndarray`: :math:`A` and :math:`B`.
+
+        """
+        # an offset shifts the control bias, c(s) -> c(s) + offset
+        c = np.interp(s, self.s, self.c) + np.asarray(anneal_offset)
+        return np.interp(c, self.c, self.A), np.interp(c, self.c, self.B)
+
+    def _conversion_parameters(self, s, anneal_offset):
+        if self.MAFM is None:
+            raise ValueError("MAFM is required for persistent-current and flux-bias conversions")
+
+        _, B = self.energy_scales(s, anneal_offset)
+        return dict(B=B, MAFM=self.MAFM, units_B=self.units_B, units_MAFM=self.units_MAFM)
+
+    def persistent_current(self, s: np.typing.ArrayLike,
+                           anneal_offset: np.typing.ArrayLike = 0.0) -> np.ndarray:
+        r"""Persistent current, :math:`I_p(s)`, in units of :math:`B`,
+        inferred from :math:`B(s) = 2 M_{AFM} I_p(s)^2`.
+
+        See :func:`~dwave.system.temperatures.Ip_in_units_of_B`.
+        """
+        from dwave.system.temperatures import Ip_in_units_of_B
+
+        return Ip_in_units_of_B(**self._conversion_parameters(s, anneal_offset))
+
+    def h_to_fluxbias(self, h: np.typing.ArrayLike, s: np.typing.ArrayLike,
+                      anneal_offset: np.typing.ArrayLike = 0.0) -> np.ndarray:
+        r"""Convert biases ``h`` at anneal fraction ``s`` to equivalent flux
+        biases, in units of :math:`\Phi_0`.
+
+        See :func:`~dwave.system.temperatures.h_to_fluxbias`.
+        """
+        from dwave.system.temperatures import h_to_fluxbias
+
+        return h_to_fluxbias(np.asarray(h), **self._conversion_parameters(s, anneal_offset))
+
+    def fluxbias_to_h(self, fluxbias: np.typing.ArrayLike, s: np.typing.ArrayLike,
+                      anneal_offset: np.typing.ArrayLike = 0.0) -> np.ndarray:
+        r"""Convert flux biases, in units of :math:`\Phi_0`, at anneal
+        fraction ``s`` to equivalent biases ``h``.
+
+        See :func:`~dwave.system.temperatures.fluxbias_to_h`.
+        """
+        from dwave.system.temperatures import fluxbias_to_h
+
+        return fluxbias_to_h(np.asarray(fluxbias), **self._conversion_parameters(s, anneal_offset))
+
+    def freezeout_effective_temperature(self, s: np.typing.ArrayLike,
+                                        temperature: float,
+                                        units_T: str = "mK") -> np.ndarray:
+        r"""Effective temperature for freeze-out at anneal fraction ``s``.
+
+        See :func:`~dwave.system.temperatures.freezeout_effective_temperature`.
+        """
+        from dwave.system.temperatures import freezeout_effective_temperature
+
+        _, B = self.energy_scales(s)
+        return freezeout_effective_temperature(B, temperature, units_B=self.units_B,
+                                               units_T=units_T)
+
+    def with_offset(self, anneal_offset: np.typing.ArrayLike = 0.0) -> np.ndarray:
+        r"""Schedule table for the given anneal offsets.
+
+        Args:
+            anneal_offset: Anneal offset, or a 1-dimensional array of
+                offsets, for example one per qubit.
+
+        Returns:
+            :class:`numpy.ndarray`: Offset schedule with columns
+            :math:`s, A, B, c`; for an array of offsets, an array with one
+            such schedule per offset.
+
+        See :func:`anneal_schedule_with_offset`.
+        """
+        anneal_offset = np.asarray(anneal_offset, dtype=float)
+        c_offset = self.c + anneal_offset[..., np.newaxis]
+        return np.stack(np.broadcast_arrays(
+            self.s,
+            np.interp(c_offset, self.c, self.A),
+            np.interp(c_offset, self.c, self.B),
+            c_offset), axis=-1)
+
+    def custom_energy_scales(self,
+                             custom_t: np.typing.ArrayLike,
+                             custom_s: np.typing.ArrayLike) -> np.ndarray:
+        r"""Energy scales for a custom anneal schedule.
+
+        Args:
+            custom_t: Times, :math:`t`, of the custom schedule.
+            custom_s: Normalized anneal fractions, :math:`s`, of the custom
+                schedule.
+
+        Returns:
+            :class:`numpy.ndarray`: Energy scales with columns
+            :math:`t, s, A, B, c`.
+
+        See :func:`energy_scales_custom_schedule`.
+        """
+        s, A, B, c = self.s, self.A, self.B, self.c
+        custom_t = np.asarray(custom_t)
+        # custom schedules are rounded to the precision of the table
+        precision_s = -np.log10(np.median(np.diff(s)))
+        custom_s = np.round(custom_s, decimals=int(precision_s))
+
+        intervals = []
+        for index in range(1, len(custom_s)):
+
+            if custom_s[index] == custom_s[index - 1]:  # This is a pause interval
+
+                s_index = np.where(s == custom_s[index])
+                out_interval = np.vstack((
+                    np.broadcast_to(custom_t[index - 1], s[s_index].shape),
+                    s[s_index],
+                    A[s_index],
+                    B[s_index],
+                    c[s_index])).T
+
+            else:   # This is a sloped interval
+
+                forward_anneal = custom_s[index] > custom_s[index - 1]
+
+                if forward_anneal:
+                    interval = (s <= custom_s[index]) & (s >= custom_s[index - 1])
+                else:
+                    interval = (s >= custom_s[index]) & (s <= custom_s[index - 1])
+
+                t_interp = np.interp(
+                    s[interval],
+                    sorted([custom_s[index - 1], custom_s[index]]),
+                    [custom_t[index - 1], custom_t[index]])
+
+                s_scales = np.stack((
+                    s[interval],
+                    A[interval],
+                    B[interval],
+                    c[interval]))
+
+                out_interval = np.vstack((
+                    t_interp,
+                    s_scales if forward_anneal else np.flip(s_scales, axis=1))).T
+
+                # Cut overlapped interval seams (except last interval)
+                if index < len(custom_s) - 1:
+                    out_interval = out_interval[:-1,:]
+
+            intervals.append(out_interval)
+
+        return np.concatenate([np.empty((0, 5))] + intervals, axis=0)
+
+
 def anneal_schedule_with_offset(
         anneal_offset: float = 0.0,
         anneal_schedule: Union[np.typing.ArrayLike, list, list[list[float]], None] = None,
@@ -209,26 +520,11 @@ def anneal_schedule_with_offset(
             f" specify all of `s, A, B, c`. Not all were specified.")
 
     if anneal_schedule is not None:
-
-        schedule = _asarray('anneal_schedule', anneal_schedule, 4)
-
-        s = schedule[:, 0]
-        A = schedule[:, 1]
-        B = schedule[:, 2]
-        c = schedule[:, 3]
-
+        schedule = AnnealSchedule(_asarray('anneal_schedule', anneal_schedule, 4))
     else:
+        schedule = AnnealSchedule(s=s, A=A, B=B, c=c)
 
-        s = _asarray('s', s, 1)
-        A = _asarray('A', A, 1)
-        B = _asarray('B', B, 1)
-        c = _asarray('c', c, 1)
-
-    A_offset = np.interp(c + anneal_offset, c, A)
-    B_offset = np.interp(c + anneal_offset, c, B)
-    c_offset= c + anneal_offset
-
-    return np.column_stack((s, A_offset, B_offset, c_offset))
+    return schedule.with_offset(anneal_offset)
 
 
 def energy_scales_custom_schedule(
@@ -343,78 +639,89 @@ def energy_scales_custom_schedule(
                 f" specify `custom_t and custom_s`. Both were not specified.")
 
     if default_schedule is not None:
-
-        schedule = _asarray('default_schedule', default_schedule, 4)
-
-        s = schedule[:, 0]
-        A = schedule[:, 1]
-        B = schedule[:, 2]
-        c = schedule[:, 3]
-
+        schedule = AnnealSchedule(_asarray('default_schedule', default_schedule, 4))
     else:
-
-        s = _asarray('s', s, 1)
-        A = _asarray('A', A, 1)
-        B = _asarray('B', B, 1)
-        c = _asarray('c', c, 1)
+        schedule = AnnealSchedule(s=s, A=A, B=B, c=c)
 
     if custom_schedule is not None:
 
-        schedule = _asarray('custom_schedule', custom_schedule, 2)
+        custom_schedule = _asarray('custom_schedule', custom_schedule, 2)
 
-        custom_t = schedule[:, 0]
-        custom_s = schedule[:, 1]
+        custom_t = custom_schedule[:, 0]
+        custom_s = custom_schedule[:, 1]
 
     else:
 
         custom_t = _asarray('custom_t', custom_t, 1)
         custom_s = _asarray('custom_s', custom_s, 1)
 
-    precision_s = -np.log10(np.median(np.diff(s)))
-    custom_s = np.round(custom_s, decimals=int(precision_s))
+    return schedule.custom_energy_scales(custom_t, custom_s)
 
-    out = np.empty((0, 5))
 
-    for index in range(1, len(custom_s)):
+def compress_file(file, *, block_size: int = 2**22, compresslevel: int = 6,
+                  max_workers: int = None, spool_size: int = int(1e9)):
+    """Compress a file-like object with gzip, compressing blocks in parallel.
 
-        if custom_s[index] == custom_s[index - 1]:  # This is a pause interval
+    The file is split into blocks that are compressed on a pool of threads
+    and written as consecutive gzip members. Together these form a valid
+    gzip stream that :func:`gzip.decompress` and other gzip readers restore
+    to the original contents. The output depends only on the contents and
+    the block size and compression level, not on the number of workers.
 
-            s_index = np.where(s == custom_s[index])
-            out_interval = np.vstack((
-                custom_t[index - 1],
-                s[s_index],
-                A[s_index],
-                B[s_index],
-                c[s_index])).T
-
-        else:   # This is a sloped interval
-
-            forward_anneal = custom_s[index] > custom_s[index - 1]
+    Args:
+        file (file-like):
+            A binary file-like object, such as the file returned by
+            :meth:`dimod.BinaryQuadraticModel.to_file`. It is read from the
+            start.
 
-            if forward_anneal:
-                interval = (s <= custom_s[index]) & (s >= custom_s[index - 1])
-            else:
-                interval = (s >= custom_s[index]) & (s <= custom_s[index - 1])
+        block_size (int, optional, default=4 MiB):
+            Size, in bytes, of the blocks compressed independently.
 
-            t_interp = np.interp(
-                s[interval],
-                sorted([custom_s[index - 1], custom_s[index]]),
-                [custom_t[index - 1], custom_t[index]])
+        compresslevel (int, optional, default=6):
+            Compression level, from 0 (none) to 9 (slowest and smallest).
 
-            s_scales = np.stack((
-                s[interval],
-                A[interval],
-                B[interval],
-                c[interval]))
+        max_workers (int, optional):
+            Number of threads compressing blocks. Defaults to the number of
+            CPUs.
 
-            out_interval = np.vstack((
-                t_interp,
-                s_scales if forward_anneal else np.flip(s_scales, axis=1))).T
+        spool_size (int, optional, default=1e9):
+            Size, in bytes, of the compressed data held in memory before it
+            is written to disk.
 
-            # Cut overlapped interval seams (except last interval)
-            if index < len(custom_s) - 1:
-                out_interval = out_interval[:-1,:]
+    Returns:
+        :class:`tempfile.SpooledTemporaryFile`: The compressed file, at its
+        start.
 
-        out = np.append(out, out_interval, axis=0)
+    Examples:
+        >>> import gzip
+        >>> import dimod
+        >>> from dwave.system import compress_file
+        ...
+        >>> bqm = dimod.generators.gnm_random_bqm(100, 500, 'BINARY')
+        >>> with bqm.to_file() as f, compress_file(f) as compressed:
+        ...     bqm == dimod.BQM.from_file(gzip.decompress(compressed.read()))
+        True
 
-    return out
\ No newline at end of file
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    def compress(block):
+        # a fixed mtime so that identical files compress identically
+        return gzip.compress(block, compresslevel=compresslevel, mtime=0)
+
+    compressed = tempfile.SpooledTemporaryFile(max_size=spool_size)
+
+    file.seek(0)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # bound the blocks held in memory
+        pending = collections.deque()
+        for block in iter(lambda: file.read(block_size), b''):
+            if len(pending) >= 2 * max_workers:
+                compressed.write(pending.popleft().result())
+            pending.append(executor.submit(compress, block))
+        for future in pending:
+            compressed.write(future.result())
+
+    compressed.seek(0)
+    return compressed
@@ -12,6 +12,11 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import gc
+import os
+import re
+import tempfile
+import threading
 import unittest
 from uuid import uuid4
 from unittest import mock
@@ -29,7 +34,7 @@ from dwave.cloud.testing import mocks
 from dwave.cloud.solver import StructuredSolver
 
 from dwave.system.samplers import DWaveSampler, qpu_graph
-from dwave.system.samplers.dwave_sampler import Client
+from dwave.system.samplers.dwave_sampler import Client, _get_solver_id
 from dwave.system.warnings import EnergyScaleWarning, TooFewSamplesWarning
 from dwave.system.exceptions import FailoverCondition, RetryCondition
 
@@ -91,6 +96,12 @@ class MockSolver:
 
         return future
 
+    def sample_ising(self, h, J, offset=0, **kwargs):
+        return self.sample_bqm(dimod.BQM.from_ising(h, J, offset), **kwargs)
+
+    def sample_qubo(self, Q, offset=0, **kwargs):
+        return self.sample_bqm(dimod.BQM.from_qubo(Q, offset), **kwargs)
+
 
 class TestDWaveSampler(unittest.TestCase):
     @mock.patch('dwave.system.samplers.dwave_sampler.Client')
@@ -177,6 +188,12 @@ class TestDWaveSampler(unittest.TestCase):
         self.assertIn('timing', response.info)
         self.assertIn('problem_id', response.info)
 
+    def test_timing_client(self):
+        response = self.sampler.sample_ising({0: -1, 1: 1}, {})
+
+        self.assertEqual(set(response.info['timing_client']),
+                         {'preprocessing', 'submission', 'wait', 'warnings'})
+
     def test_sample_qubo_variables(self):
 
         sampler = self.sampler
@@ -200,6 +217,104 @@ class TestDWaveSampler(unittest.TestCase):
         self.assertIn('timing', response.info)
         self.assertIn('problem_id', response.info)
 
+    def test_sample_arrays(self):
+        sampler = self.sampler
+        rng = np.random.default_rng(42)
+
+        # some repeated and reversed interactions, and some zero biases
+        edges = np.array(sampler.edgelist[:50] + sampler.edgelist[:10])
+        edges[::3] = edges[::3, ::-1]
+        row, col = edges.T
+        J = rng.uniform(-1, 1, len(edges))
+        h = np.zeros(2048)
+        h[sampler.nodelist[:20:2]] = rng.uniform(-1, 1, 10)
+
+        for vartype in (dimod.SPIN, dimod.BINARY):
+            with self.subTest(vartype=vartype):
+                bqm = dimod.BQM(vartype)
+                bqm.add_linear_from((v, h[v]) for v in np.flatnonzero(h))
+                bqm.add_quadratic_from(zip(row, col, J))
+                bqm.offset = 1.5
+
+                with mock.patch.object(MockSolver, 'sample_bqm', autospec=True,
+                                       side_effect=MockSolver.sample_bqm) as sample_bqm:
+                    sampleset = sampler.sample_arrays(h, row, col, J, offset=1.5,
+                                                      vartype=vartype, num_reads=10,
+                                                      label='arrays')
+
+                    submitted = sample_bqm.call_args.args[1]
+                    dimod.testing.assert_bqm_almost_equal(submitted, bqm)
+                    self.assertEqual(sample_bqm.call_args.kwargs,
+                                     dict(num_reads=10, label='arrays'))
+
+                self.assertIs(sampleset.vartype, vartype)
+                self.assertEqual(set(sampleset.variables), set(bqm.variables))
+                self.assertEqual(set(sampleset.info['timing_client']),
+                                 {'preprocessing', 'submission', 'wait', 'warnings'})
+
+    def test_sample_arrays_structure(self):
+        sampler = self.sampler
+        sampler.solver.nodes = set(C16.nodes)
+        u, v = sampler.edgelist[0]
+
+        for h, row, col in [([0]*42 + [1], [], []),   # inactive qubit
+                            ([0]*3000 + [1], [], []),   # out of range
+                            ([], [u], [u]),
+                            ([], [0], [1]),  # not a coupler
+                            ([], [0], [42]),
+                            ([], [-1], [4]),
+                            ([], [0], [5000])]:
+            with self.subTest(h=len(h), row=row, col=col):
+                with self.assertRaises(dimod.exceptions.BinaryQuadraticModelStructureError):
+                    sampler.sample_arrays(h, row, col, np.ones(len(row)))
+
+        with self.assertRaises(ValueError):
+            sampler.sample_arrays([], [u, u], [v], [1, 1])
+
+        # zero biases on inactive qubits are ignored
+        sampleset = sampler.sample_arrays([0]*43, [u], [v], [1])
+        self.assertEqual(set(sampleset.variables), {u, v})
+
+    def test_sample_structure(self):
+        sampler = self.sampler
+        sampler.solver.nodes = set(C16.nodes)
+        sampler.solver.sample_bqm = mock.Mock(wraps=sampler.solver.sample_bqm)
+        u, v = sampler.edgelist[0]
+
+        for bqm, offending in [(dimod.BQM({42: 1, u: 1}, {}, 0, 'SPIN'), r'qubits: 42\.'),
+                               (dimod.BQM({5000: 1}, {}, 0, 'SPIN'), r'qubits: 5000\.'),
+                               (dimod.BQM({}, {(0, 1): 1, (u, v): 1}, 0, 'SPIN'),
+                                r'couplers: \((0, 1|1, 0)\)\.'),
+                               (dimod.BQM({'a': 1, 0: 1}, {}, 0, 'SPIN'), r"qubits: 'a'\.$"),
+                               (dimod.BQM({.5: 1}, {}, 0, 'SPIN'), r'qubits: 0\.5\.$'),
+                               (dimod.BQM({(0, 4): 1, (1, 5): 1}, {}, 0, 'SPIN'),
+                                r'qubits: \(0, 4\), \(1, 5\)\.$'),
+                               (dimod.BQM({0: 1, (1, 5): 1}, {}, 0, 'SPIN'),
+                                r'qubits: \(1, 5\)\.$')]:
+            with self.subTest(bqm=bqm):
+                with self.assertRaisesRegex(dimod.exceptions.BinaryQuadraticModelStructureError,
+                                            offending):
+                    sampler.sample(bqm)
+                sampler.solver.sample_bqm.assert_not_called()
+
+        # long lists of offending qubits are truncated
+        bqm = dimod.BQM({q: 1 for q in range(2048, 2100)}, {}, 0, 'SPIN')
+        with self.assertRaisesRegex(dimod.exceptions.BinaryQuadraticModelStructureError,
+                                    re.escape('... (52 in total)')):
+            sampler.sample(bqm)
+
+        sampler.sample(dimod.BQM({u: 1}, {(u, v): 1}, 0, 'SPIN')).resolve()
+        sampler.solver.sample_bqm.assert_called_once()
+
+        # variables need not be in sorted order
+        w = max(sampler.nodelist)
+        bqm = dimod.BQM('SPIN')
+        for q in (w, v, u):
+            bqm.add_variable(q, 1)
+        bqm.add_interaction(u, v, 1)
+        sampler.sample(bqm).resolve()
+        self.assertEqual(sampler.solver.sample_bqm.call_count, 2)
+
     def test_problem_labelling(self):
         sampler = self.sampler
 
@@ -425,6 +540,84 @@ class TestDWaveSamplerFailover(unittest.TestCase):
             sampler.trigger_failover()
             self.assertEqual(sampler.solver, c1)
 
+    @mock.patch.object(Client, 'create_session', lambda client: mock.Mock())
+    def test_health_tracking(self):
+        p4 = StructuredSolver(data=mocks.qpu_pegasus_solver_data(4), client=None)
+        p6 = StructuredSolver(data=mocks.qpu_pegasus_solver_data(6), client=None)
+        c4 = StructuredSolver(data=mocks.qpu_chimera_solver_data(4), client=None)
+
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [p4, p6, c4]):
+            with DWaveSampler(failover=True, token='mock', health_check_interval=60) as sampler:
+                self.assertEqual(sampler.solver, p6)
+                sampler._monitor.refresh()
+
+                breakers = sampler._monitor._breakers
+
+                def fail():
+                    fut = computation.Future(sampler.solver, None)
+                    fut._set_exception(exceptions.SolverOfflineError)
+                    with mock.patch.object(StructuredSolver, 'sample_bqm', return_value=fut):
+                        with self.assertRaises(FailoverCondition):
+                            sampler.sample_ising({}, {}).resolve()
+
+                # failover to the prepared solvers, without querying SAPI
+                with mock.patch.object(Client, 'get_solvers', side_effect=RuntimeError):
+                    sampler.trigger_failover()
+                    self.assertEqual(sampler.solver, p4)
+                    self.assertEqual(vars(sampler)['_nodelist'], sorted(p4.nodes))
+                    self.assertEqual(sampler.properties, p4.properties)
+
+                    # a failover on its own does not count as a failure
+                    self.assertEqual(breakers[_get_solver_id(p6)].failures, 0)
+
+                    # a failed resolve is recorded once and opens the breaker
+                    fail()
+                    self.assertEqual(breakers[_get_solver_id(p4)].failures, 1)
+                    sampler.trigger_failover()
+                    self.assertEqual(breakers[_get_solver_id(p4)].failures, 1)
+                    self.assertEqual(sampler.solver, p6)
+
+                    fail()
+                    sampler.trigger_failover()
+                    self.assertEqual(sampler.solver, c4)
+                    self.assertEqual(sampler.edgelist[0], min(tuple(sorted(e)) for e in c4.edges))
+
+                # all solvers failed recently, so SAPI is queried
+                fail()
+                with mock.patch.object(Client, 'get_solvers', wraps=sampler.client.get_solvers) as get_solvers:
+                    sampler.trigger_failover()
+                    get_solvers.assert_called()
+                self.assertEqual(sampler.solver, p4)
+
+                # a successful resolve closes the breaker
+                sampler._monitor.record_success(_get_solver_id(p6))
+                self.assertEqual(breakers[_get_solver_id(p6)].failures, 0)
+                sampler.trigger_failover()
+                self.assertEqual(sampler.solver, p6)
+
+            self.assertFalse(sampler._monitor._thread.is_alive())
+
+    @mock.patch.object(Client, 'create_session', lambda client: mock.Mock())
+    def test_health_monitor_lifetime(self):
+        p6 = StructuredSolver(data=mocks.qpu_pegasus_solver_data(6), client=None)
+
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [p6]):
+            # the monitor stops when the sampler is closed
+            sampler = DWaveSampler(token='mock', health_check_interval=60)
+            thread = sampler._monitor._thread
+            sampler.close()
+            self.assertFalse(thread.is_alive())
+
+            # or garbage-collected
+            sampler = DWaveSampler(token='mock', health_check_interval=60)
+            thread = sampler._monitor._thread
+            client = sampler.client
+            del sampler
+            gc.collect()
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
+            client.close()
+
     @mock.patch.object(Client, 'create_session', lambda client: mock.Mock())
     def test_solver_not_found(self):
         # verify DWaveSampler still fails in case no solvers are available
@@ -440,6 +633,116 @@ class TestDWaveSamplerFailover(unittest.TestCase):
                 DWaveSampler(failover=True, token='mock', solver=solver_def)
 
 
+class TestDWaveSamplerSolverCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        self.p4 = StructuredSolver(data=mocks.qpu_pegasus_solver_data(4), client=None)
+        self.p6 = StructuredSolver(data=mocks.qpu_pegasus_solver_data(6), client=None)
+
+    @mock.patch.object(Client, 'create_session', lambda client: mock.Mock())
+    def test_cached(self):
+        fetch = mock.Mock(return_value=[self.p4, self.p6])
+
+        with mock.patch.object(Client, '_fetch_solvers', fetch):
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+            self.assertEqual(sampler.solver, self.p6)
+            fetch.assert_called_once()
+
+            with mock.patch.object(Client, 'get_solvers', side_effect=RuntimeError) as get_solvers:
+                cached = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+
+                # constructed without querying SAPI
+                self.assertEqual(cached.nodelist, sampler.nodelist)
+                self.assertEqual(cached.edgelist, sampler.edgelist)
+                self.assertEqual(cached.properties, sampler.properties)
+                self.assertEqual(cached.solver.identity, self.p6.identity)
+
+                # but the validation, once complete, fails
+                with self.assertRaises(RuntimeError):
+                    cached._wait_for_validation()
+
+        # a different configuration is cached separately
+        with mock.patch.object(Client, '_fetch_solvers', fetch):
+            DWaveSampler(token='other', solver_cache=self.tmpdir.name)
+        self.assertEqual(fetch.call_count, 2)
+
+    @mock.patch.object(Client, 'create_session', lambda client: mock.Mock())
+    def test_validation(self):
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [self.p4, self.p6]):
+            DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [self.p4, self.p6]):
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+            edgelist = sampler.edgelist
+            sampler._wait_for_validation()
+
+        self.assertIs(sampler.solver, self.p6)  # the online solver
+        self.assertIs(sampler.edgelist, edgelist)
+
+        # cached solver went offline
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [self.p4]):
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+            sampler._wait_for_validation()
+
+        self.assertIs(sampler.solver, self.p4)
+        self.assertEqual(sampler.nodelist, sorted(self.p4.nodes))
+
+        # problems are checked against the validated solver, not the cached one
+        q = max(self.p6.nodes)
+        os.remove(sampler._solver_cache.path)
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [self.p4, self.p6]):
+            DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+        validated = threading.Event()
+
+        def fetch_solvers(*args, **kwargs):
+            validated.wait()
+            return [self.p4]
+
+        with mock.patch.object(Client, '_fetch_solvers', fetch_solvers), \
+                mock.patch.object(StructuredSolver, 'sample_ising') as sample_ising:
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+            threading.Timer(.05, validated.set).start()  # still validating when sampled
+            with self.assertRaises(dimod.exceptions.BinaryQuadraticModelStructureError):
+                sampler.sample_arrays(np.eye(q + 1)[q], [], [], [])
+            sample_ising.assert_not_called()
+
+        # and the cache is updated
+        with mock.patch.object(Client, 'get_solvers', side_effect=RuntimeError):
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+            self.assertEqual(sampler.solver.identity, self.p4.identity)
+            sampler.close()
+
+    @mock.patch.object(Client, 'create_session', lambda client: mock.Mock())
+    def test_dict_solver_data(self):
+        # solver data is a dict, not a pydantic model, before cloud-client 0.14
+        p4 = StructuredSolver(data=mocks.qpu_pegasus_solver_data(4), client=None)
+        if hasattr(p4.data, 'model_dump'):
+            p4.data = p4.data.model_dump(mode='json')
+
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [p4]):
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+
+        with mock.patch.object(Client, 'get_solvers', side_effect=RuntimeError):
+            cached = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+            self.assertEqual(cached.nodelist, sampler.nodelist)
+            self.assertEqual(cached.properties, sampler.properties)
+            cached.close()
+
+    @mock.patch.object(Client, 'create_session', lambda client: mock.Mock())
+    def test_corrupted(self):
+        with mock.patch.object(Client, '_fetch_solvers', lambda *pa, **kw: [self.p4]):
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+
+            with open(sampler._solver_cache.path, 'wb') as f:
+                f.write(b'garbage')
+
+            sampler = DWaveSampler(token='mock', solver_cache=self.tmpdir.name)
+            self.assertIsNone(sampler._validation)
+            self.assertEqual(sampler.solver, self.p4)
+
+
 class TestDWaveSamplerAnnealSchedule(unittest.TestCase):
     def test_typical(self):
         class MockScheduleSampler(DWaveSampler):
@@ -21,6 +21,7 @@ from unittest import mock
 
 import dimod
 import dwave_networkx as dnx
+import numpy as np
 from parameterized import parameterized_class
 
 import dwave.embedding
@@ -298,6 +299,16 @@ class TestEmbeddingComposite(unittest.TestCase):
         sampleset = sampler.sample_ising({}, {'ab': 1, 'bc': 1, 'ca': 1})
         self.assertNotIn('embedding_context', sampleset.info)
 
+    def test_timing_client(self):
+        sampler = EmbeddingComposite(MockDWaveSampler(parameter_warnings=False))
+
+        sampleset = sampler.sample_ising({}, {'ab': 1, 'bc': 1, 'ca': 1})
+
+        # stages of the composite are added to those of the child
+        self.assertEqual(set(sampleset.info['timing_client']),
+                         {'embedding_search', 'bias_embedding', 'warnings',
+                          'unembedding', 'submission'})
+
     def test_return_embedding_as_class_variable(self):
         nodelist = [0, 1, 2]
         edgelist = [(0, 1), (1, 2), (0, 2)]
@@ -455,6 +466,26 @@ class TestFixedEmbeddingComposite(unittest.TestCase):
 
         self.assertEqual(set(resp.variables), {'a', 'b', 'c'})
 
+    def test_initial_state(self):
+        child = dimod.TrackingComposite(MockDWaveSampler(parameter_warnings=False))
+        sampler = FixedEmbeddingComposite(child, {'a': [0, 4], 'b': [1, 5], 'c': [2, 6]})
+
+        sampler.sample_ising({'a': 1, 'b': 1, 'c': 0}, {},
+                             initial_state={'a': -1, 'b': 1, 'c': -1})
+
+        self.assertEqual(child.input['initial_state'],
+                         {0: -1, 4: -1, 1: 1, 5: 1, 2: -1, 6: -1})
+
+    def test_initial_state_array(self):
+        child = dimod.TrackingComposite(MockDWaveSampler(parameter_warnings=False))
+        sampler = FixedEmbeddingComposite(child, {0: [0, 4], 1: [1, 5], 2: [2, 6]})
+
+        sampler.sample_ising({0: 1, 1: 1, 2: 0}, {},
+                             initial_state=np.array([1, -1, 1], dtype=np.int8))
+
+        self.assertEqual(child.input['initial_state'],
+                         {0: 1, 4: 1, 1: -1, 5: -1, 2: 1, 6: 1})
+
     def test_adjacency(self):
         square_adj = {1: [2, 3], 2: [1, 4], 3: [1, 4], 4: [2, 3]}
         with self.assertWarns(DeprecationWarning):
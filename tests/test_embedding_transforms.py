@@ -496,6 +496,52 @@ class TestEmbedBQM(unittest.TestCase):
                                       {})
 
 
+class TestEmbedSamples(unittest.TestCase):
+    def test_single_sample(self):
+        embedding = {'a': [0], 'b': [1], 'c': [2, 3]}
+
+        samples, labels = dwave.embedding.embed_samples({'c': 1, 'a': -1, 'b': 1}, embedding)
+
+        self.assertEqual(labels, [0, 1, 2, 3])
+        npt.assert_array_equal(samples, [[-1, 1, 1, 1]])
+
+    def test_multiple_samples(self):
+        embedding = {'a': (1, 2), 'b': (3, 4), 'c': (5, 0)}
+
+        samples, labels = dwave.embedding.embed_samples(
+            ([[1, 0, 1], [0, 1, 0]], 'abc'), embedding)
+
+        self.assertEqual(labels, [1, 2, 3, 4, 5, 0])
+        npt.assert_array_equal(samples, [[1, 1, 0, 0, 1, 1], [0, 0, 1, 1, 0, 0]])
+
+    def test_array(self):
+        embedding = {2: [0, 1], 0: [2], 1: [3]}
+
+        samples, labels = dwave.embedding.embed_samples(np.array([-1, 1, 1]), embedding)
+
+        self.assertEqual(labels, [0, 1, 2, 3])
+        npt.assert_array_equal(samples, [[1, 1, -1, 1]])
+
+    def test_embedded_structure(self):
+        G = [(0, 1), (1, 2), (2, 3), (3, 0)]
+        emb_s = dwave.embedding.EmbeddedStructure(G, {'a': [0, 1], 'b': [2, 3]})
+
+        for state in ({'a': 1, 'b': -1}, {'a': -1, 'b': 1}):
+            samples, labels = dwave.embedding.embed_samples(state, emb_s)
+            self.assertEqual(dict(zip(labels, samples[0])),
+                             {0: state['a'], 1: state['a'], 2: state['b'], 3: state['b']})
+
+    def test_empty(self):
+        samples, labels = dwave.embedding.embed_samples({}, {})
+
+        self.assertEqual(labels, [])
+        self.assertEqual(samples.shape, (1, 0))
+
+    def test_missing_variable(self):
+        with self.assertRaises(ValueError):
+            dwave.embedding.embed_samples({'a': 1}, {'a': [0], 'b': [1]})
+
+
 class TestEmbeddedStructure(unittest.TestCase):
     def test_empty_embedding(self):
         a = dwave.embedding.EmbeddedStructure([], {})
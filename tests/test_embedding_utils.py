@@ -14,6 +14,7 @@
 
 import unittest
 import itertools
+import warnings
 import random
 
 from collections.abc import Mapping
@@ -73,6 +74,25 @@ class TestTargetToSource(unittest.TestCase):
         self.assertEqual(source_adjacency, {'a': {'b', 'c'}, 'b': {'a', 'c'}, 'c': {'a', 'b'}})
 
 
+    def test_labels(self):
+        target_adjacency = {'a': {'b'}, 'b': {'a', (0, 1)}, (0, 1): {'b'}}
+        embedding = {0: {'a'}, 1: {'b', (0, 1)}}
+        source_adjacency = dwave.embedding.target_to_source(target_adjacency, embedding)
+        self.assertEqual(source_adjacency, {0: {1}, 1: {0}})
+
+    def test_chain_pairs(self):
+        target = nx.path_graph(6)
+        chains = [[0, 1], [2], [3, 4]]
+        pairs = dwave.embedding.utils._chain_pairs(target, chains)
+        npt.assert_array_equal(pairs, [[0, 1], [1, 2]])
+
+        # large, sparse labels are not used as indices
+        target = nx.relabel_nodes(target, {5: 10**15})
+        chains = [[0, 1], [2], [3, 4, 10**15]]
+        pairs = dwave.embedding.utils._chain_pairs(target, chains)
+        npt.assert_array_equal(pairs, [[0, 1], [1, 2]])
+
+
 class TestEdgelistToAdjacency(unittest.TestCase):
     def test_typical(self):
         graph = nx.barbell_graph(17, 8)
@@ -234,6 +254,61 @@ class TestChainBreakFrequency(unittest.TestCase):
 
         self.assertEqual(freq, {0: 3./5, 1: 0})
 
+
+class TestChainBreakAccumulator(unittest.TestCase):
+    def test_streaming_matches_concatenated(self):
+        embedding = {0: ['a', 'b'], 1: ['c'], 2: ['d', 'e', 'f']}
+        rng = np.random.default_rng(42)
+
+        samplesets = []
+        for _ in range(4):
+            samples = rng.choice([-1, 1], size=(20, 6))
+            samplesets.append(dimod.SampleSet.from_samples(
+                (samples, 'abcdef'), energy=0, vartype=dimod.SPIN).aggregate())
+
+        accumulator = dwave.embedding.ChainBreakAccumulator(embedding)
+        for sampleset in samplesets:
+            accumulator.update(sampleset)
+
+        self.assertEqual(accumulator.num_samples, 80)
+
+        expected = dwave.embedding.chain_break_frequency(
+            dimod.concatenate(samplesets), embedding)
+        for v, f in accumulator.frequency().items():
+            self.assertAlmostEqual(f, expected[v])
+
+        self.assertEqual(accumulator.frequency()[1], 0)
+
+    def test_label_order(self):
+        accumulator = dwave.embedding.ChainBreakAccumulator({'x': ['a', 'b']})
+
+        accumulator.update(([[1, -1, 1]], 'abc'))
+        accumulator.update(([[1, 1, -1]], 'cab'))
+        accumulator.update(([[1, 1]], 'ba'))
+
+        self.assertEqual(accumulator.num_samples, 3)
+        self.assertEqual(accumulator.frequency(), {'x': 2/3})
+
+    def test_empty_embedding(self):
+        accumulator = dwave.embedding.ChainBreakAccumulator({})
+        accumulator.update(np.ones((3, 2)))
+
+        self.assertEqual(accumulator.frequency(), {})
+        self.assertEqual(accumulator.num_samples, 3)
+
+
+    def test_no_samples(self):
+        accumulator = dwave.embedding.ChainBreakAccumulator({'x': ['a', 'b']})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(accumulator.frequency(), {'x': 0})
+
+            accumulator.update((np.empty((0, 2)), 'ab'))
+            self.assertEqual(accumulator.num_samples, 0)
+            self.assertEqual(accumulator.frequency(), {'x': 0})
+
+
 class TestIntLabelDisjointSets(unittest.TestCase):
     def test(self):
         components = map(list, [range(1), range(1, 3), range(3, 6), range(6, 12)])
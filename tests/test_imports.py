@@ -0,0 +1,68 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import importlib
+import json
+import pkgutil
+import subprocess
+import sys
+import unittest
+
+import dwave.system
+
+
+def imported_modules(statement):
+    """Return the modules imported by ``statement`` in a fresh interpreter."""
+    code = f"{statement}; import json, sys; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, '-c', code],
+                            check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_budget(self):
+        # importing the package, or a composite, does not import the samplers
+        # and their heavy dependencies
+        heavy = {'scipy.optimize', 'dwave.cloud.client', 'dwave.optimization',
+                 'dwave.system.samplers.dwave_sampler', 'dwave.system.temperatures'}
+
+        for statement in ['import dwave.system',
+                          'from dwave.system import FixedEmbeddingComposite',
+                          'from dwave.system.composites import CutOffComposite']:
+            with self.subTest(statement):
+                self.assertFalse(heavy & imported_modules(statement))
+
+    def test_public_names(self):
+        for package in ['dwave.system.samplers', 'dwave.system.composites']:
+            with self.subTest(package):
+                package = importlib.import_module(package)
+                names = {'ResultInfoDict'} if package is dwave.system.samplers else set()
+                for submodule in pkgutil.iter_modules(package.__path__):
+                    module = importlib.import_module(f'{package.__name__}.{submodule.name}')
+                    names.update(module.__all__)
+                self.assertEqual(set(package.__all__), names)
+
+        from dwave.system import temperatures, utilities
+        for module in [dwave.system.samplers, dwave.system.composites,
+                       temperatures, utilities]:
+            for name in module.__all__:
+                self.assertIs(getattr(dwave.system, name), getattr(module, name))
+                self.assertIn(name, dwave.system.__all__)
+                self.assertIn(name, dir(dwave.system))
+
+    def test_submodules(self):
+        self.assertIs(dwave.system.warnings, importlib.import_module('dwave.system.warnings'))
+
+        with self.assertRaises(AttributeError):
+            dwave.system.not_an_attribute
@@ -0,0 +1,128 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import concurrent.futures
+import unittest
+
+import dimod
+
+from dwave.system import CutOffComposite, EmbeddingComposite
+from dwave.system.instrumentation import (
+    StageTimer, add_timing_callback, remove_timing_callback)
+from dwave.system.testing import MockDWaveSampler
+
+
+class TestStageTimer(unittest.TestCase):
+    def test_stages(self):
+        timer = StageTimer(None)
+
+        with timer.stage('a'):
+            pass
+        timer.record('b', 2.)
+        timer.record('b', 3.)
+
+        self.assertEqual(set(timer.timing), {'a', 'b'})
+        self.assertGreaterEqual(timer.timing['a'], 0)
+        self.assertEqual(timer.timing['b'], 5.)
+
+    def test_stage_exception(self):
+        timer = StageTimer(None)
+
+        with self.assertRaises(ZeroDivisionError):
+            with timer.stage('a'):
+                1 / 0
+
+        self.assertIn('a', timer.timing)
+
+    def test_update(self):
+        child_timing = {'a': 1., 'b': 2.}
+        sampleset = dimod.SampleSet.from_samples(
+            [], 'SPIN', energy=[], info=dict(timing_client=child_timing))
+
+        timer = StageTimer(None)
+        timer.record('b', 1.)
+        timer.record('c', 1.)
+        self.assertIs(timer.update(sampleset), sampleset)
+
+        self.assertEqual(sampleset.info['timing_client'], {'a': 1., 'b': 3., 'c': 1.})
+        self.assertEqual(child_timing, {'a': 1., 'b': 2.})  # not modified
+
+    def test_deferred_update(self):
+        timer = StageTimer(None)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(dimod.ExactSolver().sample_ising, {'a': 1}, {})
+            sampleset = timer.deferred_update(dimod.SampleSet.from_future(future))
+
+        self.assertEqual(set(sampleset.info['timing_client']), {'wait'})
+        self.assertEqual(len(sampleset), 2)
+
+
+class TestTimingCallbacks(unittest.TestCase):
+    def test_nested_composites(self):
+        calls = []
+
+        def callback(sampler, timing):
+            calls.append((type(sampler), timing))
+
+        add_timing_callback(callback)
+        self.addCleanup(remove_timing_callback, callback)
+
+        sampler = CutOffComposite(
+            EmbeddingComposite(MockDWaveSampler(parameter_warnings=False)), .5)
+        sampleset = sampler.sample_ising({}, {'ab': 1, 'bc': .1, 'ca': 1})
+
+        self.assertEqual([cls for cls, _ in calls],
+                         [MockDWaveSampler, EmbeddingComposite, CutOffComposite])
+
+        # the stages reported to callbacks are those in the sample set
+        total = {}
+        for _, timing in calls:
+            total.update(timing)
+        self.assertEqual(total, sampleset.info['timing_client'])
+
+    def test_remove(self):
+        calls = []
+        callback = lambda sampler, timing: calls.append(timing)
+
+        add_timing_callback(callback)
+        remove_timing_callback(callback)
+
+        sampler = MockDWaveSampler()
+        sampler.sample_ising({sampler.nodelist[0]: 1}, {}).resolve()
+
+        self.assertEqual(calls, [])
+
+        with self.assertRaises(ValueError):
+            remove_timing_callback(callback)
+
+    def test_failing_callback(self):
+        calls = []
+
+        def failing(sampler, timing):
+            raise RuntimeError
+
+        def callback(sampler, timing):
+            calls.append(timing)
+
+        for cb in (failing, callback):
+            add_timing_callback(cb)
+            self.addCleanup(remove_timing_callback, cb)
+
+        sampler = MockDWaveSampler()
+        with self.assertLogs('dwave.system.instrumentation', 'ERROR'):
+            sampleset = sampler.sample_ising({sampler.nodelist[0]: 1}, {})
+            sampleset.resolve()
+
+        self.assertIn('submission', sampleset.info['timing_client'])
+        self.assertEqual(len(calls), 1)  # later callbacks are still called
@@ -12,12 +12,23 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import threading
 import unittest
 import unittest.mock
 
 import dimod
 
 from dwave.system import LeapHybridCQMSampler
+from dwave.system.testing import MockLeapHybridSolver
+
+
+class MockClient:
+    @classmethod
+    def from_config(cls, *args, **kwargs):
+        return cls()
+
+    def get_solver(self, *args, **kwargs):
+        return MockLeapHybridSolver()
 
 
 class TestTimeLimit(unittest.TestCase):
@@ -39,9 +50,10 @@ class TestTimeLimit(unittest.TestCase):
                 supported_problem_types = ['cqm']
 
                 def sample_cqm(self, cqm, time_limit):
-                    # return the time_limit rather than a sampleset
+                    # return the time_limit in an otherwise empty sampleset
                     ret = unittest.mock.Mock()
-                    ret.sampleset = time_limit
+                    ret.sampleset = dimod.SampleSet.from_samples(
+                        [], 'BINARY', energy=[], info=dict(time_limit=time_limit))
                     return ret
 
                 def upload_problem(self, *args, **kwargs):
@@ -70,7 +82,26 @@ class TestTimeLimit(unittest.TestCase):
         with cqm.to_file() as f:
             new = dimod.ConstrainedQuadraticModel().from_file(f)
 
-        self.assertEqual(sampler.sample_cqm(new), sampler.sample_cqm(cqm))
+        self.assertEqual(sampler.sample_cqm(new).info['time_limit'],
+                         sampler.sample_cqm(cqm).info['time_limit'])
+
+    @unittest.mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client', MockClient)
+    def test_upload_cache(self):
+        sampler = LeapHybridCQMSampler()
+
+        cqm = dimod.ConstrainedQuadraticModel()
+        cqm.add_variables('BINARY', 5)
+        cqm.add_constraint([(0, 1, 1)], '<=', 1)
+
+        with unittest.mock.patch.object(sampler.solver, 'upload_problem',
+                                        wraps=sampler.solver.upload_problem) as upload_problem:
+            sampler.sample_cqm(cqm, time_limit=5).resolve()
+            sampler.sample_cqm(cqm, time_limit=10).resolve()
+            self.assertEqual(upload_problem.call_count, 1)
+
+            cqm.add_variable('BINARY')
+            sampler.sample_cqm(cqm, time_limit=5).resolve()
+            self.assertEqual(upload_problem.call_count, 2)
 
     @unittest.mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
     def test_close(self, mock_client):
@@ -89,3 +120,56 @@ class TestTimeLimit(unittest.TestCase):
             with LeapHybridCQMSampler():
                 ...
             mock_client.from_config.return_value.close.assert_called_once()
+
+
+@unittest.mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client', MockClient)
+class TestMockSolver(unittest.TestCase):
+    def setUp(self):
+        self.cqm = cqm = dimod.ConstrainedQuadraticModel()
+        cqm.add_variables('INTEGER', 'ijk', lower_bound=1, upper_bound=5)
+        cqm.set_objective([('i', 'j', 1.5), ('k', -1)])
+        cqm.add_constraint([('i', 1), ('k', 2)], '<=', 8, label='c0')
+
+    def test_compress_uploads(self):
+        sampler = LeapHybridCQMSampler(compress_uploads=True)
+
+        with unittest.mock.patch.object(sampler.solver, 'sample_cqm',
+                                        wraps=sampler.solver.sample_cqm) as sample_cqm:
+            sampleset = sampler.sample_cqm(self.cqm)
+            self.assertEqual(sampleset.first.sample, dict(i=1, j=1, k=1))
+            self.assertIn('compression', sampleset.info['timing_client'])
+
+        # the solver decompresses the uploaded model
+        self.assertTrue(sample_cqm.call_args.args[0].is_equal(self.cqm))
+
+    def test_compress_uploads_unsupported(self):
+        sampler = LeapHybridCQMSampler()
+        with unittest.mock.patch.dict(sampler.solver.properties, supported_compression=[]):
+            with self.assertRaises(ValueError):
+                LeapHybridCQMSampler(compress_uploads=True)
+
+    def test_background_upload(self):
+        sampler = LeapHybridCQMSampler()
+
+        gate = threading.Event()
+        upload_problem = sampler.solver.upload_problem
+
+        def gated_upload_problem(*args, **kwargs):
+            gate.wait()
+            return upload_problem(*args, **kwargs)
+
+        with unittest.mock.patch.object(sampler.solver, 'upload_problem',
+                                        side_effect=gated_upload_problem):
+            sampleset = sampler.sample_cqm(self.cqm)
+            self.assertFalse(sampleset.done())
+
+            # the CQM is serialized before sample_cqm returns
+            self.cqm.set_lower_bound('i', 2)
+
+            threading.Timer(.1, gate.set).start()
+            self.assertEqual(sampleset.first.sample, dict(i=1, j=1, k=1))
+
+            # the wait for the solver excludes the upload
+            timing = sampleset.info['timing_client']
+            self.assertGreaterEqual(timing['upload'], .1)
+            self.assertLess(timing['wait'], .1)
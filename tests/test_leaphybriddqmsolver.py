@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import threading
 import unittest
 
 from unittest.mock import patch
@@ -19,6 +20,16 @@ from unittest.mock import patch
 import dimod
 
 from dwave.system import LeapHybridDQMSampler
+from dwave.system.testing import MockLeapHybridSolver
+
+
+class MockClient:
+    @classmethod
+    def from_config(cls, *args, **kwargs):
+        return cls()
+
+    def get_solver(self, *args, **kwargs):
+        return MockLeapHybridSolver()
 
 
 class TestLeapHybridDQMSampler(unittest.TestCase):
@@ -78,3 +89,57 @@ class TestLeapHybridDQMSampler(unittest.TestCase):
             with LeapHybridDQMSampler():
                 ...
             mock_client.from_config.return_value.close.assert_called_once()
+
+
+@patch('dwave.system.samplers.leap_hybrid_sampler.Client', MockClient)
+class TestMockSolver(unittest.TestCase):
+    def setUp(self):
+        self.dqm = dqm = dimod.DQM()
+        u = dqm.add_variable(3, 'u')
+        v = dqm.add_variable(2, 'v')
+        dqm.set_linear(u, [1, 2, 3])
+        dqm.set_quadratic(u, v, {(0, 1): -1, (2, 0): .5})
+        dqm.offset = 1.5
+
+    def test_compress_uploads(self):
+        sampler = LeapHybridDQMSampler(compress_uploads=True)
+
+        with patch.object(sampler.solver, 'sample_dqm',
+                          wraps=sampler.solver.sample_dqm) as sample_dqm:
+            sampleset = sampler.sample_dqm(self.dqm)
+            self.assertEqual(sampleset.first.sample, dict(u=0, v=0))
+            self.assertEqual(sampleset.first.energy, self.dqm.energy(dict(u=0, v=0)))
+            self.assertIn('compression', sampleset.info['timing_client'])
+
+        # the solver decompresses the uploaded model, without its labels
+        uploaded = sample_dqm.call_args.args[0]
+        uploaded.relabel_variables(dict(enumerate(self.dqm.variables)))
+        for sample in [dict(u=0, v=1), dict(u=2, v=0), dict(u=1, v=1)]:
+            self.assertEqual(uploaded.energy(sample), self.dqm.energy(sample))
+
+    def test_background_upload(self):
+        sampler = LeapHybridDQMSampler()
+
+        gate = threading.Event()
+        upload_problem = sampler.solver.upload_problem
+
+        def gated_upload_problem(*args, **kwargs):
+            gate.wait()
+            return upload_problem(*args, **kwargs)
+
+        with patch.object(sampler.solver, 'upload_problem', side_effect=gated_upload_problem):
+            sampleset = sampler.sample_dqm(self.dqm)
+            self.assertFalse(sampleset.done())
+
+            # the sampled DQM is copied
+            self.dqm.set_linear('u', [-1, 2, 3])
+            self.dqm.relabel_variables({'u': 'x'})
+
+            threading.Timer(.1, gate.set).start()
+            self.assertEqual(set(sampleset.variables), {'u', 'v'})
+            self.assertEqual(sampleset.first.energy, 2.5)
+
+            # the wait for the solver excludes the upload
+            timing = sampleset.info['timing_client']
+            self.assertGreaterEqual(timing['upload'], .1)
+            self.assertLess(timing['wait'], .1)
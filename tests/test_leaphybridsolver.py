@@ -12,6 +12,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import concurrent.futures
+import threading
 import unittest
 import unittest.mock as mock
 import numpy as np
@@ -186,3 +188,95 @@ class TestLeapHybridSampler(unittest.TestCase):
         self.assertEqual(cols, 2)
         self.assertTrue(np.all(response.record.sample >= 0))
         self.assertIs(response.vartype, dimod.BINARY)
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_upload_cache(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        bqm = dimod.BinaryQuadraticModel({'a': -1, 'b': 1}, {'ab': -1}, 0, dimod.SPIN)
+
+        with self.subTest('identical problems are uploaded once'):
+            sampler = LeapHybridSampler()
+            with mock.patch.object(sampler.solver, 'upload_bqm',
+                                   wraps=sampler.solver.upload_bqm) as upload_bqm:
+                sampler.sample(bqm).resolve()
+                sampler.sample(bqm.copy(), time_limit=5).resolve()
+                self.assertEqual(upload_bqm.call_count, 1)
+
+                bqm.set_linear('a', 1)
+                sampler.sample(bqm).resolve()
+                self.assertEqual(upload_bqm.call_count, 2)
+
+        with self.subTest('disabled'):
+            sampler = LeapHybridSampler(upload_cache_ttl=0)
+            with mock.patch.object(sampler.solver, 'upload_bqm',
+                                   wraps=sampler.solver.upload_bqm) as upload_bqm:
+                sampler.sample(bqm).resolve()
+                sampler.sample(bqm).resolve()
+                self.assertEqual(upload_bqm.call_count, 2)
+
+        with self.subTest('expired'):
+            sampler = LeapHybridSampler(upload_cache_ttl=1)
+            with mock.patch.object(sampler.solver, 'upload_bqm',
+                                   wraps=sampler.solver.upload_bqm) as upload_bqm, \
+                    mock.patch('dwave.system.samplers.leap_hybrid_sampler.monotonic',
+                               side_effect=[0, 2]):
+                sampler.sample(bqm).resolve()
+                sampler.sample(bqm).resolve()
+                self.assertEqual(upload_bqm.call_count, 2)
+
+        with self.subTest('failed uploads are not reused'):
+            sampler = LeapHybridSampler()
+            failed = concurrent.futures.Future()
+            failed.set_exception(RuntimeError())
+            with mock.patch.object(sampler.solver, 'upload_bqm',
+                                   side_effect=[failed, sampler.solver.upload_bqm(bqm.to_file())]):
+                with self.assertRaises(RuntimeError):
+                    sampler.sample(bqm).resolve()
+                sampler.sample(bqm).resolve()
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_background_upload(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        bqm = dimod.BinaryQuadraticModel({'a': -1, 'b': -1}, {}, 0, dimod.SPIN)
+
+        sampler = LeapHybridSampler()
+
+        gate = threading.Event()
+        upload_bqm = sampler.solver.upload_bqm
+
+        def gated_upload_bqm(*args, **kwargs):
+            gate.wait()
+            return upload_bqm(*args, **kwargs)
+
+        with mock.patch.object(sampler.solver, 'upload_bqm', side_effect=gated_upload_bqm):
+            samplesets = [sampler.sample(bqm), sampler.sample(bqm, time_limit=2)]
+            bqm.set_linear('a', 1)  # the sampled BQM is copied
+            self.assertFalse(any(sampleset.done() for sampleset in samplesets))
+
+            gate.set()
+            for sampleset in samplesets:
+                self.assertEqual(sampleset.first.sample, {'a': 1, 'b': 1})
+                self.assertIn('upload', sampleset.info['timing_client'])
+
+    @mock.patch('dwave.system.samplers.leap_hybrid_sampler.Client')
+    def test_compress_uploads(self, mock_client):
+
+        mock_client.from_config.side_effect = MockClient
+
+        bqm = dimod.BinaryQuadraticModel({'a': -1, 'b': -1}, {'ab': .5}, 0, dimod.SPIN)
+
+        sampler = LeapHybridSampler(compress_uploads=True)
+
+        with mock.patch.object(sampler.solver, 'upload_bqm',
+                               wraps=sampler.solver.upload_bqm) as upload_bqm:
+            sampleset = sampler.sample(bqm)
+            self.assertEqual(sampleset.first.sample, {'a': 1, 'b': 1})
+            self.assertIn('compression', sampleset.info['timing_client'])
+
+            # identical problems compress identically, so are uploaded once
+            sampler.sample(bqm).resolve()
+            self.assertEqual(upload_bqm.call_count, 1)
@@ -14,17 +14,23 @@
 
 """who watches the watchmen?"""
 import os
+import threading
+import time
 import unittest
 from unittest import mock
 import warnings
 
+import dwave_networkx as dnx
 import numpy as np
 import dimod
 import dimod.testing as dit
 
 from dwave.system import DWaveSampler
-from dwave.system.testing import MockDWaveSampler, MockLeapHybridDQMSampler
+from dwave.system.testing import (
+    MockDWaveSampler, MockLeapHybridDQMSampler, LoadTestSampler)
 from dwave.cloud.exceptions import ConfigFileError, SolverNotFoundError
+from dwave.cloud.solver import StructuredSolver
+from dwave.cloud.testing.mocks import structured_solver_data
 from dimod import DiscreteQuadraticModel, ExtendedVartype, SampleSet
 from dwave.samplers import SteepestDescentSolver
 
@@ -123,6 +129,106 @@ class TestMockDWaveSampler(unittest.TestCase):
         ss = sampler.sample(bqm)
         np.testing.assert_array_equal(ss.record[0].sample, ground_state)
 
+    def test_cache_ground_states(self):
+        sampler = MockDWaveSampler(cache_ground_states=True)
+        bqm = dimod.generators.ran_r(1, dimod.to_networkx_graph(
+            dimod.BQM({}, dict.fromkeys(sampler.edgelist[:10], 1), 0, 'SPIN')), seed=3)
+        ground_state = dimod.ExactSolver().sample(bqm).first
+
+        with mock.patch('dimod.ExactSolver', wraps=dimod.ExactSolver) as exact_solver:
+            for _ in range(3):
+                ss = sampler.sample(bqm)
+                self.assertEqual(ss.first.energy, ground_state.energy)
+
+        exact_solver.assert_called_once()
+        self.assertEqual(len(sampler.ground_states), 1)
+
+    def test_latency(self):
+        sampler = MockDWaveSampler(latency=.05)
+
+        t0 = time.perf_counter()
+        sampler.sample_ising({sampler.nodelist[0]: -1}, {}).resolve()
+        self.assertGreaterEqual(time.perf_counter() - t0, .05)
+
+    def test_timing_model(self):
+        # the reported access time follows the cloud-client's estimate
+        sampler = MockDWaveSampler(parameter_warnings=False)
+        bqm = dimod.BQM.from_ising({v: 1 for v in sampler.nodelist[:50]}, {})
+        solver = StructuredSolver(client=None, data=structured_solver_data(
+            qubits=sampler.nodelist, couplers=sampler.edgelist,
+            properties=dict(sampler.properties)))
+
+        for params in [dict(),
+                       dict(num_reads=100, annealing_time=100),
+                       dict(num_reads=10, anneal_schedule=[[0, 1], [5, .5], [10, 1]],
+                            reinitialize_state=False),
+                       dict(num_reads=7, reduce_intersample_correlation=True,
+                            readout_thermalization=10, programming_thermalization=500)]:
+            with self.subTest(params=params):
+                if 'anneal_schedule' in params:
+                    initial_state = dict.fromkeys(bqm.variables, 1)
+                    ss = sampler.sample(bqm, initial_state=initial_state, **params)
+                    params.update(initial_state=list(initial_state.items()))
+                else:
+                    ss = sampler.sample(bqm, **params)
+
+                estimate = solver.estimate_qpu_access_time(50, **params)
+                self.assertAlmostEqual(ss.info['timing']['qpu_access_time'], estimate)
+
+                # and is consistent with the reported breakdown
+                timing = ss.info['timing']
+                per_sample = sum(timing[f'qpu_{t}_time_per_sample']
+                                 for t in ('anneal', 'readout', 'delay'))
+                self.assertAlmostEqual(timing['qpu_sampling_time'],
+                                       params.get('num_reads', 1) * per_sample)
+                self.assertAlmostEqual(timing['qpu_access_time'],
+                                       timing['qpu_sampling_time'] + timing['qpu_programming_time'])
+
+    def test_concurrency(self):
+        bqm = dimod.BQM.from_ising({0: -1}, {})
+
+        with MockDWaveSampler(concurrency=2, time_scale=1) as sampler:
+            samplesets = [sampler.sample(bqm) for _ in range(4)]
+
+            for ss in samplesets:
+                self.assertEqual(ss.first.sample, {0: 1})
+                self.assertIn('wait', ss.info['timing_client'])
+
+        self.assertTrue(all(ss.done() for ss in samplesets))
+
+    def test_queue(self):
+        bqm = dimod.BQM.from_ising({0: -1}, {})
+
+        class GatedSampler(dimod.Sampler):
+            """Counts the problems sampled at once, and holds them until opened."""
+            parameters = {'num_reads': []}
+            properties = {}
+
+            def __init__(self):
+                self.gate = threading.Event()
+                self.lock = threading.Lock()
+                self.running = self.max_running = 0
+
+            def sample(self, bqm, **kwargs):
+                with self.lock:
+                    self.running += 1
+                    self.max_running = max(self.max_running, self.running)
+                self.gate.wait()
+                with self.lock:
+                    self.running -= 1
+                return dimod.SampleSet.from_samples_bqm({0: 1}, bqm)
+
+        # one problem at a time, with the rest queued
+        substitute = GatedSampler()
+        with MockDWaveSampler(concurrency=1, substitute_sampler=substitute) as sampler:
+            samplesets = [sampler.sample(bqm) for _ in range(3)]
+            self.assertFalse(any(ss.done() for ss in samplesets))
+
+            substitute.gate.set()
+            for ss in samplesets:
+                self.assertEqual(ss.first.sample, {0: 1})
+            self.assertEqual(substitute.max_running, 1)
+
     def test_empty_bqm(self):
         sampler = MockDWaveSampler()
         bqm = dimod.BQM('SPIN')
@@ -222,6 +328,34 @@ class TestMockDWaveSampler(unittest.TestCase):
         self.assertTrue(len(sampler.nodelist)==4)
         self.assertTrue(len(sampler.edgelist)==1)
 
+    def test_yield_arguments_at_scale(self):
+        # about 1% of defects on a full-size Zephyr lattice
+        G = dnx.zephyr_graph(6, 4)
+        rng = np.random.default_rng(42)
+        nodes = sorted(G.nodes)
+        edges = sorted(G.edges)
+        broken_nodes = [nodes[i] for i in rng.choice(len(nodes), 12, replace=False)]
+        broken_edges = [edges[i][::-1] for i in rng.choice(len(edges), 100, replace=False)]
+
+        sampler = MockDWaveSampler(topology_type='zephyr',
+                                   topology_shape=[6, 4],
+                                   broken_nodes=broken_nodes,
+                                   broken_edges=broken_edges)
+
+        G.remove_nodes_from(broken_nodes)
+        G.remove_edges_from(broken_edges)
+        self.assertEqual(sampler.nodelist, sorted(G.nodes))
+        self.assertEqual(sampler.edgelist, sorted(tuple(sorted(e)) for e in G.edges))
+        self.assertEqual(sampler.properties['num_qubits'], len(nodes))
+
+        # the defect-free lattice is shared but not modified
+        sampler = MockDWaveSampler(topology_type='zephyr', topology_shape=[6, 4])
+        self.assertEqual(sampler.nodelist, nodes)
+        self.assertEqual(len(sampler.edgelist), len(edges))
+        sampler.nodelist.pop()
+        self.assertEqual(MockDWaveSampler(topology_type='zephyr',
+                                          topology_shape=[6, 4]).nodelist, nodes)
+
     def test_custom_substitute_sampler(self):
         """Test that MockDWaveSampler uses the provided custom substitute_sampler."""
 
@@ -309,6 +443,59 @@ class TestMockDWaveSampler(unittest.TestCase):
         self.assertEqual(ss.first.energy, bqm.energy(expected_sample))
 
 
+class TestLoadTestSampler(unittest.TestCase):
+    def test_instantiation(self):
+        dit.assert_sampler_api(LoadTestSampler())
+
+    def test_samples(self):
+        bqm = dimod.generators.ran_r(1, 20, seed=5)
+
+        for vartype in (dimod.SPIN, dimod.BINARY):
+            for greedy in (True, False):
+                with self.subTest(vartype=vartype, greedy=greedy):
+                    model = bqm.change_vartype(vartype, inplace=False)
+                    ss = LoadTestSampler(greedy=greedy).sample(model, num_reads=50)
+                    dit.assert_sampleset_energies(ss, model)
+                    self.assertIs(ss.vartype, vartype)
+                    self.assertEqual(len(ss), 50)
+
+    def test_seed(self):
+        bqm = dimod.generators.ran_r(1, 20, seed=5)
+
+        ss0 = LoadTestSampler(seed=7).sample(bqm, num_reads=10)
+        ss1 = LoadTestSampler(seed=7).sample(bqm, num_reads=10)
+        np.testing.assert_array_equal(ss0.record.sample, ss1.record.sample)
+
+    def test_greedy_linear(self):
+        # without interactions a single greedy sweep finds the ground state
+        bqm = dimod.BQM.from_ising({'a': 1, 'b': -2, 'c': 0.5}, {})
+        ss = LoadTestSampler().sample(bqm, num_reads=20)
+
+        self.assertTrue(all(sample == {'a': -1, 'b': 1, 'c': -1} for sample in ss.samples()))
+
+        # integer labels that are not in sorted order
+        bqm = dimod.BQM('SPIN')
+        for v, bias in [(2, 1), (0, -2), (1, 0.5)]:
+            bqm.add_variable(v, bias)
+        ss = LoadTestSampler().sample(bqm, num_reads=20)
+
+        self.assertTrue(all(sample == {2: -1, 0: 1, 1: -1} for sample in ss.samples()))
+
+    def test_empty_bqm(self):
+        ss = LoadTestSampler().sample(dimod.BQM('BINARY'), num_reads=3)
+        self.assertEqual(ss.record.sample.shape, (3, 0))
+
+    def test_mock_substitute(self):
+        sampler = MockDWaveSampler(substitute_sampler=LoadTestSampler(seed=1),
+                                   parameter_warnings=False)
+        bqm = dimod.BQM.from_ising({v: 1 for v in sampler.nodelist},
+                                   {e: -1 for e in sampler.edgelist})
+
+        ss = sampler.sample(bqm, num_reads=100, answer_mode='raw', annealing_time=5)
+        self.assertEqual(len(ss), 100)
+        dit.assert_sampleset_energies(ss, bqm)
+
+
 class TestMockLeapHybridDQMSampler(unittest.TestCase):
     def test_sampler(self):
         sampler = MockLeapHybridDQMSampler()
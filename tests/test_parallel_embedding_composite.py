@@ -113,6 +113,28 @@ class TestParallelEmbeddings(unittest.TestCase):
             self.assertTrue(np.all(ss.record.energy == -1.75))
             self.assertTrue(np.all(ss.record.sample == -1))
 
+    def test_inferred_edgelist(self):
+        mock_sampler = MockDWaveSampler(topology_type="chimera", topology_shape=[2, 2, 4])
+
+        # a 4-cycle per unit cell, with keys in different orders
+        embeddings = [
+            {"a": (8*c,), "b": (8*c + 4,), "c": (8*c + 1,), "d": (8*c + 5,)}
+            if c % 2 else
+            {"d": (8*c + 5,), "c": (8*c + 1,), "b": (8*c + 4,), "a": (8*c,)}
+            for c in range(3)
+        ]
+        sampler = ParallelEmbeddingComposite(mock_sampler, embeddings=embeddings)
+
+        self.assertEqual(set(map(frozenset, sampler.edgelist)),
+                         {frozenset("ab"), frozenset("ad"), frozenset("bc"), frozenset("cd")})
+
+        # edges missing from a single embedding are not supported
+        embeddings[0] = dict(embeddings[0], d=(29,))  # in the unused diagonal cell
+        sampler = ParallelEmbeddingComposite(mock_sampler, embeddings=embeddings)
+
+        self.assertEqual(set(map(frozenset, sampler.edgelist)),
+                         {frozenset("ab"), frozenset("bc")})
+
     def test_composite_propagation(self):
         # Propagation fails for TilingComposite but succeeds here.
         # When using find_sublattice_embedding it is necessayr to specify
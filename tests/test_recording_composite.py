@@ -0,0 +1,165 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import tempfile
+import time
+import unittest
+
+import dimod
+import dimod.testing as dtest
+import numpy as np
+
+from dwave.system import FixedEmbeddingComposite, Recording, RecordingComposite
+from dwave.system.testing import MockDWaveSampler, ReplaySampler
+from dwave.system.warnings import ChainStrengthWarning, WarningAction, WarningHandler
+
+
+class WarningSampler(MockDWaveSampler):
+    """Mock sampler that saves a warning in the info of its sample sets."""
+
+    def sample(self, bqm, **parameters):
+        handler = WarningHandler(WarningAction.SAVE)
+        handler.issue("a warning", category=ChainStrengthWarning, data=dict(qubit=0))
+
+        def hook(sampleset):
+            sampleset.info['warnings'] = handler.saved
+            return sampleset
+
+        return dimod.SampleSet.from_future(super().sample(bqm, **parameters), hook)
+
+
+class TestRecordingComposite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_instantiation(self):
+        sampler = RecordingComposite(MockDWaveSampler(),
+                                     os.path.join(self.tmpdir.name, 'store.jsonl'))
+
+        dtest.assert_sampler_api(sampler)
+        dtest.assert_composite_api(sampler)
+        dtest.assert_structured_api(sampler)
+
+    def test_record_and_replay(self):
+        bqm = dimod.generators.ran_r(1, 4, seed=1)
+        embedding = {v: [v, v + 4] for v in bqm.variables}  # a chimera unit cell
+        parameters = dict(num_reads=10, answer_mode='raw',
+                          anneal_offsets=np.zeros(128))
+
+        for name in ('store.jsonl', 'store.jsonl.gz'):
+            with self.subTest(name):
+                path = os.path.join(self.tmpdir.name, name)
+                child = MockDWaveSampler(parameter_warnings=False)
+                sampler = FixedEmbeddingComposite(RecordingComposite(child, path),
+                                                  embedding)
+                recorded = [sampler.sample(bqm, **parameters) for _ in range(2)]
+                for sampleset in recorded:
+                    sampleset.resolve()  # responses are recorded when resolved
+
+                replay = ReplaySampler(path)
+                self.assertEqual(replay.nodelist, child.nodelist)
+                self.assertEqual(replay.edgelist, child.edgelist)
+                self.assertEqual(replay.properties['qubits'], child.properties['qubits'])
+                self.assertEqual(replay.parameters, child.parameters)
+
+                # recorded responses are replayed in turn
+                sampler = FixedEmbeddingComposite(replay, embedding)
+                for sampleset in recorded + recorded[:1]:
+                    replayed = sampler.sample(bqm, **parameters)
+                    np.testing.assert_array_equal(replayed.record.sample,
+                                                  sampleset.record.sample)
+                    np.testing.assert_array_equal(replayed.record.energy,
+                                                  sampleset.record.energy)
+
+    def test_integer_keys(self):
+        # JSON stores the keys of initial states as strings, which sort
+        # differently from multi-digit integers
+        path = os.path.join(self.tmpdir.name, 'store.jsonl')
+        child = MockDWaveSampler(parameter_warnings=False)
+        sampler = RecordingComposite(child, path)
+        bqm = dimod.BQM.from_ising({}, {(4, 12): -1})
+        parameters = dict(initial_state={4: 1, 12: -1},
+                          anneal_schedule=[[0, 1], [1, .5], [2, 1]])
+        sampleset = sampler.sample(bqm, **parameters)
+        sampleset.resolve()
+
+        recording = Recording(path)
+        self.assertEqual(len(recording.responses[Recording.key(bqm, parameters)]), 1)
+
+        replayed = ReplaySampler(path).sample(bqm, **parameters)
+        np.testing.assert_array_equal(replayed.record.sample, sampleset.record.sample)
+
+    def test_unrecorded(self):
+        path = os.path.join(self.tmpdir.name, 'store.jsonl')
+        sampler = RecordingComposite(MockDWaveSampler(), path)
+        h = {sampler.nodelist[0]: -1}
+        sampler.sample_ising(h, {}, num_reads=5).resolve()
+        sampler.sample_ising(h, {}, num_reads=5)  # never resolved, so not recorded
+
+        replay = ReplaySampler(path)
+        replay.sample_ising(h, {}, num_reads=5).resolve()
+        with self.assertRaises(ValueError):
+            replay.sample_ising(h, {}, num_reads=6)
+        with self.assertRaises(ValueError):
+            replay.sample_ising({sampler.nodelist[0]: 1}, {}, num_reads=5)
+
+    def test_append(self):
+        path = os.path.join(self.tmpdir.name, 'store.jsonl')
+        h = {0: 1}
+        for num_reads in (1, 2):
+            sampler = RecordingComposite(MockDWaveSampler(), path)
+            sampler.sample_ising(h, {}, num_reads=num_reads).resolve()
+
+        replay = ReplaySampler(path)
+        self.assertEqual(replay.sample_ising(h, {}, num_reads=1).record.num_occurrences.sum(), 1)
+        self.assertEqual(replay.sample_ising(h, {}, num_reads=2).record.num_occurrences.sum(), 2)
+
+    def test_saved_warnings(self):
+        path = os.path.join(self.tmpdir.name, 'store.jsonl')
+        sampler = RecordingComposite(WarningSampler(), path)
+        sampleset = sampler.sample_ising({0: 1}, {})
+        self.assertIs(sampleset.info['warnings'][0]['type'], ChainStrengthWarning)
+
+        replayed = ReplaySampler(path).sample_ising({0: 1}, {})
+        self.assertEqual(replayed.info['warnings'][0]['type'],
+                         'dwave.system.warnings.ChainStrengthWarning')
+
+    def test_unrecordable(self):
+        sampler = RecordingComposite(MockDWaveSampler(),
+                                     os.path.join(self.tmpdir.name, 'store.jsonl'))
+        sampler.path = os.path.join(self.tmpdir.name, 'missing', 'store.jsonl')
+
+        with self.assertLogs('dwave.system.composites.recording', 'ERROR'):
+            sampleset = sampler.sample_ising({0: 1}, {})
+            self.assertEqual(len(sampleset), 1)
+
+    def test_timing(self):
+        path = os.path.join(self.tmpdir.name, 'store.jsonl')
+        sampler = RecordingComposite(MockDWaveSampler(latency=.05), path)
+        sampleset = sampler.sample_ising({0: 1}, {})
+        self.assertIn('recording', sampleset.info['timing_client'])
+
+        replay = ReplaySampler(path)
+        replayed = replay.sample_ising({0: 1}, {})
+        self.assertEqual(replayed.info['timing'], sampleset.info['timing'])
+        self.assertNotIn('recording', replayed.info['timing_client'])
+
+        replay = ReplaySampler(path, latency=True)
+        t0 = time.perf_counter()
+        replayed = replay.sample_ising({0: 1}, {})
+        self.assertLess(time.perf_counter() - t0, .05)
+        replayed.resolve()
+        self.assertGreaterEqual(time.perf_counter() - t0, .05)
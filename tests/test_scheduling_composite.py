@@ -0,0 +1,149 @@
+# Copyright 2026 D-Wave
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import threading
+import time
+import unittest
+
+import dimod
+import dimod.testing as dtest
+
+from dwave.system import SchedulingComposite
+from dwave.system.testing import MockDWaveSampler
+
+
+class GatedSampler(dimod.Sampler):
+    """Sampler whose sample sets resolve once the gate is open."""
+
+    parameters = {'label': []}
+    properties = {}
+
+    def __init__(self):
+        self.submitted = []
+        self.gate = threading.Event()
+
+    def sample(self, bqm, label=None):
+        self.submitted.append(label)
+
+        def hook(_):
+            self.gate.wait()
+            if label == 'fail':
+                raise RuntimeError(label)
+            return dimod.ExactSolver().sample(bqm)
+
+        return dimod.SampleSet.from_future(None, hook)
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(.001)
+
+
+class TestSchedulingComposite(unittest.TestCase):
+    def setUp(self):
+        self.bqm = dimod.BQM({'a': 1}, {}, 0, 'SPIN')
+
+    def test_instantiation(self):
+        with SchedulingComposite(MockDWaveSampler()) as sampler:
+            dtest.assert_sampler_api(sampler)
+            dtest.assert_composite_api(sampler)
+            dtest.assert_structured_api(sampler)
+
+            self.assertIn('priority', sampler.parameters)
+            self.assertIn('tenant', sampler.parameters)
+
+    def test_sample(self):
+        child = MockDWaveSampler()
+        with SchedulingComposite(child) as sampler:
+            h = {child.nodelist[0]: 1}
+            sampleset = sampler.sample_ising(h, {}, num_reads=5)
+            self.assertEqual(sampleset.record.num_occurrences.sum(), 5)
+            self.assertIn('queue', sampleset.info['timing_client'])
+
+    def test_limits(self):
+        child = GatedSampler()
+        with SchedulingComposite(child, max_in_flight=3,
+                                 tenant_limits={'batch': 1}) as sampler:
+            samplesets = [sampler.sample(self.bqm, tenant='batch') for _ in range(3)]
+            samplesets += [sampler.sample(self.bqm) for _ in range(3)]
+
+            wait_until(lambda: sampler.metrics()['in_flight'] == 3)
+            self.assertEqual(sampler.metrics(),
+                             dict(queued=3, in_flight=3,
+                                  in_flight_by_tenant={'batch': 1, None: 2},
+                                  submitted=3, completed=0))
+
+            child.gate.set()
+            for sampleset in samplesets:
+                sampleset.resolve()
+
+            self.assertEqual(sampler.metrics()['completed'], 6)
+
+    def test_priority(self):
+        child = GatedSampler()
+        with SchedulingComposite(child, max_in_flight=1) as sampler:
+            samplesets = [sampler.sample(self.bqm, label='first')]
+            wait_until(lambda: child.submitted)
+
+            for priority in range(3):
+                samplesets.append(sampler.sample(self.bqm, label=priority, priority=priority))
+
+            child.gate.set()
+
+        self.assertEqual(child.submitted, ['first', 2, 1, 0])
+
+    def test_priority_window(self):
+        child = GatedSampler()
+        child.gate.set()
+        with SchedulingComposite(child, max_in_flight=1, priority_window=.1) as sampler:
+            for priority in range(3):
+                sampler.sample(self.bqm, label=priority, priority=priority)
+
+        self.assertEqual(child.submitted, [2, 1, 0])
+
+    def test_invalid_limits(self):
+        for kwargs in [dict(max_in_flight=0), dict(tenant_limits={'batch': 0})]:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    SchedulingComposite(GatedSampler(), **kwargs)
+
+    def test_backpressure(self):
+        child = GatedSampler()
+        with SchedulingComposite(child, max_in_flight=1, max_queue_size=1) as sampler:
+            sampler.sample(self.bqm)
+            wait_until(lambda: child.submitted)
+            sampler.sample(self.bqm)  # queued
+
+            thread = threading.Thread(target=sampler.sample, args=(self.bqm,))
+            thread.start()
+            thread.join(.05)
+            self.assertTrue(thread.is_alive())  # blocked on the full queue
+
+            child.gate.set()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_exception(self):
+        child = GatedSampler()
+        child.gate.set()
+        with SchedulingComposite(child) as sampler:
+            sampleset = sampler.sample(self.bqm, label='fail')
+            with self.assertRaises(RuntimeError):
+                sampleset.resolve()
+
+        with self.assertRaises(RuntimeError):
+            sampler.sample(self.bqm)
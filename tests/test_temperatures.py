@@ -13,27 +13,53 @@
 #    limitations under the License.
 
 import unittest
+import unittest.mock
 import numpy as np
 import dimod
 import warnings
 from itertools import product
 
+import dwave.system.temperatures as temperatures
 from dwave.system.temperatures import (
     maximum_pseudolikelihood,
     maximum_pseudolikelihood_temperature,
     effective_field,
     freezeout_effective_temperature,
     fast_effective_temperature,
+    fast_effective_temperature_map,
     Ip_in_units_of_B,
     h_to_fluxbias,
     fluxbias_to_h,
     background_susceptibility_ising,
     background_susceptibility_bqm,
+    TemperatureAccumulator,
 )
 
 from dwave.system.testing import MockDWaveSampler
 
 
+class IndependentSpinSampler(dimod.Sampler, dimod.Structured):
+    """Samples single-qubit problems from Boltzmann distributions, at a
+    temperature for each qubit."""
+
+    parameters = {'num_reads': [], 'auto_scale': []}
+    properties = {}
+    nodelist = None
+    edgelist = []
+
+    def __init__(self, temperatures, seed=0):
+        self.nodelist = list(temperatures)
+        self.temperatures = temperatures
+        self.seed = seed
+
+    def sample(self, bqm, num_reads=1, auto_scale=None):
+        prng = np.random.default_rng(self.seed)
+        h = np.array([bqm.linear[v] for v in bqm.variables])
+        T = np.array([self.temperatures[v] for v in bqm.variables])
+        up = prng.random((num_reads, len(h))) < 1 / (1 + np.exp(2 * h / T))
+        return dimod.SampleSet.from_samples_bqm((np.where(up, 1, -1), bqm.variables), bqm)
+
+
 class TestTemperatures(unittest.TestCase):
     def test_Ip_in_units_of_B(self):
         uBs = ["J", "GHz"]
@@ -86,6 +112,36 @@ class TestTemperatures(unittest.TestCase):
         self.assertTrue(bqm.vartype == dimod.BINARY)
         self.assertTrue(np.array_equal(E_ising[0], E_bqm[0]))
 
+    def test_effective_field_chunks(self):
+        # Compare against the definition for a random sparse model, with
+        # samples processed in chunks of various sizes
+        prng = np.random.default_rng(1)
+        num_var = 20
+        bqm = dimod.generators.gnp_random_bqm(num_var, 0.3, "SPIN", random_state=1)
+        samples = prng.choice([-1, 1], size=(7, num_var)).astype(np.int8)
+        labels = list(bqm.variables)
+
+        h, J = bqm.to_numpy_vectors(variable_order=labels)[:2]
+        expected = np.tile(h, (len(samples), 1))
+        for u, v, bias in zip(*J):
+            expected[:, u] += bias * samples[:, v]
+            expected[:, v] += bias * samples[:, u]
+
+        for chunk_size in [None, 1, 3, 10]:
+            E, E_labels = effective_field(bqm, (samples, labels), chunk_size=chunk_size)
+            np.testing.assert_allclose(E, expected)
+            self.assertEqual(E.dtype, np.float64)
+            self.assertEqual(E_labels, labels)
+
+            E, _ = effective_field(bqm, (samples, labels), current_state_energy=True,
+                                   chunk_size=chunk_size, dtype=np.float32)
+            np.testing.assert_allclose(E, 2 * samples * expected, rtol=1e-5)
+            self.assertEqual(E.dtype, np.float32)
+
+        self.assertEqual(effective_field(bqm, (samples[:0], labels))[0].shape, (0, num_var))
+        with self.assertRaises(ValueError):
+            effective_field(bqm, (samples, labels), chunk_size=0)
+
     def test_background_susceptibility(self):
         # A Hamiltonian with + + + and - - - as ground states.
         # Symmetry is broken
@@ -110,6 +166,49 @@ class TestTemperatures(unittest.TestCase):
         bqmPdbqm = bqm + chi * dbqm
         self.assertEqual(bqmPdbqm, background_susceptibility_bqm(bqm, chi=chi))
 
+    def test_background_susceptibility_sparse(self):
+        from scipy import sparse
+
+        # labels that are neither a range nor in sorted order
+        n = 8
+        labels = [5, 0, 7, 2, 6, 1, 4, 3]
+        rng = np.random.default_rng(1)
+        h = rng.normal(size=n)
+        J = np.triu(rng.normal(size=(n, n)) * (rng.random((n, n)) < 0.5), 1)
+        J = J + J.T
+        dh, dJ, k = background_susceptibility_ising(h, J)
+
+        hd = {labels[i]: h[i] for i in range(n)}
+        Jd = {(labels[i], labels[j]): J[i, j]
+              for i in range(n) for j in range(i + 1, n) if J[i, j]}
+        dh_dict, dJ_dict, _ = background_susceptibility_ising(hd, Jd)
+        for i in range(n):
+            self.assertAlmostEqual(dh_dict[labels[i]], dh[i])
+        for i in range(n):
+            for j in range(i + 1, n):
+                Jij = dJ_dict.get((labels[i], labels[j]),
+                                  dJ_dict.get((labels[j], labels[i]), 0))
+                self.assertAlmostEqual(Jij, dJ[i, j])
+
+        # sparse J returns the array forms
+        dh_sparse, dJ_sparse, k_sparse = background_susceptibility_ising(
+            h, sparse.csr_matrix(J))
+        np.testing.assert_allclose(dh_sparse, dh)
+        np.testing.assert_allclose(dJ_sparse.toarray(), dJ)
+        self.assertAlmostEqual(k_sparse, k)
+
+        bqm = dimod.BQM.from_ising(hd, Jd)
+        dbqm = background_susceptibility_bqm(bqm)
+        self.assertEqual(list(dbqm.variables), list(bqm.variables))
+        dimod.testing.assert_bqm_almost_equal(dbqm, dimod.BQM.from_ising(dh_dict, dJ_dict))
+
+        # the correction is in the vartype of the given model
+        chi = -0.01
+        binary = background_susceptibility_bqm(bqm.binary, chi=chi)
+        self.assertIs(binary.vartype, dimod.BINARY)
+        expected = background_susceptibility_bqm(bqm, chi=chi)
+        dimod.testing.assert_bqm_almost_equal(binary.spin, expected)
+
     def test_maximum_pseudolikelihood_bqms(self):
         """Tests for parameters beyond those applicable to maximum_pseudolikelihood_temparature."""
         # h1 s1 + h2 s2 + J12 s1 s2; coefficients to be inferred:
@@ -311,6 +410,59 @@ class TestTemperatures(unittest.TestCase):
             # problems (ExactSolver or SteepestDescentSolver)
             self.assertEqual(T, 0)
 
+    def test_fast_effective_temperature_map(self):
+        qubit_temperatures = {v: 0.5 if v < 50 else 2.0 for v in range(100)}
+        sampler = IndependentSpinSampler(qubit_temperatures)
+        regions = {'cold': list(range(50)), 'hot': list(range(50, 100))}
+
+        T = fast_effective_temperature_map(sampler, h_range=(-1, 1), regions=regions,
+                                           num_reads=1000, seed=1)
+        self.assertEqual(set(T), {'cold', 'hot'})
+        self.assertAlmostEqual(T['cold'][0], 0.5, delta=0.05)
+        self.assertAlmostEqual(T['hot'][0], 2.0, delta=0.2)
+        self.assertEqual(T['cold'][1], 0)
+
+        # a single region matches fast_effective_temperature
+        T_all = fast_effective_temperature_map(sampler, h_range=(-1, 1),
+                                               regions={'all': sampler.nodelist},
+                                               num_reads=100, seed=2)
+        T_fast, _ = fast_effective_temperature(sampler, h_range=(-1, 1), num_reads=100,
+                                               seed=2, optimize_method=None)
+        self.assertAlmostEqual(T_all['all'][0], T_fast)
+
+        # and bootstraps once per read when num_bootstrap_samples is None
+        for num_bootstrap_samples, expected in [(None, 100), (0, 0)]:
+            with self.subTest(num_bootstrap_samples=num_bootstrap_samples):
+                with unittest.mock.patch.object(
+                        temperatures, 'maximum_pseudolikelihood_temperature',
+                        wraps=temperatures.maximum_pseudolikelihood_temperature) as spy:
+                    T_all = fast_effective_temperature_map(
+                        sampler, h_range=(-1, 1), regions={'all': sampler.nodelist},
+                        num_reads=100, seed=2, num_bootstrap_samples=num_bootstrap_samples)
+                    T_fast = fast_effective_temperature(
+                        sampler, h_range=(-1, 1), num_reads=100, seed=2,
+                        optimize_method=None, num_bootstrap_samples=num_bootstrap_samples)
+                self.assertAlmostEqual(T_all['all'][0], T_fast[0])
+                self.assertEqual(T_all['all'][1] > 0, T_fast[1] > 0)
+                self.assertEqual(T_all['all'][1] > 0, expected > 0)
+                self.assertEqual(
+                    [c.kwargs['num_bootstrap_samples'] for c in spy.call_args_list],
+                    [expected] * (2 if expected else 1))
+
+        # regions for each h_range are drawn from the nodelist
+        T = fast_effective_temperature_map(
+            IndependentSpinSampler(dict.fromkeys(range(100), 1.0)),
+            h_range={'narrow': (-0.5, 0.5), 'wide': (-2, 2)},
+            num_reads=500, seed=3, num_bootstrap_samples=10)
+        for key in ('narrow', 'wide'):
+            self.assertAlmostEqual(T[key][0], 1.0, delta=0.15)
+            self.assertGreater(T[key][1], 0)
+
+        with self.assertRaises(ValueError):
+            fast_effective_temperature_map(sampler, regions={0: [0, 1], 1: [1, 2]})
+        with self.assertRaises(ValueError):
+            fast_effective_temperature_map(sampler)
+
     def test_bootstrap_errors(self):
         en1 = np.array([2] * 25 + [-2] * 75)
         num_bootstrap_samples = 100
@@ -324,6 +476,120 @@ class TestTemperatures(unittest.TestCase):
         # are finite and will throw no warnings.
         self.assertTrue(len(Tb) == num_bootstrap_samples)
 
+    def test_multi_parameter_jacobian(self):
+        # Roots agree with and without the jacobian
+        prng = np.random.default_rng(2)
+        en1 = prng.choice([-2, -1, 1], p=[0.5, 0.4, 0.1], size=(1, 200, 10)).astype(float)
+        en1 = np.concatenate([en1, prng.normal(size=(3, 200, 10))])
+
+        x, _ = maximum_pseudolikelihood(en1=en1, degenerate_fields=False)
+        x_nojac, _ = maximum_pseudolikelihood(
+            en1=en1, degenerate_fields=False, use_jacobian=False
+        )
+        np.testing.assert_allclose(x, x_nojac, rtol=1e-6, atol=1e-9)
+
+    def test_bootstrap_reproducibility(self):
+        prng = np.random.default_rng(0)
+        en1 = prng.choice([-2, -1, 1, 2], p=[0.4, 0.4, 0.15, 0.05], size=(40, 5))
+        num_bootstrap_samples = 10
+
+        # For a single bqm, bootstraps are estimated together; each matches
+        # the estimate for its resample
+        x, x_bs = maximum_pseudolikelihood(
+            en1=en1, num_bootstrap_samples=num_bootstrap_samples, seed=1
+        )
+        seeds = np.random.SeedSequence(1).spawn(num_bootstrap_samples)
+        for seed_sequence, x_b in zip(seeds, x_bs):
+            indices = np.random.default_rng(seed_sequence).integers(40, size=40)
+            x_expected, _ = maximum_pseudolikelihood(en1=en1[indices], x0=x)
+            self.assertAlmostEqual(x_b, x_expected)
+
+        # optimization arguments are honoured by the bootstraps
+        for kwargs_opt, batched in [({'xtol': 1e-12, 'maxiter': 100}, True),
+                                    ({'bracket': (-10, -1e-3)}, False)]:
+            with self.subTest(kwargs_opt=kwargs_opt):
+                with unittest.mock.patch.object(
+                        temperatures, '_batched_bootstrap_pseudo_likelihood',
+                        wraps=temperatures._batched_bootstrap_pseudo_likelihood) as spy:
+                    x, x_bs = maximum_pseudolikelihood(
+                        en1=en1, num_bootstrap_samples=num_bootstrap_samples, seed=1,
+                        kwargs_opt=dict(kwargs_opt))
+                self.assertEqual(spy.called, batched)
+                if batched:
+                    self.assertEqual(spy.call_args.kwargs, dict(tol=1e-12, maxiter=100))
+                for seed_sequence, x_b in zip(seeds, x_bs):
+                    indices = np.random.default_rng(seed_sequence).integers(40, size=40)
+                    x_expected, _ = maximum_pseudolikelihood(
+                        en1=en1[indices], x0=x, kwargs_opt=dict(kwargs_opt))
+                    self.assertAlmostEqual(x_b, x_expected)
+
+        # resamples of local minima only
+        en1 = np.array([[-1]] * 39 + [[1]])
+        _, x_bs = maximum_pseudolikelihood(en1=en1, num_bootstrap_samples=50, seed=1)
+        self.assertIn(-np.inf, x_bs)
+        self.assertTrue(np.all(np.isfinite(x_bs) | (x_bs == -np.inf)))
+
+        # For multiple bqms, results do not depend on the number of processes
+        en1 = np.stack([prng.choice([-2, -1, 1], size=(30, 4)),
+                        prng.normal(size=(30, 4))])
+        results = [
+            maximum_pseudolikelihood(en1=en1, num_bootstrap_samples=4, seed=2,
+                                     degenerate_fields=False, max_workers=max_workers)
+            for max_workers in [None, 2]
+        ]
+        np.testing.assert_array_equal(results[0][1], results[1][1])
+        self.assertEqual(results[0][1].shape, (4, 2))
+
+    def test_temperature_accumulator(self):
+        # Boltzmann samples at temperature 2
+        bqm = dimod.generators.ran_r(1, 10, seed=3)
+        states = dimod.ExactSolver().sample(bqm).record
+        p = np.exp(-(states.energy - states.energy.min()) / 2)
+        prng = np.random.default_rng(3)
+        batches = [dimod.SampleSet.from_samples_bqm(
+            states.sample[prng.choice(len(p), size=20, p=p / p.sum())], bqm).aggregate()
+            for _ in range(3)]
+
+        accumulator = TemperatureAccumulator(bqm)
+        with self.assertRaises(ValueError):
+            accumulator.temperature()
+        for sampleset in batches:
+            accumulator.update(sampleset)
+        self.assertEqual(accumulator.num_samples, 60)
+
+        # matches the estimate for all samples at once
+        samples = np.concatenate([ss.record.sample for ss in batches])
+        weights = np.concatenate([ss.record.num_occurrences for ss in batches])
+        T, _ = maximum_pseudolikelihood_temperature(
+            bqm, (samples, bqm.variables), sample_weights=weights)
+        self.assertAlmostEqual(accumulator.temperature(), T)
+
+        low, high = accumulator.confidence_interval()
+        self.assertLess(low, T)
+        self.assertLess(T, high)
+        wider = accumulator.confidence_interval(0.99)
+        self.assertLess(wider[0], low)
+        self.assertLess(high, wider[1])
+        self.assertGreater(accumulator.standard_error(), 0)
+
+        # memory is bounded, at a small cost in accuracy
+        binned = TemperatureAccumulator(bqm, max_bins=8)
+        for sampleset in batches:
+            binned.update(sampleset)
+        self.assertLessEqual(len(binned.fields), 8)
+        self.assertAlmostEqual(binned.weights.sum(), accumulator.weights.sum())
+        self.assertAlmostEqual(binned.temperature(), T, delta=0.1 * T)
+
+        # local minima only
+        accumulator = TemperatureAccumulator()
+        ground_state = dimod.ExactSolver().sample(bqm).lowest()
+        accumulator.update(ground_state, bqm=bqm)
+        self.assertEqual(accumulator.temperature(), 0)
+        self.assertEqual(accumulator.confidence_interval(), (0, 0))
+
+        with self.assertRaises(ValueError):
+            TemperatureAccumulator().update(ground_state)
+
     def test_sample_weights(self):
         n = 3
         bqm = dimod.BinaryQuadraticModel("BINARY").from_qubo(
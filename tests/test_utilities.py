@@ -12,7 +12,10 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import gzip
+import io
 import os
+import warnings
 import unittest
 
 import numpy as np
@@ -21,8 +24,10 @@ import dwave_networkx as dnx
 
 from dwave.cloud.testing import isolated_environ
 
-from dwave.system import (anneal_schedule_with_offset, common_working_graph,
-    energy_scales_custom_schedule)
+from dwave.system import (AnnealSchedule, anneal_schedule_with_offset,
+    common_working_graph, compress_file, energy_scales_custom_schedule)
+from dwave.system.temperatures import (fluxbias_to_h, freezeout_effective_temperature,
+    h_to_fluxbias, Ip_in_units_of_B)
 from dwave.system.utilities import FeatureFlags
 
 
@@ -210,6 +215,19 @@ class TestAnnealScheduleWithOffset(unittest.TestCase):
                 )
 
 
+    def test_irregular_schedules(self):
+        # the schedule's s spacing matters only for custom schedules
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+
+            np.testing.assert_array_equal(
+                anneal_schedule_with_offset(0.1, [[0.5, 1, 2, 0.5]]),
+                [[0.5, 1, 2, 0.6]])
+
+            schedule = [[0.1, 10, 1, 0.02], [0.1, 10, 1, 0.02], [0.2, 6, 3, 0.25]]
+            self.assertEqual(anneal_schedule_with_offset(0, schedule).shape, (3, 4))
+
+
 class TestEnergyScalesCustomSchedule(unittest.TestCase):
 
     schedule_default = [
@@ -373,4 +391,92 @@ class TestEnergyScalesCustomSchedule(unittest.TestCase):
             default_schedule=self.schedule_default,
             custom_schedule=schedule)
         np.testing.assert_allclose(out[:,0], t_expected, atol=1)
-        np.testing.assert_allclose(out[:,3], B_expected, atol=1)
\ No newline at end of file
+        np.testing.assert_allclose(out[:,3], B_expected, atol=1)
+
+
+class TestAnnealSchedule(unittest.TestCase):
+
+    schedule_default = TestEnergyScalesCustomSchedule.schedule_default
+
+    def test_construction(self):
+        schedule = AnnealSchedule(self.schedule_default)
+        columns = np.asarray(self.schedule_default).T
+        for name, column in zip('sABc', columns):
+            np.testing.assert_array_equal(getattr(schedule, name), column)
+
+        schedule = AnnealSchedule(s=columns[0], A=columns[1], B=columns[2], c=columns[3])
+        np.testing.assert_array_equal(schedule.B, columns[2])
+
+        with self.assertRaises(ValueError):
+            AnnealSchedule(self.schedule_default, s=columns[0])
+        with self.assertRaises(ValueError):
+            AnnealSchedule(s=columns[0], A=columns[1], B=columns[2])
+
+    def test_energy_scales(self):
+        schedule = AnnealSchedule(self.schedule_default)
+
+        A, B = schedule.energy_scales(schedule.s)
+        np.testing.assert_allclose(A, schedule.A)
+        np.testing.assert_allclose(B, schedule.B)
+
+        # offsets broadcast against anneal fractions, and match the offset tables
+        offsets = np.array([-0.05, 0, 0.1])
+        A, B = schedule.energy_scales(schedule.s[:, np.newaxis], offsets)
+        self.assertEqual(A.shape, (len(schedule.s), 3))
+
+        tables = schedule.with_offset(offsets)
+        self.assertEqual(tables.shape, (3, len(schedule.s), 4))
+        for k, offset in enumerate(offsets):
+            table = anneal_schedule_with_offset(offset, self.schedule_default)
+            np.testing.assert_array_equal(tables[k], table)
+            np.testing.assert_array_equal(schedule.with_offset(offset), table)
+            np.testing.assert_allclose(A[:, k], table[:, 1])
+            np.testing.assert_allclose(B[:, k], table[:, 2])
+
+    def test_conversions(self):
+        schedule = AnnealSchedule(self.schedule_default, MAFM=1.647)
+        s = np.array([0.3, 0.55, 0.612])
+        _, B = schedule.energy_scales(s)
+
+        np.testing.assert_allclose(schedule.persistent_current(s),
+                                   Ip_in_units_of_B(B=B, MAFM=1.647))
+
+        h = np.array([0.1, -0.2, 0.3])
+        fluxbias = schedule.h_to_fluxbias(h, s)
+        np.testing.assert_allclose(fluxbias, h_to_fluxbias(h, B=B, MAFM=1.647))
+        np.testing.assert_allclose(schedule.fluxbias_to_h(fluxbias, s), h)
+        np.testing.assert_allclose(schedule.fluxbias_to_h(fluxbias, s),
+                                   fluxbias_to_h(fluxbias, B=B, MAFM=1.647))
+
+        np.testing.assert_allclose(schedule.freezeout_effective_temperature(s, 15.4),
+                                   freezeout_effective_temperature(B, 15.4))
+
+        with self.assertRaises(ValueError):
+            AnnealSchedule(self.schedule_default).h_to_fluxbias(h, s)
+
+    def test_custom_energy_scales(self):
+        schedule = AnnealSchedule(self.schedule_default)
+        for custom in ([[0, 0], [20, 0.31], [50, 0.69], [100, 1]],
+                       [[0, 1], [5, 0.45], [99, 0.45], [100, 1]]):
+            custom = np.asarray(custom)
+            np.testing.assert_array_equal(
+                schedule.custom_energy_scales(custom[:, 0], custom[:, 1]),
+                energy_scales_custom_schedule(self.schedule_default, custom_schedule=custom))
+
+
+class TestCompressFile(unittest.TestCase):
+    def test_round_trip(self):
+        data = os.urandom(1000) + bytes(5000)
+
+        compressed = compress_file(io.BytesIO(data), block_size=1024).read()
+        self.assertEqual(gzip.decompress(compressed), data)
+        self.assertLess(len(compressed), len(data))
+
+        # independent of the number of workers
+        for max_workers in [1, 3]:
+            with self.subTest(max_workers=max_workers):
+                f = compress_file(io.BytesIO(data), block_size=1024, max_workers=max_workers)
+                self.assertEqual(f.read(), compressed)
+
+    def test_empty(self):
+        self.assertEqual(gzip.decompress(compress_file(io.BytesIO()).read()), b'')